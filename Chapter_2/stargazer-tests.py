@@ -1,50 +1,56 @@
+import io
+import json
 import unittest
 from unittest.mock import patch, MagicMock
 from stargazers import GitHubAPI
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 class TestGitHubAPI(unittest.TestCase):
     def setUp(self):
         self.token = "test_token"
         self.github = GitHubAPI(self.token)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_repository(self, mock_get):
         mock_response = MagicMock()
-        mock_response.json.return_value = {"id": 1, "name": "Hello-World"}
+        mock_response.content = json.dumps({"id": 1, "name": "Hello-World"}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
 
         repo = self.github.get_repository("octocat", "Hello-World")
         self.assertEqual(repo, {"id": 1, "name": "Hello-World"})
         mock_get.assert_called_once_with(
-            "https://api.github.com/repos/octocat/Hello-World",
-            headers=self.github.headers
+            "https://api.github.com/repos/octocat/Hello-World"
         )
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_issue(self, mock_post):
         mock_response = MagicMock()
-        mock_response.json.return_value = {"id": 1, "title": "New issue"}
+        mock_response.content = json.dumps({"id": 1, "title": "New issue"}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_post.return_value = mock_response
 
         issue = self.github.create_issue("octocat", "Hello-World", "New issue title", "Issue body")
         self.assertEqual(issue, {"id": 1, "title": "New issue"})
-        mock_post.assert_called_once_with(
-            "https://api.github.com/repos/octocat/Hello-World/issues",
-            headers=self.github.headers,
-            json={
-                "title": "New issue title",
-                "body": "Issue body",
-                "assignees": None,
-                "labels": None
-            }
+        mock_post.assert_called_once()
+        self.assertEqual(
+            mock_post.call_args.args,
+            ("https://api.github.com/repos/octocat/Hello-World/issues",)
+        )
+        self.assertEqual(mock_post.call_args.kwargs["headers"], {"Content-Type": "application/json"})
+        self.assertEqual(
+            json.loads(mock_post.call_args.kwargs["data"]),
+            {"title": "New issue title", "body": "Issue body"}
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_list_issues(self, mock_get):
         mock_response = MagicMock()
-        mock_response.json.return_value = [{"id": 1, "title": "Issue 1"}]
+        mock_response.content = json.dumps([{"id": 1, "title": "Issue 1"}]).encode()
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
 
@@ -52,52 +58,162 @@ class TestGitHubAPI(unittest.TestCase):
         self.assertEqual(issues, [{"id": 1, "title": "Issue 1"}])
         mock_get.assert_called_once_with(
             "https://api.github.com/repos/octocat/Hello-World/issues",
-            headers=self.github.headers,
             params={"state": "open"}
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_list_stargazers(self, mock_get):
         mock_response = MagicMock()
-        mock_response.json.return_value = [{"login": "octocat"}]
+        mock_response.content = json.dumps([{"login": "octocat"}]).encode()
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
 
         stargazers = self.github.list_stargazers("octocat", "Hello-World")
         self.assertEqual(stargazers, [{"login": "octocat"}])
         mock_get.assert_called_once_with(
-            "https://api.github.com/repos/octocat/Hello-World/stargazers",
-            headers=self.github.headers
+            "https://api.github.com/repos/octocat/Hello-World/stargazers"
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_list_starred_repositories(self, mock_get):
         mock_response = MagicMock()
-        mock_response.json.return_value = [{"id": 1, "name": "Hello-World"}]
+        mock_response.content = json.dumps([{"id": 1, "name": "Hello-World"}]).encode()
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
 
         starred_repos = self.github.list_starred_repositories("octocat")
         self.assertEqual(starred_repos, [{"id": 1, "name": "Hello-World"}])
         mock_get.assert_called_once_with(
-            "https://api.github.com/users/octocat/starred",
-            headers=self.github.headers
+            "https://api.github.com/users/octocat/starred"
         )
 
-    @patch('requests.get')
-    def test_check_if_starred(self, mock_get):
+    @patch('requests.Session.get')
+    def test_iter_stargazers(self, mock_get):
+        body = json.dumps([{"login": "octocat"}, {"login": "hubot"}]).encode()
         mock_response = MagicMock()
-        mock_response.status_code = 204
+        mock_response.__enter__.return_value = mock_response
+        mock_response.raw = io.BytesIO(body)
+        mock_response.content = body
         mock_get.return_value = mock_response
 
+        stargazers = self.github.iter_stargazers("octocat", "Hello-World")
+        self.assertEqual(next(stargazers), {"login": "octocat"})
+        self.assertEqual(list(stargazers), [{"login": "hubot"}])
+        mock_get.assert_called_once_with(
+            "https://api.github.com/repos/octocat/Hello-World/stargazers",
+            stream=True
+        )
+
+    @unittest.skipIf(httpx is None, "httpx is not installed")
+    def test_list_all_stargazers(self):
+        requested_pages = []
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            requested_pages.append(page)
+            headers = {}
+            if page == 1:
+                headers["Link"] = (
+                    '<https://api.github.com/repositories/1/stargazers?per_page=100&page=2>; rel="next", '
+                    '<https://api.github.com/repositories/1/stargazers?per_page=100&page=3>; rel="last"'
+                )
+            return httpx.Response(200, json=[{"login": f"user{page}"}], headers=headers)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(GitHubAPI, "_async_client", return_value=client):
+            stargazers = self.github.list_all_stargazers("octocat", "Hello-World")
+
+        self.assertEqual(stargazers, [{"login": "user1"}, {"login": "user2"}, {"login": "user3"}])
+        self.assertEqual(sorted(requested_pages), [1, 2, 3])
+
+    @patch('requests.Session.post')
+    def test_list_stargazers_gql(self, mock_post):
+        first_page = MagicMock()
+        first_page.content = json.dumps({"data": {"repository": {"stargazers": {
+            "pageInfo": {"endCursor": "abc", "hasNextPage": True},
+            "nodes": [{"login": "octocat"}]
+        }}}}).encode()
+        last_page = MagicMock()
+        last_page.content = json.dumps({"data": {"repository": {"stargazers": {
+            "pageInfo": {"endCursor": "def", "hasNextPage": False},
+            "nodes": [{"login": "hubot"}]
+        }}}}).encode()
+        mock_post.side_effect = [first_page, last_page]
+
+        stargazers = self.github.list_stargazers_gql("octocat", "Hello-World")
+        self.assertEqual(stargazers, [{"login": "octocat"}, {"login": "hubot"}])
+        self.assertEqual(mock_post.call_count, 2)
+        last_call = mock_post.call_args
+        self.assertEqual(last_call.args, ("https://api.github.com/graphql",))
+        request_body = json.loads(last_call.kwargs["data"])
+        self.assertIn("nodes{login}", request_body["query"])
+        self.assertEqual(
+            request_body["variables"],
+            {"owner": "octocat", "repo": "Hello-World", "cursor": "abc"}
+        )
+
+    @patch('requests.Session.head')
+    def test_check_if_starred(self, mock_head):
+        mock_response = MagicMock()
+        mock_response.status_code = 204
+        mock_head.return_value = mock_response
+
         is_starred = self.github.check_if_starred("octocat", "Hello-World")
         self.assertTrue(is_starred)
-        mock_get.assert_called_once_with(
-            "https://api.github.com/user/starred/octocat/Hello-World",
-            headers=self.github.headers
+        mock_head.assert_called_once_with(
+            "https://api.github.com/user/starred/octocat/Hello-World"
         )
 
-    @patch('requests.put')
+    @patch('requests.Session.get')
+    def test_get_repository_is_cached(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"id": 1, "name": "Hello-World"}).encode()
+        mock_get.return_value = mock_response
+
+        self.github.get_repository("octocat", "Hello-World")
+        repo = self.github.get_repository("octocat", "Hello-World")
+        self.assertEqual(repo, {"id": 1, "name": "Hello-World"})
+        mock_get.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_expired_cache_entry_revalidates_with_etag(self, mock_get):
+        first_response = MagicMock()
+        first_response.headers = {"ETag": '"abc"'}
+        first_response.content = json.dumps([{"login": "octocat"}]).encode()
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        not_modified.headers = {"ETag": '"abc"'}
+        mock_get.side_effect = [first_response, not_modified]
+
+        self.github.list_stargazers("octocat", "Hello-World")
+        with patch('stargazers.time.monotonic', return_value=float("inf")):
+            stargazers = self.github.list_stargazers("octocat", "Hello-World")
+
+        self.assertEqual(stargazers, [{"login": "octocat"}])
+        mock_get.assert_called_with(
+            "https://api.github.com/repos/octocat/Hello-World/stargazers",
+            headers={"If-None-Match": '"abc"'}
+        )
+
+    @patch('requests.Session.put')
+    @patch('requests.Session.head')
+    def test_star_repository_invalidates_check_if_starred(self, mock_head, mock_put):
+        mock_head.return_value = MagicMock(status_code=404)
+        mock_put.return_value = MagicMock(status_code=204)
+
+        self.assertFalse(self.github.check_if_starred("octocat", "Hello-World"))
+        self.github.star_repository("octocat", "Hello-World")
+        mock_head.return_value = MagicMock(status_code=204)
+        self.assertTrue(self.github.check_if_starred("octocat", "Hello-World"))
+        self.assertEqual(mock_head.call_count, 2)
+
+    @patch('requests.Session.head')
+    def test_check_if_starred_not_starred(self, mock_head):
+        mock_head.return_value = MagicMock(status_code=404)
+
+        self.assertFalse(self.github.check_if_starred("octocat", "Hello-World"))
+
+    @patch('requests.Session.put')
     def test_star_repository(self, mock_put):
         mock_response = MagicMock()
         mock_response.status_code = 204
@@ -106,11 +222,10 @@ class TestGitHubAPI(unittest.TestCase):
         star_status = self.github.star_repository("octocat", "Hello-World")
         self.assertTrue(star_status)
         mock_put.assert_called_once_with(
-            "https://api.github.com/user/starred/octocat/Hello-World",
-            headers=self.github.headers
+            "https://api.github.com/user/starred/octocat/Hello-World"
         )
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_unstar_repository(self, mock_delete):
         mock_response = MagicMock()
         mock_response.status_code = 204
@@ -119,8 +234,7 @@ class TestGitHubAPI(unittest.TestCase):
         unstar_status = self.github.unstar_repository("octocat", "Hello-World")
         self.assertTrue(unstar_status)
         mock_delete.assert_called_once_with(
-            "https://api.github.com/user/starred/octocat/Hello-World",
-            headers=self.github.headers
+            "https://api.github.com/user/starred/octocat/Hello-World"
         )
 
 if __name__ == "__main__":
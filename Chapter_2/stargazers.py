@@ -1,66 +1,246 @@
+import asyncio
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlparse
+
 import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+
+try:
+    import orjson
+    json_loads, json_dumps = orjson.loads, orjson.dumps
+except ImportError:
+    import json
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+STARGAZERS_QUERY = (
+    "query($owner:String!,$repo:String!,$cursor:String){"
+    "repository(owner:$owner,name:$repo){"
+    "stargazers(first:100,after:$cursor){pageInfo{endCursor hasNextPage} nodes{%s}}}}"
+)
+
+STARRED_REPOSITORIES_QUERY = (
+    "query($username:String!,$cursor:String){"
+    "user(login:$username){"
+    "starredRepositories(first:100,after:$cursor){pageInfo{endCursor hasNextPage} nodes{%s}}}}"
+)
+
+CACHE_MAXSIZE = 1024
+CACHE_TTL = 300
+STARRED_CACHE_TTL = 30
+JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
 
 class GitHubAPI:
+    _REPO_TMPL = "/repos/{}/{}"
+    _ISSUES_TMPL = "/repos/{}/{}/issues"
+    _STARGAZERS_TMPL = "/repos/{}/{}/stargazers"
+    _USER_STARRED_TMPL = "/users/{}/starred"
+    _STARRED_TMPL = "/user/starred/{}/{}"
+
     def __init__(self, token, base_url="https://api.github.com"):
         self.token = token
         self.base_url = base_url
+        self.graphql_url = f"{self.base_url}/graphql"
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/vnd.github+json"
         }
+        # Per-instance URL templates, formatted with positional args per call
+        self._repo_url = self.base_url + self._REPO_TMPL
+        self._issues_url = self.base_url + self._ISSUES_TMPL
+        self._stargazers_url = self.base_url + self._STARGAZERS_TMPL
+        self._user_starred_url = self.base_url + self._USER_STARRED_TMPL
+        self._starred_url = self.base_url + self._STARRED_TMPL
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(total=5, backoff_factor=1, status_forcelist=[502, 503, 504])
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries))
+        # (url, params) -> (expires_at, etag, body), least recently used first
+        self._cache = OrderedDict()
+
+    def _cache_put(self, key, ttl, etag, body):
+        self._cache[key] = (time.monotonic() + ttl, etag, body)
+        self._cache.move_to_end(key)
+        if len(self._cache) > CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+
+    def _cached_get(self, url, params=None, ttl=CACHE_TTL):
+        key = (url, tuple(sorted(params.items())) if params else ())
+        entry = self._cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            self._cache.move_to_end(key)
+            return entry[2]
+
+        kwargs = {}
+        if params:
+            kwargs["params"] = params
+        if entry and entry[1]:
+            # A 304 reply costs no rate limit and carries no body
+            kwargs["headers"] = {"If-None-Match": entry[1]}
+        response = self.session.get(url, **kwargs)
+        if entry and response.status_code == 304:
+            body = entry[2]
+        else:
+            response.raise_for_status()
+            body = json_loads(response.content)
+        self._cache_put(key, ttl, response.headers.get("ETag"), body)
+        return body
+
+    def _invalidate(self, *urls):
+        for key in [key for key in self._cache if key[0] in urls]:
+            del self._cache[key]
 
     def get_repository(self, owner, repo):
-        url = f"{self.base_url}/repos/{owner}/{repo}"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        url = self._repo_url.format(owner, repo)
+        return self._cached_get(url)
 
     def create_issue(self, owner, repo, title, body=None, assignees=None, labels=None):
-        url = f"{self.base_url}/repos/{owner}/{repo}/issues"
-        data = {
-            "title": title,
-            "body": body,
-            "assignees": assignees,
-            "labels": labels
-        }
-        response = requests.post(url, headers=self.headers, json=data)
+        url = self._issues_url.format(owner, repo)
+        # Only send the fields the caller set
+        data = {"title": title}
+        if body is not None:
+            data["body"] = body
+        if assignees is not None:
+            data["assignees"] = assignees
+        if labels is not None:
+            data["labels"] = labels
+        response = self.session.post(url, data=json_dumps(data), headers=JSON_CONTENT_TYPE)
         response.raise_for_status()
-        return response.json()
+        self._invalidate(url)
+        return json_loads(response.content)
 
     def list_issues(self, owner, repo, state="open"):
-        url = f"{self.base_url}/repos/{owner}/{repo}/issues"
+        url = self._issues_url.format(owner, repo)
         params = {"state": state}
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(url, params=params)
 
     def list_stargazers(self, owner, repo):
-        url = f"{self.base_url}/repos/{owner}/{repo}/stargazers"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        url = self._stargazers_url.format(owner, repo)
+        return self._cached_get(url)
 
     def list_starred_repositories(self, username):
-        url = f"{self.base_url}/users/{username}/starred"
-        response = requests.get(url, headers=self.headers)
+        url = self._user_starred_url.format(username)
+        return self._cached_get(url)
+
+    def iter_stargazers(self, owner, repo):
+        return self._iter_items(self._stargazers_url.format(owner, repo))
+
+    def iter_starred_repositories(self, username):
+        return self._iter_items(self._user_starred_url.format(username))
+
+    def _iter_items(self, url):
+        # Yield array items as they are parsed instead of buffering the whole body
+        with self.session.get(url, stream=True) as response:
+            response.raise_for_status()
+            if ijson is None:
+                yield from json_loads(response.content)
+                return
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "item", use_float=True)
+
+    def list_all_stargazers(self, owner, repo):
+        url = self._stargazers_url.format(owner, repo)
+        return asyncio.run(self._list_all_pages(url))
+
+    def list_all_starred_repositories(self, username):
+        url = self._user_starred_url.format(username)
+        return asyncio.run(self._list_all_pages(url))
+
+    def _async_client(self):
+        # httpx is only needed for the concurrent list_all_* helpers
+        import httpx
+        return httpx.AsyncClient(http2=True, headers=self.headers, limits=httpx.Limits(max_connections=20))
+
+    async def _list_all_pages(self, url, per_page=100, concurrency=10):
+        async with self._async_client() as client:
+            response = await client.get(url, params={"per_page": per_page, "page": 1})
+            response.raise_for_status()
+            items = json_loads(response.content)
+
+            # The first page's Link header tells us how many pages remain
+            last = response.links.get("last")
+            if not last:
+                return items
+            last_page = int(parse_qs(urlparse(last["url"]).query)["page"][0])
+
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch(page):
+                async with semaphore:
+                    page_response = await client.get(url, params={"per_page": per_page, "page": page})
+                page_response.raise_for_status()
+                return json_loads(page_response.content)
+
+            pages = await asyncio.gather(*(fetch(page) for page in range(2, last_page + 1)))
+
+        for page in pages:
+            items.extend(page)
+        return items
+
+    def list_stargazers_gql(self, owner, repo, fields=("login",)):
+        query = STARGAZERS_QUERY % " ".join(fields)
+        variables = {"owner": owner, "repo": repo}
+        return self._graphql_nodes(query, variables, ("repository", "stargazers"))
+
+    def list_starred_repositories_gql(self, username, fields=("nameWithOwner",)):
+        query = STARRED_REPOSITORIES_QUERY % " ".join(fields)
+        variables = {"username": username}
+        return self._graphql_nodes(query, variables, ("user", "starredRepositories"))
+
+    def _graphql(self, query, variables):
+        body = json_dumps({"query": query, "variables": variables})
+        response = self.session.post(self.graphql_url, data=body, headers=JSON_CONTENT_TYPE)
         response.raise_for_status()
-        return response.json()
+        payload = json_loads(response.content)
+        if payload.get("errors"):
+            raise requests.exceptions.HTTPError(payload["errors"][0]["message"], response=response)
+        return payload["data"]
+
+    def _graphql_nodes(self, query, variables, path):
+        nodes = []
+        cursor = None
+        while True:
+            connection = self._graphql(query, {**variables, "cursor": cursor})
+            for key in path:
+                connection = connection[key]
+            nodes.extend(connection["nodes"])
+            if not connection["pageInfo"]["hasNextPage"]:
+                return nodes
+            cursor = connection["pageInfo"]["endCursor"]
 
     def check_if_starred(self, owner, repo):
-        url = f"{self.base_url}/user/starred/{owner}/{repo}"
-        response = requests.get(url, headers=self.headers)
-        return response.status_code == 204
+        url = self._starred_url.format(owner, repo)
+        entry = self._cache.get((url, ()))
+        if entry and entry[0] > time.monotonic():
+            return entry[2]
+        # 204 means starred, 404 means not starred; HEAD skips the body
+        # and, like requests' head(), does not follow redirects
+        response = self.session.head(url)
+        is_starred = response.status_code == 204
+        self._cache_put((url, ()), STARRED_CACHE_TTL, None, is_starred)
+        return is_starred
 
     def star_repository(self, owner, repo):
-        url = f"{self.base_url}/user/starred/{owner}/{repo}"
-        response = requests.put(url, headers=self.headers)
+        url = self._starred_url.format(owner, repo)
+        response = self.session.put(url)
         response.raise_for_status()
+        self._invalidate(url, self._stargazers_url.format(owner, repo))
         return response.status_code == 204
 
     def unstar_repository(self, owner, repo):
-        url = f"{self.base_url}/user/starred/{owner}/{repo}"
-        response = requests.delete(url, headers=self.headers)
+        url = self._starred_url.format(owner, repo)
+        response = self.session.delete(url)
         response.raise_for_status()
+        self._invalidate(url, self._stargazers_url.format(owner, repo))
         return response.status_code == 204
 
 # Example usage:
@@ -1,4 +1,6 @@
+import base64
 import os
+from types import MappingProxyType
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
@@ -16,11 +18,15 @@ class TwilioAPI:
         self.account_sid = account_sid or os.getenv("TWILIO_ACCOUNT_SID")
         self.auth_token = auth_token or os.getenv("TWILIO_AUTH_TOKEN")
         self.base_url = f"{base_url}/Accounts/{self.account_sid}"
-        self.headers = {
+        self._messages_url = f"{self.base_url}/Messages.json"
+        # Encoded once and frozen; every request picks the headers up from
+        # the session, and self.headers stays readable for callers
+        self.headers = MappingProxyType({
             "Authorization": f"Basic {self._encode_credentials()}",
             "Content-Type": "application/x-www-form-urlencoded"
-        }
+        })
         self.session = requests.Session()
+        self.session.headers.update(self.headers)
         retries = Retry(total=5, backoff_factor=1, status_forcelist=[502, 503, 504])
         self.session.mount("https://", HTTPAdapter(max_retries=retries))
 
@@ -33,16 +39,17 @@ class TwilioAPI:
         credentials = f"{self.account_sid}:{self.auth_token}"
         return base64.b64encode(credentials.encode()).decode()
 
-    def _request(self, method, url, data=None):
+    def _request(self, method, url, data=None, params=None):
         """
         Make an HTTP request.
 
         :param method: HTTP method (GET, POST, etc.)
         :param url: URL for the request
         :param data: Data to send with the request
+        :param params: Query string parameters
         :return: JSON response
         """
-        response = self.session.request(method, url, headers=self.headers, data=data)
+        response = self.session.request(method, url, data=data, params=params)
         response.raise_for_status()
         return response.json()
 
@@ -57,7 +64,7 @@ class TwilioMessagingAPI(TwilioAPI):
         :param body: The body of the message
         :return: The response from the API
         """
-        url = f"{self.base_url}/Messages.json"
+        url = self._messages_url
         data = {
             'To': to,
             'From': from_,
@@ -82,10 +89,7 @@ class TwilioMessagingAPI(TwilioAPI):
         :param params: Optional parameters for filtering the list
         :return: The response from the API
         """
-        url = f"{self.base_url}/Messages.json"
-        if params:
-            url += '?' + '&'.join([f"{key}={value}" for key, value in params.items()])
-        return self._request("GET", url)
+        return self._request("GET", self._messages_url, params=params)
 
 
 # Example usage:
@@ -11,12 +11,17 @@ class GitHubAPI:
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/vnd.github+json"
         }
+        # URL prefixes shared by every call
+        self._repos_url = f"{base_url}/repos"
+        self._starred_url = f"{base_url}/user/starred"
         self.session = requests.Session()
+        # Set once on the session instead of being merged into every request
+        self.session.headers.update(self.headers)
         retries = Retry(total=5, backoff_factor=1, status_forcelist=[502, 503, 504])
         self.session.mount("https://", HTTPAdapter(max_retries=retries))
 
     def _request(self, method, url, **kwargs):
-        response = self.session.request(method, url, headers=self.headers, **kwargs)
+        response = self.session.request(method, url, **kwargs)
         return self._handle_response(response)
 
     def _handle_response(self, response):
@@ -29,28 +34,24 @@ class GitHubAPI:
         return response.json()
 
     def get_repository(self, owner, repo):
-        url = f"{self.base_url}/repos/{owner}/{repo}"
-        return self._request("GET", url)
+        return self._request("GET", f"{self._repos_url}/{owner}/{repo}")
 
 class GitHubIssuesAPI(GitHubAPI):
     def create_issue(self, owner, repo, title, body=None, assignees=None, labels=None):
-        url = f"{self.base_url}/repos/{owner}/{repo}/issues"
-        data = {
-            "title": title,
-            "body": body,
-            "assignees": assignees,
-            "labels": labels
-        }
+        url = f"{self._repos_url}/{owner}/{repo}/issues"
+        # Leave out unset fields rather than sending them as null
+        data = {k: v for k, v in (("title", title), ("body", body),
+                                  ("assignees", assignees), ("labels", labels)) if v is not None}
         return self._request("POST", url, json=data)
 
     def list_issues(self, owner, repo, state="open"):
-        url = f"{self.base_url}/repos/{owner}/{repo}/issues"
+        url = f"{self._repos_url}/{owner}/{repo}/issues"
         params = {"state": state}
         return self._request("GET", url, params=params)
 
 class GitHubStarsAPI(GitHubAPI):
     def list_stargazers(self, owner, repo):
-        url = f"{self.base_url}/repos/{owner}/{repo}/stargazers"
+        url = f"{self._repos_url}/{owner}/{repo}/stargazers"
         return self._request("GET", url)
 
     def list_starred_repositories(self, username):
@@ -58,19 +59,19 @@ class GitHubStarsAPI(GitHubAPI):
         return self._request("GET", url)
 
     def check_if_starred(self, owner, repo):
-        url = f"{self.base_url}/user/starred/{owner}/{repo}"
-        response = self.session.get(url, headers=self.headers)
+        url = f"{self._starred_url}/{owner}/{repo}"
+        response = self.session.get(url)
         return response.status_code == 204
 
     def star_repository(self, owner, repo):
-        url = f"{self.base_url}/user/starred/{owner}/{repo}"
-        response = self.session.put(url, headers=self.headers)
+        url = f"{self._starred_url}/{owner}/{repo}"
+        response = self.session.put(url)
         response.raise_for_status()
         return response.status_code == 204
 
     def unstar_repository(self, owner, repo):
-        url = f"{self.base_url}/user/starred/{owner}/{repo}"
-        response = self.session.delete(url, headers=self.headers)
+        url = f"{self._starred_url}/{owner}/{repo}"
+        response = self.session.delete(url)
         response.raise_for_status()
         return response.status_code == 204
 
@@ -1,75 +1,193 @@
 import os
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
+try:
+    import orjson
+    json_loads, json_dumps = orjson.loads, orjson.dumps
+except ImportError:
+    import json
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
+MAX_RATE_LIMIT_RETRIES = 3
+# Most GET responses kept for conditional revalidation
+ETAG_CACHE_MAXSIZE = 256
+LOW_REMAINING_THRESHOLD = 10
+
 class GitHubAPI:
-    def __init__(self, token=None, base_url="https://api.github.com"):
+    _REPO_TMPL = "/repos/{}/{}"
+    _ISSUES_TMPL = "/repos/{}/{}/issues"
+    _STARGAZERS_TMPL = "/repos/{}/{}/stargazers"
+    _USER_STARRED_TMPL = "/users/{}/starred"
+    _STARRED_TMPL = "/user/starred/{}/{}"
+
+    def __init__(self, token=None, base_url="https://api.github.com", http2=False):
         self.token = token or os.getenv("GITHUB_TOKEN")
         self.base_url = base_url
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/vnd.github+json"
         }
-        self.session = requests.Session()
-        retries = Retry(total=5, backoff_factor=1, status_forcelist=[502, 503, 504])
-        self.session.mount("https://", HTTPAdapter(max_retries=retries))
+        # Per-instance URL templates, formatted with positional args per call
+        self._repo_url = self.base_url + self._REPO_TMPL
+        self._issues_url = self.base_url + self._ISSUES_TMPL
+        self._stargazers_url = self.base_url + self._STARGAZERS_TMPL
+        self._user_starred_url = self.base_url + self._USER_STARRED_TMPL
+        self._starred_url = self.base_url + self._STARRED_TMPL
+        if http2:
+            # httpx multiplexes concurrent requests over one HTTP/2 connection;
+            # its Client exposes the same request/get/put/delete surface we use
+            import httpx
+            self.session = httpx.Client(
+                headers=self.headers,
+                timeout=30.0,
+                transport=httpx.HTTPTransport(http2=True, retries=3),
+            )
+            self._body_kwarg = "content"
+            self._http_errors = (requests.exceptions.HTTPError, httpx.HTTPStatusError)
+        else:
+            self.session = requests.Session()
+            self.session.headers.update(self.headers)
+            retries = Retry(total=5, backoff_factor=1, status_forcelist=[502, 503, 504])
+            self.session.mount("https://", HTTPAdapter(max_retries=retries))
+            self._body_kwarg = "data"
+            self._http_errors = (requests.exceptions.HTTPError,)
+        # (url, params) -> (etag, last_modified, parsed body) for conditional
+        # GETs, least recently used first
+        self._etag_cache = OrderedDict()
 
     def _request(self, method, url, **kwargs):
-        response = self.session.request(method, url, headers=self.headers, **kwargs)
-        return self._handle_response(response)
+        # Auth and Accept live on the session; only per-request extras go here
+        headers = None
+        if "json" in kwargs:
+            kwargs[self._body_kwarg] = json_dumps(kwargs.pop("json"))
+            headers = {"Content-Type": "application/json"}
+        key = cached = None
+        if method == "GET":
+            params = kwargs.get("params")
+            key = (url, tuple(sorted(params.items())) if params else ())
+            cached = self._etag_cache.get(key)
+        if cached:
+            headers = dict(headers or {})
+            if cached[0]:
+                headers["If-None-Match"] = cached[0]
+            if cached[1]:
+                headers["If-Modified-Since"] = cached[1]
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            response = self.session.request(method, url, headers=headers, **kwargs)
+            wait = self._rate_limit_wait(response)
+            if wait is None or attempt == MAX_RATE_LIMIT_RETRIES:
+                break
+            print(f"Rate limited. Retrying after {wait:.1f} seconds.")
+            time.sleep(wait)
+        if wait is None:
+            # A response still rate limited is about to raise; never pace it
+            self._throttle(response)
+
+        if cached and response.status_code == 304:
+            self._etag_cache.move_to_end(key)
+            return cached[2]
+
+        body = self._handle_response(response)
+        if key:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._etag_cache[key] = (etag, last_modified, body)
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > ETAG_CACHE_MAXSIZE:
+                    self._etag_cache.popitem(last=False)
+        return body
+
+    def _rate_limit_wait(self, response):
+        # Primary and secondary rate limits come back as 403 or 429
+        if response.status_code not in (403, 429):
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            # Retry-After is either a number of seconds or an HTTP date
+            try:
+                return max(float(retry_after), 0)
+            except ValueError:
+                try:
+                    return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0)
+                except (TypeError, ValueError):
+                    pass
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = int(response.headers.get("X-RateLimit-Reset", 0))
+            return max(reset - time.time(), 0)
+        return None
+
+    def _throttle(self, response):
+        # Spread the remaining quota over the time left in the window
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None or int(remaining) >= LOW_REMAINING_THRESHOLD:
+            return
+        reset = int(response.headers.get("X-RateLimit-Reset", 0))
+        time.sleep(max(reset - time.time(), 0) / max(int(remaining), 1))
 
     def _handle_response(self, response):
         try:
             response.raise_for_status()
-        except requests.exceptions.HTTPError as e:
+        except self._http_errors as e:
             print(f"HTTP error occurred: {e}")
             print(f"Response content: {response.content}")
             raise
-        return response.json()
+        return json_loads(response.content)
 
     def get_repository(self, owner, repo):
-        url = f"{self.base_url}/repos/{owner}/{repo}"
+        url = self._repo_url.format(owner, repo)
         return self._request("GET", url)
 
     def create_issue(self, owner, repo, title, body=None, assignees=None, labels=None):
-        url = f"{self.base_url}/repos/{owner}/{repo}/issues"
-        data = {
-            "title": title,
-            "body": body,
-            "assignees": assignees,
-            "labels": labels
-        }
+        url = self._issues_url.format(owner, repo)
+        # Only send the fields the caller set
+        data = {"title": title}
+        if body is not None:
+            data["body"] = body
+        if assignees is not None:
+            data["assignees"] = assignees
+        if labels is not None:
+            data["labels"] = labels
         return self._request("POST", url, json=data)
 
     def list_issues(self, owner, repo, state="open"):
-        url = f"{self.base_url}/repos/{owner}/{repo}/issues"
+        url = self._issues_url.format(owner, repo)
         params = {"state": state}
         return self._request("GET", url, params=params)
 
 class GitHubStarsAPI(GitHubAPI):
     def list_stargazers(self, owner, repo):
-        url = f"{self.base_url}/repos/{owner}/{repo}/stargazers"
+        url = self._stargazers_url.format(owner, repo)
         return self._request("GET", url)
 
     def list_starred_repositories(self, username):
-        url = f"{self.base_url}/users/{username}/starred"
+        url = self._user_starred_url.format(username)
         return self._request("GET", url)
 
     def check_if_starred(self, owner, repo):
-        url = f"{self.base_url}/user/starred/{owner}/{repo}"
-        response = self.session.get(url, headers=self.headers)
+        url = self._starred_url.format(owner, repo)
+        # 204 means starred, 404 means not starred; HEAD skips the body
+        response = self.session.head(url)
         return response.status_code == 204
 
     def star_repository(self, owner, repo):
-        url = f"{self.base_url}/user/starred/{owner}/{repo}"
-        response = self.session.put(url, headers=self.headers)
+        url = self._starred_url.format(owner, repo)
+        response = self.session.put(url)
         response.raise_for_status()
         return response.status_code == 204
 
     def unstar_repository(self, owner, repo):
-        url = f"{self.base_url}/user/starred/{owner}/{repo}"
-        response = self.session.delete(url, headers=self.headers)
+        url = self._starred_url.format(owner, repo)
+        response = self.session.delete(url)
         response.raise_for_status()
         return response.status_code == 204
 
@@ -0,0 +1,397 @@
+import asyncio
+import inspect
+import json
+import time
+import unittest
+from email.utils import formatdate
+from typing import Dict, Union
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+# Import the client we want to test
+# Note: You'll need to adjust this import to match your actual file structure
+from output import GitHubAPI
+
+
+def _mock_client(api, handler):
+    """Route the client's requests through an httpx.MockTransport handler."""
+    api.client = httpx.AsyncClient(
+        base_url=api.base_url,
+        headers=api.headers,
+        transport=httpx.MockTransport(handler)
+    )
+
+
+def _pages(calls, total, link=True):
+    """Handler serving `total` repositories page by page, recording each page asked for."""
+    repos = [{"id": i, "owner": {"login": f"user{i}"}} for i in range(total)]
+
+    async def handler(request):
+        per_page = int(request.url.params["per_page"])
+        page = int(request.url.params["page"])
+        calls.append(page)
+        last = max(1, -(-total // per_page))
+        headers = {}
+        if link and last > 1:
+            url = f"{request.url.copy_with(query=None)}?per_page={per_page}&page="
+            rels = [f'<{url}{last}>; rel="last"']
+            if page < last:
+                rels.insert(0, f'<{url}{page + 1}>; rel="next"')
+            headers["Link"] = ", ".join(rels)
+        body = repos[(page - 1) * per_page:page * per_page]
+        return httpx.Response(200, headers=headers, content=json.dumps(body).encode())
+
+    return repos, handler
+
+
+class TestGitHubAPI(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the GitHubAPI class."""
+
+    async def asyncSetUp(self):
+        """Set up a client whose transport is replaced per test."""
+        self.api = GitHubAPI("test_token", base_url="https://api.github.com")
+        self.calls = []
+
+    async def asyncTearDown(self):
+        await self.api.aclose()
+
+    async def test_concurrent_gets_share_one_request(self):
+        """Test that duplicate in-flight GETs are sent once."""
+        release = asyncio.Event()
+
+        async def handler(request):
+            self.calls.append(request.url.path)
+            await release.wait()
+            return httpx.Response(200, content=json.dumps({"name": "r"}).encode())
+
+        _mock_client(self.api, handler)
+        first = asyncio.ensure_future(self.api.get_repository("o", "r"))
+        second = asyncio.ensure_future(self.api.get_repository("o", "r"))
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertEqual(await first, {"name": "r"})
+        self.assertEqual(await second, {"name": "r"})
+        self.assertEqual(self.calls, ["/repos/o/r"])
+        self.assertEqual(self.api._inflight, {})
+
+    async def test_cancelling_first_caller_keeps_shared_request(self):
+        """Test that cancelling the caller that started a GET leaves the others served."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def handler(request):
+            self.calls.append(request.url.path)
+            started.set()
+            await release.wait()
+            return httpx.Response(200, content=json.dumps({"name": "r"}).encode())
+
+        _mock_client(self.api, handler)
+        first = asyncio.ensure_future(self.api.get_repository("o", "r"))
+        second = asyncio.ensure_future(self.api.get_repository("o", "r"))
+        await started.wait()
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        self.assertEqual(await second, {"name": "r"})
+        self.assertEqual(self.calls, ["/repos/o/r"])
+        self.assertEqual(self.api._inflight, {})
+
+    async def test_shared_request_error_reaches_every_caller(self):
+        """Test that a failed shared GET raises in each waiting caller."""
+        async def handler(request):
+            self.calls.append(request.url.path)
+            await asyncio.sleep(0)
+            return httpx.Response(404, content=json.dumps({"message": "Not Found"}).encode())
+
+        _mock_client(self.api, handler)
+        results = await asyncio.gather(
+            self.api.get_repository("o", "r"),
+            self.api.get_repository("o", "r"),
+            return_exceptions=True
+        )
+
+        self.assertEqual(len(self.calls), 1)
+        for result in results:
+            self.assertIsInstance(result, Exception)
+        self.assertEqual(self.api._inflight, {})
+
+    async def test_endpoint_binds_positional_and_keyword_arguments(self):
+        """Test that generated endpoint methods bind arguments like a normal def."""
+        async def handler(request):
+            self.calls.append(request.url.path)
+            return httpx.Response(200, content=b'{}')
+
+        _mock_client(self.api, handler)
+        await self.api.get_branch("o", repo="r", branch="main")
+        self.assertEqual(self.calls, ["/repos/o/r/branches/main"])
+
+        with self.assertRaises(TypeError):
+            await self.api.get_repository("o", "r", owner="x")
+        with self.assertRaises(TypeError):
+            await self.api.get_repository("o")
+        with self.assertRaises(TypeError):
+            await self.api.get_repository("o", "r", "extra")
+        self.assertEqual(len(self.calls), 1)
+
+    def test_endpoint_signature_and_docstring(self):
+        """Test that generated endpoint methods keep their type hints and docs."""
+        signature = inspect.signature(GitHubAPI.get_workflow)
+        self.assertEqual(list(signature.parameters), ["self", "owner", "repo", "workflow_id"])
+        self.assertEqual(signature.parameters["workflow_id"].annotation, Union[int, str])
+        self.assertEqual(signature.return_annotation, Dict)
+        self.assertIn("workflow_id: Workflow ID or filename", GitHubAPI.get_workflow.__doc__)
+        self.assertTrue(GitHubAPI.get_workflow.__doc__.startswith("Get a workflow"))
+
+    def test_rate_limit_wait_reads_retry_after_seconds(self):
+        """Test that a Retry-After delay in seconds is used as is."""
+        response = httpx.Response(403, headers={"Retry-After": "30"})
+        self.assertEqual(GitHubAPI._rate_limit_wait(response), 30.0)
+
+    def test_rate_limit_wait_reads_retry_after_http_date(self):
+        """Test that a Retry-After HTTP date is turned into a delay."""
+        response = httpx.Response(429, headers={"Retry-After": formatdate(time.time() + 60, usegmt=True)})
+        self.assertAlmostEqual(GitHubAPI._rate_limit_wait(response), 60, delta=2)
+
+    def test_rate_limit_wait_falls_back_to_reset(self):
+        """Test that an unreadable Retry-After falls back to X-RateLimit-Reset."""
+        response = httpx.Response(429, headers={
+            "Retry-After": "soon",
+            "X-RateLimit-Reset": str(int(time.time()) + 10)
+        })
+        self.assertAlmostEqual(GitHubAPI._rate_limit_wait(response), 11, delta=2)
+
+    async def test_cached_get_revalidates_with_etag(self):
+        """Test that a repeated GET sends If-None-Match and reuses the body on 304."""
+        seen = []
+
+        async def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, headers={"ETag": '"v1"'}, content=b'{"name": "r"}')
+
+        _mock_client(self.api, handler)
+        headers = {"X-Test": "1"}
+        first = await self.api._cached_get("/repos/o/r", headers=headers)
+        second = await self.api._cached_get("/repos/o/r", headers=headers)
+
+        self.assertEqual(first[0], {"name": "r"})
+        self.assertEqual(second[0], {"name": "r"})
+        self.assertEqual(seen, [None, '"v1"'])
+        self.assertEqual(headers, {"X-Test": "1"})
+
+
+    async def test_headers_keep_cache_entries_apart(self):
+        """Test that GETs differing only in Accept never share a cached body."""
+        async def handler(request):
+            self.calls.append(request.headers["Accept"])
+            star = request.headers["Accept"].endswith("star+json")
+            body = b'[{"starred_at": "2023-01-01"}]' if star else b'[{"login": "u"}]'
+            return httpx.Response(200, headers={"ETag": '"v1"'}, content=body)
+
+        _mock_client(self.api, handler)
+        star_headers = {"Accept": "application/vnd.github.star+json"}
+        plain, starred = await asyncio.gather(
+            self.api._request('GET', '/repos/o/r/stargazers'),
+            self.api._request('GET', '/repos/o/r/stargazers', headers=star_headers)
+        )
+        cached = await self.api._request('GET', '/repos/o/r/stargazers', headers=star_headers)
+
+        self.assertEqual(plain, [{"login": "u"}])
+        self.assertEqual(starred, [{"starred_at": "2023-01-01"}])
+        self.assertEqual(cached, starred)
+        self.assertEqual(len(self.calls), 3)
+        self.assertEqual(len(self.api._etag_cache), 2)
+
+
+
+class TestGitHubAPIPagination(unittest.IsolatedAsyncioTestCase):
+    """Test cases for GitHubAPI's paginated, GraphQL and rate-limit paths."""
+
+    async def asyncSetUp(self):
+        self.api = GitHubAPI("test_token", base_url="https://api.github.com")
+        self.calls = []
+
+    async def asyncTearDown(self):
+        await self.api.aclose()
+
+    async def test_paginate_fans_out_to_last_page(self):
+        """Test that pages 2..last are all requested after page 1's Link header."""
+        repos, handler = _pages(self.calls, 5)
+        _mock_client(self.api, handler)
+
+        result = await self.api.paginate('/orgs/o/repos', {'per_page': 2})
+
+        self.assertEqual(result, repos)
+        self.assertEqual(self.calls[0], 1)
+        self.assertEqual(sorted(self.calls), [1, 2, 3])
+
+    async def test_paginate_without_link_header(self):
+        """Test that pages are walked one by one until a short page without Link."""
+        repos, handler = _pages(self.calls, 5, link=False)
+        _mock_client(self.api, handler)
+
+        result = await self.api.paginate('/orgs/o/repos', {'per_page': 2})
+
+        self.assertEqual(result, repos)
+        self.assertEqual(self.calls, [1, 2, 3])
+
+    async def test_iter_paginated_follows_link_header(self):
+        """Test that iteration yields every item and stops when there is no next page."""
+        repos, handler = _pages(self.calls, 4)
+        _mock_client(self.api, handler)
+
+        result = [repo async for repo in self.api.iter_paginated('/orgs/o/repos', {'per_page': 2})]
+
+        self.assertEqual(result, repos)
+        # A full last page is not followed by an empty request
+        self.assertEqual(self.calls, [1, 2])
+
+    async def test_iter_paginated_without_link_header(self):
+        """Test that iteration stops at the first short page without Link."""
+        repos, handler = _pages(self.calls, 5, link=False)
+        _mock_client(self.api, handler)
+
+        result = [repo async for repo in self.api.iter_paginated('/orgs/o/repos', {'per_page': 2})]
+
+        self.assertEqual(result, repos)
+        self.assertEqual(self.calls, [1, 2, 3])
+
+    async def test_iter_paginated_prefetches_and_cancels(self):
+        """Test that the next page is requested early and abandoned when the caller stops."""
+        released = asyncio.Event()
+        cancelled = []
+        repos, serve = _pages(self.calls, 10)
+
+        async def handler(request):
+            if request.url.params["page"] == "2":
+                self.calls.append(2)
+                try:
+                    await released.wait()
+                except asyncio.CancelledError:
+                    cancelled.append(2)
+                    raise
+            return await serve(request)
+
+        _mock_client(self.api, handler)
+        pages = self.api.iter_paginated('/orgs/o/repos', {'per_page': 2})
+
+        self.assertEqual(await pages.__anext__(), repos[0])
+        await asyncio.sleep(0.01)
+        # Page 2 is in flight while page 1 is still being consumed
+        self.assertIn(2, self.calls)
+        await pages.aclose()
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(cancelled, [2])
+        self.assertNotIn(3, self.calls)
+
+    async def test_iter_field_streams_nested_field(self):
+        """Test that iter_field yields one dotted field per item, with and without Link."""
+        for link in (True, False):
+            with self.subTest(link=link):
+                calls = []
+                repos, handler = _pages(calls, 5, link=link)
+                _mock_client(self.api, handler)
+
+                logins = [login async for login in
+                          self.api.iter_field('/orgs/o/repos', 'owner.login', {'per_page': 2})]
+
+                self.assertEqual(logins, [repo["owner"]["login"] for repo in repos])
+                self.assertEqual(calls, [1, 2, 3])
+
+    async def test_graphql_posts_query_and_returns_data(self):
+        """Test that graphql sends query and variables and unwraps data."""
+        sent = []
+
+        async def handler(request):
+            sent.append((request.method, request.url.path, json.loads(request.content)))
+            return httpx.Response(200, content=b'{"data": {"viewer": {"login": "octocat"}}}')
+
+        _mock_client(self.api, handler)
+        data = await self.api.graphql("query { viewer { login } }", {"a": 1})
+
+        self.assertEqual(data, {"viewer": {"login": "octocat"}})
+        self.assertEqual(sent, [("POST", "/graphql",
+                                 {"query": "query { viewer { login } }", "variables": {"a": 1}})])
+
+    async def test_graphql_raises_on_errors(self):
+        """Test that a GraphQL errors array becomes an exception."""
+        async def handler(request):
+            return httpx.Response(200, content=b'{"data": null, "errors": [{"message": "Bad query"}]}')
+
+        _mock_client(self.api, handler)
+        with self.assertRaisesRegex(Exception, "Bad query"):
+            await self.api.graphql("query { nope }")
+
+    async def test_get_repository_bundle_maps_rest_fields(self):
+        """Test that the GraphQL bundle is reshaped into REST-style objects."""
+        node = {
+            "name": "r", "nameWithOwner": "o/r", "description": "d", "url": "https://github.com/o/r",
+            "isPrivate": False, "stargazerCount": 7, "forkCount": 2, "defaultBranchRef": {"name": "main"},
+            "issues": {"nodes": [{"number": 1, "title": "Bug", "state": "OPEN", "url": "u1",
+                                  "createdAt": "2023-01-01T00:00:00Z", "author": None}]},
+            "pullRequests": {"nodes": [{"number": 2, "title": "Fix", "state": "OPEN", "url": "u2",
+                                        "createdAt": "2023-01-02T00:00:00Z", "isDraft": True,
+                                        "author": {"login": "octocat"},
+                                        "headRefName": "fix", "baseRefName": "main"}]}
+        }
+
+        async def handler(request):
+            self.calls.append(json.loads(request.content)["variables"])
+            return httpx.Response(200, content=json.dumps({"data": {"repository": node}}).encode())
+
+        _mock_client(self.api, handler)
+        bundle = await self.api.get_repository_bundle("o", "r")
+
+        self.assertEqual(self.calls, [{"owner": "o", "repo": "r"}])
+        self.assertEqual(bundle["repository"]["full_name"], "o/r")
+        self.assertEqual(bundle["repository"]["stargazers_count"], 7)
+        self.assertEqual(bundle["repository"]["default_branch"], "main")
+        self.assertEqual(bundle["issues"], [{
+            "number": 1, "title": "Bug", "state": "open", "html_url": "u1",
+            "created_at": "2023-01-01T00:00:00Z", "user": None
+        }])
+        pr = bundle["pull_requests"][0]
+        self.assertEqual((pr["state"], pr["draft"], pr["user"]), ("open", True, {"login": "octocat"}))
+        self.assertEqual((pr["head"], pr["base"]), ({"ref": "fix"}, {"ref": "main"}))
+
+    async def test_exhausted_rate_limit_delays_next_request(self):
+        """Test that a spent window makes the next request wait for its reset."""
+        reset = time.time() + 30
+
+        async def handler(request):
+            self.calls.append(request.url.path)
+            return httpx.Response(200, headers={
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(reset)
+            }, content=b'{}')
+
+        _mock_client(self.api, handler)
+        await self.api.get_repository("o", "a")
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            await self.api.get_repository("o", "b")
+
+        self.assertEqual(self.calls, ["/repos/o/a", "/repos/o/b"])
+        mock_sleep.assert_awaited_once()
+        self.assertAlmostEqual(mock_sleep.await_args.args[0], 30, delta=2)
+
+    async def test_await_rate_limit_after_reset(self):
+        """Test that a window whose reset has passed is forgotten without waiting."""
+        self.api._rl_remaining = 0
+        self.api._rl_reset = time.time() - 1
+
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            await self.api._await_rate_limit()
+
+        mock_sleep.assert_not_awaited()
+        self.assertIsNone(self.api._rl_remaining)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,20 +1,216 @@
-import requests
+import asyncio
+import httpx
+import inspect
+import random
+import string
 import time
-from typing import Dict, List, Optional, Union, Any
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Union, Any, AsyncIterator
+from urllib.parse import parse_qs, urlparse
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Maximum number of GET responses kept for conditional revalidation
+ETAG_CACHE_MAXSIZE = 1024
+# Retries for a rate-limited request before giving up
+MAX_RATE_LIMIT_RETRIES = 3
+# Pause new requests once this few calls remain in the rate-limit window
+RATE_LIMIT_FLOOR = 0
+
+# Repository details plus its open issues and pull requests in one query
+REPOSITORY_BUNDLE_QUERY = """
+query($owner: String!, $repo: String!) {
+  repository(owner: $owner, name: $repo) {
+    name nameWithOwner description url isPrivate
+    stargazerCount forkCount defaultBranchRef { name }
+    issues(first: 100, states: OPEN) {
+      nodes { number title state url createdAt author { login } }
+    }
+    pullRequests(first: 100, states: OPEN) {
+      nodes {
+        number title state url createdAt isDraft author { login }
+        headRefName baseRefName
+      }
+    }
+  }
+}
+"""
+
+# Endpoints that map positional path parameters straight onto one request:
+# (method name, HTTP method, path template, {parameter: type}, return type, docstring)
+ENDPOINTS = (
+    ('get_repository', 'GET', '/repos/{owner}/{repo}', {'owner': str, 'repo': str}, Dict, """
+        Get a repository
+        
+        Args:
+            owner: Repository owner (user or organization)
+            repo: Repository name
+            
+        Returns:
+            Repository details
+        """),
+    ('delete_repository', 'DELETE', '/repos/{owner}/{repo}', {'owner': str, 'repo': str}, None, """
+        Delete a repository
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+        """),
+    ('get_branch', 'GET', '/repos/{owner}/{repo}/branches/{branch}',
+     {'owner': str, 'repo': str, 'branch': str}, Dict, """
+        Get a branch
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch name
+            
+        Returns:
+            Branch details
+        """),
+    ('get_issue', 'GET', '/repos/{owner}/{repo}/issues/{issue_number}',
+     {'owner': str, 'repo': str, 'issue_number': int}, Dict, """
+        Get an issue
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            issue_number: Issue number
+            
+        Returns:
+            Issue details
+        """),
+    ('get_pull_request', 'GET', '/repos/{owner}/{repo}/pulls/{pull_number}',
+     {'owner': str, 'repo': str, 'pull_number': int}, Dict, """
+        Get a pull request
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            pull_number: Pull request number
+            
+        Returns:
+            Pull request details
+        """),
+    ('get_organization', 'GET', '/orgs/{org}', {'org': str}, Dict, """
+        Get an organization
+        
+        Args:
+            org: Organization name
+            
+        Returns:
+            Organization details
+        """),
+    ('get_team', 'GET', '/orgs/{org}/teams/{team_slug}', {'org': str, 'team_slug': str}, Dict, """
+        Get a team
+        
+        Args:
+            org: Organization name
+            team_slug: Team slug
+            
+        Returns:
+            Team details
+        """),
+    ('get_authenticated_user', 'GET', '/user', {}, Dict, """
+        Get the authenticated user
+        
+        Returns:
+            User details
+        """),
+    ('get_user', 'GET', '/users/{username}', {'username': str}, Dict, """
+        Get a user
+        
+        Args:
+            username: Username
+            
+        Returns:
+            User details
+        """),
+    ('list_workflows', 'GET', '/repos/{owner}/{repo}/actions/workflows',
+     {'owner': str, 'repo': str}, Dict, """
+        List workflows in a repository
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            
+        Returns:
+            List of workflows
+        """),
+    ('get_workflow', 'GET', '/repos/{owner}/{repo}/actions/workflows/{workflow_id}',
+     {'owner': str, 'repo': str, 'workflow_id': Union[int, str]}, Dict, """
+        Get a workflow
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            workflow_id: Workflow ID or filename
+            
+        Returns:
+            Workflow details
+        """),
+)
+
+
+def _endpoint(name: str, method: str, path: str, params: Dict[str, Any], returns: Any, doc: str):
+    """
+    Build a client method for one ENDPOINTS entry
+    
+    The parameters become the method's signature, in order, and must match
+    the path's placeholders. The method is compiled from the same source as
+    a hand-written wrapper (an f-string of the path passed to _request), so
+    calls cost no more than one and bind their arguments natively.
+    """
+    fields = {field for _, field, _, _ in string.Formatter().parse(path) if field}
+    if fields != params.keys() or not all(field.isidentifier() for field in fields):
+        raise ValueError(f"{name}: parameters {list(params)} do not match path {path!r}")
+    source = (
+        f"async def {name}(self{''.join(', ' + field for field in params)}):\n"
+        f"    return await self._request({method!r}, f{path!r})\n"
+    )
+    namespace = {}
+    exec(compile(source, f'<endpoint {name}>', 'exec'), namespace)
+    call = namespace[name]
+    call.__qualname__ = f'GitHubAPI.{name}'
+    call.__module__ = __name__
+    call.__doc__ = inspect.cleandoc(doc)
+    call.__annotations__ = {**params, 'return': returns}
+    return call
+
 
 class GitHubAPI:
     """
     Python client for GitHub Enterprise Cloud API
     Based on API version 2022-11-28
+
+    All API methods are coroutines, so independent calls can run
+    concurrently with asyncio.gather(). Use the client as an async
+    context manager (or call aclose()) to release its connections.
     """
     
-    def __init__(self, token: str, base_url: str = "https://api.github.com"):
+    def __init__(self, token: str, base_url: str = "https://api.github.com",
+                 max_concurrency: int = 10, http2: bool = False):
         """
         Initialize the GitHub API client
         
         Args:
             token: GitHub personal access token
             base_url: API base URL (default: https://api.github.com)
+            max_concurrency: Maximum requests in flight at once, kept low
+                to stay clear of GitHub's secondary rate limits
+            http2: Multiplex requests over a single HTTP/2 connection
+                (requires the h2 package, e.g. pip install httpx[http2])
         """
         self.token = token
         self.base_url = base_url.rstrip('/')
@@ -23,10 +219,147 @@ class GitHubAPI:
             'Accept': 'application/vnd.github+json',
             'X-GitHub-Api-Version': '2022-11-28'
         }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # Over HTTP/2 one connection carries every concurrent stream, so the
+        # connection limits only matter for the HTTP/1.1 fallback
+        self.client = httpx.AsyncClient(
+            headers=self.headers,
+            http2=http2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Pending GET/HEAD calls, so concurrent duplicates share one request
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        # (endpoint, params, headers) -> (etag, parsed body, links), least recently used first
+        self._etag_cache: OrderedDict = OrderedDict()
+        # Last seen rate-limit window, shared by all concurrent requests
+        self._rl_lock = asyncio.Lock()
+        self._rl_remaining: Optional[int] = None
+        self._rl_reset = 0.0
+
+    async def __aenter__(self) -> "GitHubAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its connections"""
+        await self.client.aclose()
+
+    async def _send(self, method: str, endpoint: str, data: Optional[Dict] = None, 
+                    params: Optional[Dict] = None, headers: Optional[Dict] = None) -> httpx.Response:
+        """
+        Send a request to the GitHub API and return the raw response
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, PATCH, DELETE)
+            endpoint: API endpoint (e.g., /repos/{owner}/{repo})
+            data: Request body data for POST, PUT, PATCH requests
+            params: URL parameters
+            headers: Additional headers
+            
+        Returns:
+            Successful httpx response
+        """
+        url = f"{self.base_url}{endpoint}"
+            
+        try:
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                await self._await_rate_limit()
+                
+                # Only the network call holds a slot, so a request waiting
+                # out the rate limit does not block others
+                async with self._semaphore:
+                    response = await self.client.request(
+                        method=method,
+                        url=url,
+                        json=data if data else None,
+                        params=params,
+                        # The client already carries self.headers and
+                        # merges any per-call overrides into them
+                        headers=headers
+                    )
+                await self._update_rate_limit(response)
+                
+                wait_time = self._rate_limit_wait(response)
+                if wait_time is None or attempt == MAX_RATE_LIMIT_RETRIES:
+                    break
+                # Exponential backoff with jitter so concurrent callers
+                # do not all retry at the same instant
+                wait_time = max(wait_time, 2 ** attempt) + random.uniform(0, 1)
+                print(f"Rate limit exceeded. Waiting for {wait_time:.1f} seconds...")
+                await asyncio.sleep(wait_time)
+                
+            # 304 is the expected answer to a conditional GET
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
+            
+        except httpx.HTTPStatusError as e:
+            raise self._api_error(e)
+        except httpx.HTTPError as e:
+            raise Exception(f"GitHub API Error: {str(e)}")
+    
+    @staticmethod
+    def _api_error(e: httpx.HTTPStatusError) -> Exception:
+        """Build the client's exception for an error response"""
+        # Try to get error details from response
+        try:
+            error_data = e.response.json()
+        except ValueError:
+            return Exception(f"GitHub API Error: {str(e)}")
+        return Exception(f"GitHub API Error: {e.response.status_code} - {error_data.get('message', str(e))}")
+    
+    async def _await_rate_limit(self) -> None:
+        """Sleep until the rate-limit window resets if it is exhausted"""
+        async with self._rl_lock:
+            if self._rl_remaining is None or self._rl_remaining > RATE_LIMIT_FLOOR:
+                return
+            wait_time = self._rl_reset - time.time()
+            if wait_time <= 0:
+                self._rl_remaining = None
+                return
+        print(f"Rate limit exhausted. Waiting for {wait_time:.1f} seconds...")
+        await asyncio.sleep(wait_time)
+    
+    async def _update_rate_limit(self, response: httpx.Response) -> None:
+        """Record the rate-limit window reported by a response"""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        async with self._rl_lock:
+            self._rl_remaining = int(remaining)
+            self._rl_reset = float(reset)
+    
+    @staticmethod
+    def _rate_limit_wait(response: httpx.Response) -> Optional[float]:
+        """
+        Work out how long to wait before retrying a rate-limited response
         
-    def _request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
+        Returns:
+            Seconds to wait, or None if the response was not rate limited
+        """
+        if response.status_code not in (403, 429):
+            return None
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            # Secondary rate limits say how long to back off, in seconds or
+            # as an HTTP date
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                try:
+                    return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+                except (TypeError, ValueError):
+                    pass
+        if response.status_code == 429 or response.headers.get('X-RateLimit-Remaining') == '0':
+            reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+            return max(reset_time - time.time(), 0) + 1
+        return None
+    
+    async def _request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
                 params: Optional[Dict] = None, headers: Optional[Dict] = None) -> Any:
         """
         Make a request to the GitHub API
@@ -41,49 +374,84 @@ class GitHubAPI:
         Returns:
             API response (parsed JSON or None for 204 responses)
         """
-        url = f"{self.base_url}{endpoint}"
-        request_headers = self.headers.copy()
-        
-        if headers:
-            request_headers.update(headers)
+        if method not in ('GET', 'HEAD'):
+            return await self._fetch(method, endpoint, data, params, headers)
             
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data if data else None,
-                params=params,
-                headers=request_headers
-            )
+        # Headers such as Accept change the body, so they are part of the key
+        key = (method, endpoint,
+               frozenset(params.items()) if params else frozenset(),
+               frozenset(headers.items()) if headers else frozenset())
+        task = self._inflight.get(key)
+        if task is None:
+            # The fetch runs as its own task so that cancelling whichever
+            # caller started it does not cancel the others sharing it
+            task = asyncio.ensure_future(self._fetch(method, endpoint, data, params, headers))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        return await asyncio.shield(task)
+    
+    def _forget_inflight(self, key: tuple, task: asyncio.Future) -> None:
+        """Drop a finished request from the in-flight table"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved when every caller was cancelled
+            task.exception()
+    
+    async def _fetch(self, method: str, endpoint: str, data: Optional[Dict] = None, 
+                     params: Optional[Dict] = None, headers: Optional[Dict] = None) -> Any:
+        """Send a request and decode its JSON body (None for 204 responses)"""
+        if method == 'GET':
+            body, _ = await self._cached_get(endpoint, params, headers)
+            return body
             
-            # Handle rate limiting
-            if response.status_code == 429:
-                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                wait_time = max(reset_time - time.time(), 0) + 1
-                print(f"Rate limit exceeded. Waiting for {wait_time:.1f} seconds...")
-                time.sleep(wait_time)
-                return self._request(method, endpoint, data, params, headers)
-                
-            response.raise_for_status()
+        response = await self._send(method, endpoint, data, params, headers)
+        
+        # Return None for 204 No Content responses
+        if response.status_code == 204 or not response.content:
+            return None
             
-            # Return None for 204 No Content responses
-            if response.status_code == 204:
-                return None
-                
-            return response.json()
+        return json_loads(response.content)
+    
+    async def _cached_get(self, endpoint: str, params: Optional[Dict] = None,
+                          headers: Optional[Dict] = None) -> tuple:
+        """
+        Make a conditional GET, reusing the cached body on 304 Not Modified
+        
+        Returns:
+            Tuple of the parsed JSON body and the response's Link relations
+        """
+        key = (endpoint,
+               frozenset(params.items()) if params else frozenset(),
+               frozenset(headers.items()) if headers else frozenset())
+        cached = self._etag_cache.get(key)
+        if cached:
+            # Copy only when adding the validator, so plain GETs allocate nothing
+            headers = {**headers, 'If-None-Match': cached[0]} if headers else {'If-None-Match': cached[0]}
             
-        except requests.exceptions.RequestException as e:
-            # Try to get error details from response
-            try:
-                error_data = e.response.json()
-                raise Exception(f"GitHub API Error: {e.response.status_code} - {error_data.get('message', str(e))}")
-            except (ValueError, AttributeError):
-                raise Exception(f"GitHub API Error: {str(e)}")
+        response = await self._send('GET', endpoint, params=params, headers=headers)
+        
+        if response.status_code == 304 and cached:
+            self._etag_cache.move_to_end(key)
+            return cached[1], cached[2]
+            
+        body = json_loads(response.content) if response.content else None
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etag_cache[key] = (etag, body, response.links)
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > ETAG_CACHE_MAXSIZE:
+                self._etag_cache.popitem(last=False)
+        return body, response.links
     
-    def paginate(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict]:
+    async def paginate(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict]:
         """
         Automatically handle pagination for list endpoints
         
+        The first page's Link header names the last page, so the remaining
+        pages are requested concurrently. Servers that omit the header are
+        paged sequentially until a short page comes back.
+        
         Args:
             endpoint: API endpoint
             params: URL parameters
@@ -91,29 +459,148 @@ class GitHubAPI:
         Returns:
             List of all items across all pages
         """
-        all_items = []
-        params = params or {}
+        params = dict(params or {})
         params['per_page'] = params.get('per_page', 100)
-        page = 1
+        params['page'] = 1
         
-        while True:
-            params['page'] = page
-            response = self._request('GET', endpoint, params=params)
+        items, links = await self._cached_get(endpoint, params)
+        if not items or not isinstance(items, list):
+            return []
+        all_items = list(items)
+        
+        last = links.get('last')
+        if last:
+            last_page = int(parse_qs(urlparse(last['url']).query)['page'][0])
+            pages = await asyncio.gather(*(
+                self._request('GET', endpoint, params={**params, 'page': page})
+                for page in range(2, last_page + 1)
+            ))
+            for items in pages:
+                if items and isinstance(items, list):
+                    all_items.extend(items)
+            return all_items
+        
+        page = 1
+        while len(items) == params['per_page']:
+            page += 1
+            items = await self._request('GET', endpoint, params={**params, 'page': page})
             
-            if not response or not isinstance(response, list) or len(response) == 0:
+            if not items or not isinstance(items, list):
                 break
                 
-            all_items.extend(response)
+            all_items.extend(items)
             
-            if len(response) < params['per_page']:
-                break
+        return all_items
+    
+    async def iter_paginated(self, endpoint: str, params: Optional[Dict] = None) -> AsyncIterator[Dict]:
+        """
+        Iterate over a list endpoint one page at a time
+        
+        Only the current page is held in memory, and the next page is
+        requested while the caller works through the current one. Breaking
+        out of the loop early cancels the pending request.
+        
+        Args:
+            endpoint: API endpoint
+            params: URL parameters
+            
+        Yields:
+            Items across all pages, in order
+        """
+        params = dict(params or {})
+        params['per_page'] = params.get('per_page', 100)
+        page = 1
+        pending = asyncio.ensure_future(self._cached_get(endpoint, {**params, 'page': page}))
+        
+        try:
+            while pending:
+                items, links = await pending
+                pending = None
                 
-            page += 1
+                if not items or not isinstance(items, list):
+                    return
+                    
+                # Trust the Link header when the server sends one
+                has_next = 'next' in links if links else len(items) == params['per_page']
+                if has_next:
+                    page += 1
+                    pending = asyncio.ensure_future(
+                        self._cached_get(endpoint, {**params, 'page': page}))
+                    
+                for item in items:
+                    yield item
+        finally:
+            if pending and not pending.done():
+                pending.cancel()
+        
+    async def iter_field(self, endpoint: str, field: str, params: Optional[Dict] = None) -> AsyncIterator[Any]:
+        """
+        Stream a single field from every item of a list endpoint
+        
+        Each page is parsed incrementally and only the requested field is
+        built into a Python object, so counting members or collecting logins
+        does not materialize the full item dicts. Falls back to decoding the
+        whole page when ijson is not installed.
+        
+        Args:
+            endpoint: API endpoint
+            field: Item key to extract, dotted for nested keys (e.g. owner.login)
+            params: URL parameters
             
-        return all_items
+        Yields:
+            The field's value for each item, in order
+        """
+        url = f"{self.base_url}{endpoint}"
+        params = dict(params or {})
+        params['per_page'] = params.get('per_page', 100)
+        page = 1
+        
+        while True:
+            params['page'] = page
+            count = 0
+            await self._await_rate_limit()
+            
+            try:
+                # The connection stays open while the caller consumes the
+                # page, so streams do not take a concurrency slot
+                async with self.client.stream('GET', url, params=params) as response:
+                    await self._update_rate_limit(response)
+                    if response.is_error:
+                        await response.aread()
+                        response.raise_for_status()
+                    links = response.links
+                    
+                    if ijson is None:
+                        for item in json_loads(await response.aread()) or []:
+                            for key in field.split('.'):
+                                item = item[key]
+                            count += 1
+                            yield item
+                    else:
+                        values = ijson.sendable_list()
+                        parser = ijson.items_coro(values, f'item.{field}', use_float=True)
+                        async for chunk in response.aiter_bytes():
+                            parser.send(chunk)
+                            for value in values:
+                                count += 1
+                                yield value
+                            del values[:]
+                        parser.close()
+                        for value in values:
+                            count += 1
+                            yield value
+            except httpx.HTTPStatusError as e:
+                raise self._api_error(e)
+            except httpx.HTTPError as e:
+                raise Exception(f"GitHub API Error: {str(e)}")
+                
+            has_next = 'next' in links if links else count == params['per_page']
+            if not has_next:
+                return
+            page += 1
         
     # Repository operations
-    def list_repositories(self, org: str, type: str = 'all', sort: str = 'updated', 
+    async def list_repositories(self, org: str, type: str = 'all', sort: str = 'updated', 
                          direction: str = 'desc') -> List[Dict]:
         """
         List repositories for an organization
@@ -132,22 +619,24 @@ class GitHubAPI:
             'sort': sort,
             'direction': direction
         }
-        return self.paginate(f'/orgs/{org}/repos', params)
+        return await self.paginate(f'/orgs/{org}/repos', params)
     
-    def get_repository(self, owner: str, repo: str) -> Dict:
+    async def iter_repositories(self, org: str, type: str = 'all', sort: str = 'updated',
+                                direction: str = 'desc') -> AsyncIterator[Dict]:
         """
-        Get a repository
+        Iterate over repositories for an organization without loading them all
         
-        Args:
-            owner: Repository owner (user or organization)
-            repo: Repository name
-            
-        Returns:
-            Repository details
+        Takes the same arguments as list_repositories.
         """
-        return self._request('GET', f'/repos/{owner}/{repo}')
+        params = {
+            'type': type,
+            'sort': sort,
+            'direction': direction
+        }
+        async for repo in self.iter_paginated(f'/orgs/{org}/repos', params):
+            yield repo
     
-    def create_repository(self, name: str, org: Optional[str] = None, **kwargs) -> Dict:
+    async def create_repository(self, name: str, org: Optional[str] = None, **kwargs) -> Dict:
         """
         Create a repository
         
@@ -177,11 +666,11 @@ class GitHubAPI:
         data = {'name': name, **kwargs}
         
         if org:
-            return self._request('POST', f'/orgs/{org}/repos', data=data)
+            return await self._request('POST', f'/orgs/{org}/repos', data=data)
         else:
-            return self._request('POST', '/user/repos', data=data)
+            return await self._request('POST', '/user/repos', data=data)
     
-    def update_repository(self, owner: str, repo: str, **kwargs) -> Dict:
+    async def update_repository(self, owner: str, repo: str, **kwargs) -> Dict:
         """
         Update a repository
         
@@ -193,20 +682,10 @@ class GitHubAPI:
         Returns:
             Updated repository details
         """
-        return self._request('PATCH', f'/repos/{owner}/{repo}', data=kwargs)
-    
-    def delete_repository(self, owner: str, repo: str) -> None:
-        """
-        Delete a repository
-        
-        Args:
-            owner: Repository owner
-            repo: Repository name
-        """
-        return self._request('DELETE', f'/repos/{owner}/{repo}')
+        return await self._request('PATCH', f'/repos/{owner}/{repo}', data=kwargs)
     
     # Branch operations
-    def list_branches(self, owner: str, repo: str, protected: Optional[bool] = None) -> List[Dict]:
+    async def list_branches(self, owner: str, repo: str, protected: Optional[bool] = None) -> List[Dict]:
         """
         List branches for a repository
         
@@ -222,24 +701,10 @@ class GitHubAPI:
         if protected is not None:
             params['protected'] = str(protected).lower()
             
-        return self.paginate(f'/repos/{owner}/{repo}/branches', params)
-    
-    def get_branch(self, owner: str, repo: str, branch: str) -> Dict:
-        """
-        Get a branch
-        
-        Args:
-            owner: Repository owner
-            repo: Repository name
-            branch: Branch name
-            
-        Returns:
-            Branch details
-        """
-        return self._request('GET', f'/repos/{owner}/{repo}/branches/{branch}')
+        return await self.paginate(f'/repos/{owner}/{repo}/branches', params)
     
     # Issue operations
-    def list_issues(self, owner: str, repo: str, state: str = 'open', 
+    async def list_issues(self, owner: str, repo: str, state: str = 'open', 
                    sort: str = 'created', direction: str = 'desc') -> List[Dict]:
         """
         List issues for a repository
@@ -259,23 +724,24 @@ class GitHubAPI:
             'sort': sort,
             'direction': direction
         }
-        return self.paginate(f'/repos/{owner}/{repo}/issues', params)
+        return await self.paginate(f'/repos/{owner}/{repo}/issues', params)
     
-    def get_issue(self, owner: str, repo: str, issue_number: int) -> Dict:
+    async def iter_issues(self, owner: str, repo: str, state: str = 'open',
+                          sort: str = 'created', direction: str = 'desc') -> AsyncIterator[Dict]:
         """
-        Get an issue
+        Iterate over issues for a repository without loading them all
         
-        Args:
-            owner: Repository owner
-            repo: Repository name
-            issue_number: Issue number
-            
-        Returns:
-            Issue details
+        Takes the same arguments as list_issues.
         """
-        return self._request('GET', f'/repos/{owner}/{repo}/issues/{issue_number}')
+        params = {
+            'state': state,
+            'sort': sort,
+            'direction': direction
+        }
+        async for issue in self.iter_paginated(f'/repos/{owner}/{repo}/issues', params):
+            yield issue
     
-    def create_issue(self, owner: str, repo: str, title: str, body: Optional[str] = None, **kwargs) -> Dict:
+    async def create_issue(self, owner: str, repo: str, title: str, body: Optional[str] = None, **kwargs) -> Dict:
         """
         Create an issue
         
@@ -296,9 +762,9 @@ class GitHubAPI:
         if body:
             data['body'] = body
             
-        return self._request('POST', f'/repos/{owner}/{repo}/issues', data=data)
+        return await self._request('POST', f'/repos/{owner}/{repo}/issues', data=data)
     
-    def update_issue(self, owner: str, repo: str, issue_number: int, **kwargs) -> Dict:
+    async def update_issue(self, owner: str, repo: str, issue_number: int, **kwargs) -> Dict:
         """
         Update an issue
         
@@ -311,10 +777,10 @@ class GitHubAPI:
         Returns:
             Updated issue details
         """
-        return self._request('PATCH', f'/repos/{owner}/{repo}/issues/{issue_number}', data=kwargs)
+        return await self._request('PATCH', f'/repos/{owner}/{repo}/issues/{issue_number}', data=kwargs)
     
     # Pull request operations
-    def list_pull_requests(self, owner: str, repo: str, state: str = 'open',
+    async def list_pull_requests(self, owner: str, repo: str, state: str = 'open',
                           sort: str = 'created', direction: str = 'desc') -> List[Dict]:
         """
         List pull requests for a repository
@@ -334,23 +800,24 @@ class GitHubAPI:
             'sort': sort,
             'direction': direction
         }
-        return self.paginate(f'/repos/{owner}/{repo}/pulls', params)
+        return await self.paginate(f'/repos/{owner}/{repo}/pulls', params)
     
-    def get_pull_request(self, owner: str, repo: str, pull_number: int) -> Dict:
+    async def iter_pull_requests(self, owner: str, repo: str, state: str = 'open',
+                                 sort: str = 'created', direction: str = 'desc') -> AsyncIterator[Dict]:
         """
-        Get a pull request
+        Iterate over pull requests for a repository without loading them all
         
-        Args:
-            owner: Repository owner
-            repo: Repository name
-            pull_number: Pull request number
-            
-        Returns:
-            Pull request details
+        Takes the same arguments as list_pull_requests.
         """
-        return self._request('GET', f'/repos/{owner}/{repo}/pulls/{pull_number}')
+        params = {
+            'state': state,
+            'sort': sort,
+            'direction': direction
+        }
+        async for pr in self.iter_paginated(f'/repos/{owner}/{repo}/pulls', params):
+            yield pr
     
-    def create_pull_request(self, owner: str, repo: str, title: str, head: str, base: str, 
+    async def create_pull_request(self, owner: str, repo: str, title: str, head: str, base: str, 
                            body: Optional[str] = None, **kwargs) -> Dict:
         """
         Create a pull request
@@ -378,9 +845,9 @@ class GitHubAPI:
         if body:
             data['body'] = body
             
-        return self._request('POST', f'/repos/{owner}/{repo}/pulls', data=data)
+        return await self._request('POST', f'/repos/{owner}/{repo}/pulls', data=data)
     
-    def update_pull_request(self, owner: str, repo: str, pull_number: int, **kwargs) -> Dict:
+    async def update_pull_request(self, owner: str, repo: str, pull_number: int, **kwargs) -> Dict:
         """
         Update a pull request
         
@@ -393,9 +860,9 @@ class GitHubAPI:
         Returns:
             Updated pull request details
         """
-        return self._request('PATCH', f'/repos/{owner}/{repo}/pulls/{pull_number}', data=kwargs)
+        return await self._request('PATCH', f'/repos/{owner}/{repo}/pulls/{pull_number}', data=kwargs)
     
-    def merge_pull_request(self, owner: str, repo: str, pull_number: int, 
+    async def merge_pull_request(self, owner: str, repo: str, pull_number: int, 
                           commit_message: Optional[str] = None, 
                           merge_method: str = 'merge') -> Dict:
         """
@@ -415,46 +882,39 @@ class GitHubAPI:
         if commit_message:
             data['commit_message'] = commit_message
             
-        return self._request('PUT', f'/repos/{owner}/{repo}/pulls/{pull_number}/merge', data=data)
+        return await self._request('PUT', f'/repos/{owner}/{repo}/pulls/{pull_number}/merge', data=data)
     
     # Organization operations
-    def list_organizations(self) -> List[Dict]:
+    async def list_organizations(self) -> List[Dict]:
         """
         List organizations for the authenticated user
         
         Returns:
             List of organizations
         """
-        return self.paginate('/user/orgs')
+        return await self.paginate('/user/orgs')
     
-    def get_organization(self, org: str) -> Dict:
-        """
-        Get an organization
-        
-        Args:
-            org: Organization name
-            
-        Returns:
-            Organization details
-        """
-        return self._request('GET', f'/orgs/{org}')
-    
-    def list_organization_members(self, org: str, role: str = 'all') -> List[Dict]:
+    async def list_organization_members(self, org: str, role: str = 'all',
+                                        only: Optional[str] = None) -> List[Any]:
         """
         List members of an organization
         
         Args:
             org: Organization name
             role: Filter by role (all, admin, member)
+            only: Return just this field of each member (e.g. 'login'),
+                streamed without building the full member objects
             
         Returns:
-            List of organization members
+            List of organization members, or of their `only` field values
         """
         params = {'role': role}
-        return self.paginate(f'/orgs/{org}/members', params)
+        if only:
+            return [value async for value in self.iter_field(f'/orgs/{org}/members', only, params)]
+        return await self.paginate(f'/orgs/{org}/members', params)
     
     # Team operations
-    def list_teams(self, org: str) -> List[Dict]:
+    async def list_teams(self, org: str) -> List[Dict]:
         """
         List teams in an organization
         
@@ -464,22 +924,9 @@ class GitHubAPI:
         Returns:
             List of teams
         """
-        return self.paginate(f'/orgs/{org}/teams')
+        return await self.paginate(f'/orgs/{org}/teams')
     
-    def get_team(self, org: str, team_slug: str) -> Dict:
-        """
-        Get a team
-        
-        Args:
-            org: Organization name
-            team_slug: Team slug
-            
-        Returns:
-            Team details
-        """
-        return self._request('GET', f'/orgs/{org}/teams/{team_slug}')
-    
-    def list_team_members(self, org: str, team_slug: str, role: str = 'all') -> List[Dict]:
+    async def list_team_members(self, org: str, team_slug: str, role: str = 'all') -> List[Dict]:
         """
         List members of a team
         
@@ -492,59 +939,10 @@ class GitHubAPI:
             List of team members
         """
         params = {'role': role}
-        return self.paginate(f'/orgs/{org}/teams/{team_slug}/members', params)
-    
-    # User operations
-    def get_authenticated_user(self) -> Dict:
-        """
-        Get the authenticated user
-        
-        Returns:
-            User details
-        """
-        return self._request('GET', '/user')
-    
-    def get_user(self, username: str) -> Dict:
-        """
-        Get a user
-        
-        Args:
-            username: Username
-            
-        Returns:
-            User details
-        """
-        return self._request('GET', f'/users/{username}')
+        return await self.paginate(f'/orgs/{org}/teams/{team_slug}/members', params)
     
     # Workflow operations
-    def list_workflows(self, owner: str, repo: str) -> Dict:
-        """
-        List workflows in a repository
-        
-        Args:
-            owner: Repository owner
-            repo: Repository name
-            
-        Returns:
-            List of workflows
-        """
-        return self._request('GET', f'/repos/{owner}/{repo}/actions/workflows')
-    
-    def get_workflow(self, owner: str, repo: str, workflow_id: Union[int, str]) -> Dict:
-        """
-        Get a workflow
-        
-        Args:
-            owner: Repository owner
-            repo: Repository name
-            workflow_id: Workflow ID or filename
-            
-        Returns:
-            Workflow details
-        """
-        return self._request('GET', f'/repos/{owner}/{repo}/actions/workflows/{workflow_id}')
-    
-    def list_workflow_runs(self, owner: str, repo: str, workflow_id: Union[int, str],
+    async def list_workflow_runs(self, owner: str, repo: str, workflow_id: Union[int, str],
                           status: Optional[str] = None) -> Dict:
         """
         List workflow runs
@@ -562,10 +960,10 @@ class GitHubAPI:
         if status:
             params['status'] = status
             
-        return self._request('GET', f'/repos/{owner}/{repo}/actions/workflows/{workflow_id}/runs', params=params)
+        return await self._request('GET', f'/repos/{owner}/{repo}/actions/workflows/{workflow_id}/runs', params=params)
     
     # Content operations
-    def get_content(self, owner: str, repo: str, path: str, ref: Optional[str] = None) -> Dict:
+    async def get_content(self, owner: str, repo: str, path: str, ref: Optional[str] = None) -> Dict:
         """
         Get repository content
         
@@ -582,9 +980,9 @@ class GitHubAPI:
         if ref:
             params['ref'] = ref
             
-        return self._request('GET', f'/repos/{owner}/{repo}/contents/{path}', params=params)
+        return await self._request('GET', f'/repos/{owner}/{repo}/contents/{path}', params=params)
     
-    def create_or_update_file(self, owner: str, repo: str, path: str, message: str, 
+    async def create_or_update_file(self, owner: str, repo: str, path: str, message: str, 
                              content: str, branch: Optional[str] = None,
                              sha: Optional[str] = None) -> Dict:
         """
@@ -613,67 +1011,146 @@ class GitHubAPI:
         if sha:
             data['sha'] = sha
             
-        return self._request('PUT', f'/repos/{owner}/{repo}/contents/{path}', data=data)
+        return await self._request('PUT', f'/repos/{owner}/{repo}/contents/{path}', data=data)
+    
+    # GraphQL operations
+    async def graphql(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """
+        Run a query against the GraphQL API
+        
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+            
+        Returns:
+            The response's data object
+        """
+        payload = await self._request('POST', '/graphql',
+                                      data={'query': query, 'variables': variables or {}})
+        if payload.get('errors'):
+            raise Exception(f"GitHub API Error: {payload['errors'][0]['message']}")
+        return payload['data']
+    
+    async def get_repository_bundle(self, owner: str, repo: str) -> Dict:
+        """
+        Get a repository with its open issues and pull requests in one request
+        
+        Replaces separate get_repository, list_issues and list_pull_requests
+        calls. Only the first 100 issues and pull requests are returned, and
+        each object carries a subset of the REST fields under the same names.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            
+        Returns:
+            Dict with 'repository', 'issues' and 'pull_requests' keys
+        """
+        data = await self.graphql(REPOSITORY_BUNDLE_QUERY, {'owner': owner, 'repo': repo})
+        node = data['repository']
+        
+        def user(author: Optional[Dict]) -> Optional[Dict]:
+            return {'login': author['login']} if author else None
+        
+        repository = {
+            'name': node['name'],
+            'full_name': node['nameWithOwner'],
+            'description': node['description'],
+            'html_url': node['url'],
+            'private': node['isPrivate'],
+            'stargazers_count': node['stargazerCount'],
+            'forks_count': node['forkCount'],
+            'default_branch': (node['defaultBranchRef'] or {}).get('name')
+        }
+        issues = [{
+            'number': issue['number'],
+            'title': issue['title'],
+            'state': issue['state'].lower(),
+            'html_url': issue['url'],
+            'created_at': issue['createdAt'],
+            'user': user(issue['author'])
+        } for issue in node['issues']['nodes']]
+        pull_requests = [{
+            'number': pr['number'],
+            'title': pr['title'],
+            'state': 'open' if pr['state'] == 'OPEN' else 'closed',
+            'html_url': pr['url'],
+            'created_at': pr['createdAt'],
+            'draft': pr['isDraft'],
+            'user': user(pr['author']),
+            'head': {'ref': pr['headRefName']},
+            'base': {'ref': pr['baseRefName']}
+        } for pr in node['pullRequests']['nodes']]
+        
+        return {
+            'repository': repository,
+            'issues': issues,
+            'pull_requests': pull_requests
+        }
+
+
+for _entry in ENDPOINTS:
+    setattr(GitHubAPI, _entry[0], _endpoint(*_entry))
+del _entry
 
 
 # Example usage
-def example_usage():
+async def example_usage():
     """Example usage of the GitHub API client"""
     
     # Create a GitHub API client
-    github = GitHubAPI("your_personal_access_token")
-    
-    try:
-        # Get authenticated user info
-        user = github.get_authenticated_user()
-        print(f"Authenticated as: {user['login']}")
-        
-        # Get a specific repository
-        repo = github.get_repository("octocat", "hello-world")
-        print(f"Repository: {repo['full_name']}")
-        print(f"Description: {repo['description']}")
-        print(f"Stars: {repo['stargazers_count']}")
-        
-        # List organization repositories
-        repos = github.list_repositories("github")
-        print(f"Found {len(repos)} repositories in the 'github' organization")
-        
-        # Create a new repository
-        new_repo = github.create_repository(
-            name="test-repo",
-            org="your-organization",
-            description="A test repository",
-            private=True,
-            has_issues=True,
-            has_wiki=True
-        )
-        print(f"Created new repository: {new_repo['html_url']}")
-        
-        # Create an issue
-        issue = github.create_issue(
-            owner="your-organization",
-            repo="test-repo",
-            title="Test issue",
-            body="This is a test issue created via the API",
-            labels=["bug", "documentation"]
-        )
-        print(f"Created issue #{issue['number']}: {issue['title']}")
-        
-        # Create a pull request
-        pr = github.create_pull_request(
-            owner="your-organization",
-            repo="test-repo",
-            title="Add new feature",
-            head="feature-branch",
-            base="main",
-            body="This pull request adds an awesome new feature",
-            draft=False
-        )
-        print(f"Created PR #{pr['number']}: {pr['title']}")
-        
-    except Exception as e:
-        print(f"Error: {str(e)}")
+    async with GitHubAPI("your_personal_access_token") as github:
+        try:
+            # Get authenticated user info
+            user = await github.get_authenticated_user()
+            print(f"Authenticated as: {user['login']}")
+            
+            # Independent calls can run concurrently
+            repo, repos = await asyncio.gather(
+                github.get_repository("octocat", "hello-world"),
+                github.list_repositories("github")
+            )
+            print(f"Repository: {repo['full_name']}")
+            print(f"Description: {repo['description']}")
+            print(f"Stars: {repo['stargazers_count']}")
+            print(f"Found {len(repos)} repositories in the 'github' organization")
+            
+            # Create a new repository
+            new_repo = await github.create_repository(
+                name="test-repo",
+                org="your-organization",
+                description="A test repository",
+                private=True,
+                has_issues=True,
+                has_wiki=True
+            )
+            print(f"Created new repository: {new_repo['html_url']}")
+            
+            # Create an issue
+            issue = await github.create_issue(
+                owner="your-organization",
+                repo="test-repo",
+                title="Test issue",
+                body="This is a test issue created via the API",
+                labels=["bug", "documentation"]
+            )
+            print(f"Created issue #{issue['number']}: {issue['title']}")
+            
+            # Create a pull request
+            pr = await github.create_pull_request(
+                owner="your-organization",
+                repo="test-repo",
+                title="Add new feature",
+                head="feature-branch",
+                base="main",
+                body="This pull request adds an awesome new feature",
+                draft=False
+            )
+            print(f"Created PR #{pr['number']}: {pr['title']}")
+            
+        except Exception as e:
+            print(f"Error: {str(e)}")
 
 
 if __name__ == "__main__":
-    example_usage()
\ No newline at end of file
+    asyncio.run(example_usage())
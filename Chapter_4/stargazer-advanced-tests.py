@@ -1,25 +1,70 @@
+import inspect
+import io
 import unittest
-from unittest.mock import patch, Mock, MagicMock
+from unittest.mock import patch, Mock, AsyncMock
 import json
+import time
+from email.utils import formatdate
 import requests
-from datetime import datetime
 
 # Import the classes we want to test
 # Note: You'll need to adjust this import to match your actual file structure
+import stargazers_advanced
 from stargazers_advanced import GitHubAPIClient, GitHubStarsClient
 
+_HTTPError = requests.exceptions.HTTPError
+_ConnError = requests.exceptions.ConnectionError
+
+# Star history pages shared by the pagination tests: a full first page of
+# five stars followed by a partial second page
+_PAGE1 = tuple({"user": {"login": f"user{i}"}, "starred_at": f"2023-01-0{i}T00:00:00Z"} for i in range(1, 6))
+_PAGE2 = tuple({"user": {"login": f"user{i}"}, "starred_at": f"2023-01-0{i}T00:00:00Z"} for i in range(6, 8))
+
+
+def _resp(status, payload=None, headers=None):
+    """Build a mock HTTP response with the given status and JSON payload."""
+    response = Mock(spec=requests.Response)
+    response.status_code = status
+    response.content = json.dumps(payload).encode() if payload is not None else b''
+    response.json.return_value = payload
+    response.headers = headers or {}
+    return response
+
+
+def _http_response(status, payload=None, headers=None, stream=False):
+    """Build a real requests.Response as a transport adapter would return it."""
+    response = requests.Response()
+    response.status_code = status
+    body = json.dumps(payload).encode() if payload is not None else b''
+    if stream:
+        # Leave the body unread on the raw stream, as with stream=True
+        response.raw = io.BytesIO(body)
+    else:
+        response._content = body
+    response.headers.update(headers or {})
+    response.encoding = 'utf-8'
+    return response
+
+
 class TestGitHubStarsClient(unittest.TestCase):
     """Test cases for the GitHubStarsClient class."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.base_url = "https://api.github.com"
-        self.api_key = "test_api_key"
-        self.client = GitHubStarsClient(self.base_url, self.api_key)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by every test method."""
+        cls.base_url = "https://api.github.com"
+        cls.api_key = "test_api_key"
+        # The methods under test are patched per test, so one client
+        # (and its requests.Session) can serve the whole class
+        cls.client = GitHubStarsClient(cls.base_url, cls.api_key)
         
         # Common test data
-        self.owner = "octocat"
-        self.repo = "hello-world"
+        cls.owner = "octocat"
+        cls.repo = "hello-world"
+        cls.repo_url = f"repos/{cls.owner}/{cls.repo}"
+        cls.stars_url = f"repos/{cls.owner}/{cls.repo}/stargazers"
+        cls.export_url = f"repos/{cls.owner}/{cls.repo}/stargazers/export"
+        cls.star_toggle_url = f"user/starred/{cls.owner}/{cls.repo}"
     
     @patch('stargazers_advanced.GitHubAPIClient.get')
     def test_list_repository_stars(self, mock_get):
@@ -36,7 +81,7 @@ class TestGitHubStarsClient(unittest.TestCase):
         
         # Assertions
         mock_get.assert_called_once_with(
-            f"repos/{self.owner}/{self.repo}/stargazers", 
+            self.stars_url, 
             params={'per_page': 10, 'page': 1}
         )
         self.assertEqual(result, mock_response)
@@ -49,7 +94,7 @@ class TestGitHubStarsClient(unittest.TestCase):
         
         # Assertions
         mock_put.assert_called_once_with(
-            f"user/starred/{self.owner}/{self.repo}", 
+            self.star_toggle_url, 
             data={}
         )
     
@@ -61,84 +106,61 @@ class TestGitHubStarsClient(unittest.TestCase):
         
         # Assertions
         mock_delete.assert_called_once_with(
-            f"user/starred/{self.owner}/{self.repo}"
+            self.star_toggle_url
         )
     
-    @patch('stargazers_advanced.GitHubAPIClient.get')
-    def test_check_starred_true(self, mock_get):
-        """Test checking if a repository is starred (true case)."""
-        # Mock response
-        mock_get.return_value = {}  # Just needs to not raise an exception
-        
-        # Call the method
-        result = self.client.check_starred(self.owner, self.repo)
-        
-        # Assertions
-        mock_get.assert_called_once_with(f"user/starred/{self.owner}/{self.repo}")
-        self.assertTrue(result)
-    
-    @patch('stargazers_advanced.GitHubAPIClient.get')
-    def test_check_starred_false(self, mock_get):
-        """Test checking if a repository is starred (false case)."""
-        # Mock response to raise 404
-        http_error = requests.exceptions.HTTPError()
-        response_mock = Mock()
-        response_mock.status_code = 404
-        http_error.response = response_mock
-        mock_get.side_effect = http_error
-        
-        # Call the method
-        result = self.client.check_starred(self.owner, self.repo)
-        
-        # Assertions
-        mock_get.assert_called_once_with(f"user/starred/{self.owner}/{self.repo}")
-        self.assertFalse(result)
+    @patch('stargazers_advanced.GitHubAPIClient.head')
+    def test_check_starred(self, mock_head):
+        """Test checking if a repository is starred."""
+        # A 204 means starred and a 404 not starred; only the status code is inspected
+        for expected, status in [(True, 204), (False, 404)]:
+            with self.subTest(expected=expected):
+                mock_head.reset_mock()
+                mock_head.return_value = status
+                
+                # Call the method
+                result = self.client.check_starred(self.owner, self.repo)
+                
+                # Assertions
+                mock_head.assert_called_once_with(self.star_toggle_url)
+                self.assertEqual(result, expected)
+        
+        # Any other status is an error
+        mock_head.return_value = 401
+        with self.assertRaises(_HTTPError):
+            self.client.check_starred(self.owner, self.repo)
     
     @patch('stargazers_advanced.GitHubAPIClient.get')
-    def test_list_starred_repositories_by_other_user(self, mock_get):
-        """Test listing repositories starred by another user."""
+    def test_list_starred_repositories(self, mock_get):
+        """Test listing repositories starred by another or the authenticated user."""
         # Mock data
-        username = "testuser"
         mock_response = [
             {"name": "repo1", "owner": {"login": "user1"}},
             {"name": "repo2", "owner": {"login": "user2"}}
         ]
         mock_get.return_value = mock_response
         
-        # Call the method
-        result = self.client.list_starred_repositories(
-            username=username, 
-            per_page=5, 
-            sort="updated", 
-            direction="desc"
-        )
-        
-        # Assertions
-        mock_get.assert_called_once_with(
-            f"users/{username}/starred", 
-            params={'per_page': 5, 'sort': 'updated', 'direction': 'desc'}
-        )
-        self.assertEqual(result, mock_response)
-    
-    @patch('stargazers_advanced.GitHubAPIClient.get')
-    def test_list_starred_repositories_by_authenticated_user(self, mock_get):
-        """Test listing repositories starred by the authenticated user."""
-        # Mock data
-        mock_response = [
-            {"name": "repo1", "owner": {"login": "user1"}},
-            {"name": "repo2", "owner": {"login": "user2"}}
+        cases = [
+            ("testuser", {'sort': 'updated', 'direction': 'desc'}, "users/testuser/starred"),
+            (None, {}, "user/starred")
         ]
-        mock_get.return_value = mock_response
-        
-        # Call the method
-        result = self.client.list_starred_repositories(per_page=5)
-        
-        # Assertions
-        mock_get.assert_called_once_with(
-            "user/starred", 
-            params={'per_page': 5}
-        )
-        self.assertEqual(result, mock_response)
+        for username, kwargs, expected_endpoint in cases:
+            with self.subTest(username=username):
+                mock_get.reset_mock()
+                
+                # Call the method
+                result = self.client.list_starred_repositories(
+                    username=username,
+                    per_page=5,
+                    **kwargs
+                )
+                
+                # Assertions
+                mock_get.assert_called_once_with(
+                    expected_endpoint, 
+                    params={'per_page': 5, **kwargs}
+                )
+                self.assertEqual(result, mock_response)
     
     @patch('stargazers_advanced.GitHubAPIClient.get')
     def test_get_star_count(self, mock_get):
@@ -150,64 +172,60 @@ class TestGitHubStarsClient(unittest.TestCase):
             "stargazers_count": 42
         }
         mock_get.return_value = mock_response
+        self.addCleanup(self.client._repo_cache.clear)
         
-        # Call the method
+        # Call the method twice; the second call is served from the cache
         result = self.client.get_star_count(self.owner, self.repo)
+        cached = self.client.get_star_count(self.owner, self.repo)
         
         # Assertions
-        mock_get.assert_called_once_with(f"repos/{self.owner}/{self.repo}")
+        mock_get.assert_called_once_with(self.repo_url)
         self.assertEqual(result, 42)
+        self.assertEqual(cached, 42)
     
     @patch('stargazers_advanced.GitHubAPIClient.get')
-    def test_get_star_history_single_page(self, mock_get):
-        """Test getting star history with only one page of results."""
-        # Mock data
-        mock_response = [
+    @patch('stargazers_advanced.GitHubAPIClient.get_page')
+    def test_get_star_history(self, mock_get_page, mock_get):
+        """Test getting star history with one page and with multiple pages of results."""
+        # One partial page
+        single = [
             {"user": {"login": "user1"}, "starred_at": "2023-01-01T00:00:00Z"},
             {"user": {"login": "user2"}, "starred_at": "2023-01-02T00:00:00Z"}
         ]
-        mock_get.return_value = mock_response
-        
-        # Call the method
-        result = self.client.get_star_history(self.owner, self.repo, per_page=10)
-        
-        # Assertions
-        mock_get.assert_called_once_with(
-            f"repos/{self.owner}/{self.repo}/stargazers",
-            params={'per_page': 10, 'page': 1},
-            headers={"Accept": "application/vnd.github.v3.star+json"}
-        )
-        self.assertEqual(result, mock_response)
-    
-    @patch('stargazers_advanced.GitHubAPIClient.get')
-    def test_get_star_history_multiple_pages(self, mock_get):
-        """Test getting star history with multiple pages of results."""
-        # Mock data for first page (full page)
-        page1 = [{"user": {"login": f"user{i}"}, "starred_at": f"2023-01-0{i}T00:00:00Z"} for i in range(1, 6)]
-        # Mock data for second page (partial page)
-        page2 = [{"user": {"login": f"user{i}"}, "starred_at": f"2023-01-0{i}T00:00:00Z"} for i in range(6, 8)]
+        last_link = {"last": {"url": f"https://api.github.com/{self.stars_url}?per_page=5&page=2", "rel": "last"}}
+        headers = {"Accept": "application/vnd.github.v3.star+json"}
         
-        # Set up the mock to return different values on successive calls
-        mock_get.side_effect = [page1, page2]
-        
-        # Call the method
-        result = self.client.get_star_history(self.owner, self.repo, per_page=5)
-        
-        # Assertions
-        expected_calls = [
-            unittest.mock.call(
-                f"repos/{self.owner}/{self.repo}/stargazers",
-                params={'per_page': 5, 'page': 1},
-                headers={"Accept": "application/vnd.github.v3.star+json"}
-            ),
-            unittest.mock.call(
-                f"repos/{self.owner}/{self.repo}/stargazers",
-                params={'per_page': 5, 'page': 2},
-                headers={"Accept": "application/vnd.github.v3.star+json"}
-            )
+        cases = [
+            ("single page", 10, (single, {}), []),
+            ("link header", 5, (list(_PAGE1), last_link), [_PAGE2]),
+            ("no link header", 5, (list(_PAGE1), {}), [_PAGE2])
         ]
-        mock_get.assert_has_calls(expected_calls)
-        self.assertEqual(result, page1 + page2)
+        for name, per_page, first, rest in cases:
+            with self.subTest(name):
+                mock_get_page.reset_mock()
+                mock_get.reset_mock()
+                mock_get_page.return_value = first
+                mock_get.side_effect = [list(page) for page in rest]
+                
+                # Call the method
+                result = self.client.get_star_history(self.owner, self.repo, per_page=per_page)
+                
+                # Assertions
+                mock_get_page.assert_called_once_with(
+                    self.stars_url,
+                    params={'per_page': per_page, 'page': 1},
+                    headers=headers
+                )
+                expected_calls = [
+                    unittest.mock.call(
+                        self.stars_url,
+                        params={'per_page': per_page, 'page': page},
+                        headers=headers
+                    )
+                    for page in range(2, len(rest) + 2)
+                ]
+                self.assertEqual(mock_get.call_args_list, expected_calls)
+                self.assertEqual(result, [star for page in [first[0], *rest] for star in page])
     
     @patch('stargazers_advanced.GitHubAPIClient.get')
     def test_get_trending_repositories(self, mock_get):
@@ -245,7 +263,7 @@ class TestGitHubStarsClient(unittest.TestCase):
         
         # Assertions
         mock_get_raw.assert_called_once_with(
-            f"repos/{self.owner}/{self.repo}/stargazers/export",
+            self.export_url,
             params={"format": "json"},
             accept_format="application/json"
         )
@@ -275,99 +293,230 @@ class TestGitHubStarsClient(unittest.TestCase):
 class TestGitHubAPIClient(unittest.TestCase):
     """Test cases for the GitHubAPIClient class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by every test method."""
+        cls.base_url = "https://api.github.com"
+        cls.api_key = "test_api_key"
+        # requests.Session methods or the transport adapter are patched
+        # per test, so sharing the client keeps the tests isolated
+        cls.client = GitHubAPIClient(cls.base_url, cls.api_key)
+        
+        # No test in this class should wait out a real retry delay
+        sleep_patcher = patch('time.sleep')
+        sleep_patcher.start()
+        cls.addClassCleanup(sleep_patcher.stop)
+    
     def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.base_url = "https://api.github.com"
-        self.api_key = "test_api_key"
-        self.client = GitHubAPIClient(self.base_url, self.api_key)
+        """Forget the rate-limit window and ETags left by the previous test."""
+        self.client.rate_limit_remaining = None
+        self.client.rate_limit_reset = None
+        self.client._etag_cache.clear()
     
-    @patch('requests.Session.get')
-    def test_get_request_success(self, mock_get):
+    @patch('requests.Session.request')
+    def test_get_request_success(self, mock_request):
         """Test successful GET request."""
         # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b'{"data": "test"}'
-        mock_response.json.return_value = {"data": "test"}
-        mock_get.return_value = mock_response
+        mock_request.return_value = _resp(200, {"data": "test"})
         
         # Call the method
         result = self.client.get("test/endpoint", params={"param": "value"})
         
         # Assertions
-        mock_get.assert_called_once_with(
+        mock_request.assert_called_once_with(
+            'GET',
             f"{self.base_url}/test/endpoint", 
             params={"param": "value"}, 
-            headers=None
+            json=None,
+            headers=None,
+            timeout=self.client.timeout
         )
         self.assertEqual(result, {"data": "test"})
     
-    @patch('requests.Session.get')
-    def test_get_request_rate_limit(self, mock_get):
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_get_request_rate_limit(self, mock_send):
         """Test GET request handling rate limiting."""
         # First response is rate limited, second is successful
-        rate_limited_response = Mock()
-        rate_limited_response.status_code = 429
-        rate_limited_response.headers = {"Retry-After": "1"}
-        
-        success_response = Mock()
-        success_response.status_code = 200
-        success_response.content = b'{"data": "test"}'
-        success_response.json.return_value = {"data": "test"}
-        
-        mock_get.side_effect = [rate_limited_response, success_response]
-        
-        # Patch time.sleep to avoid waiting during test
-        with patch('time.sleep'):
-            # Call the method
-            result = self.client.get("test/endpoint")
-            
-            # Assertions
-            self.assertEqual(mock_get.call_count, 2)
-            self.assertEqual(result, {"data": "test"})
+        mock_send.side_effect = [
+            _http_response(429, headers={"Retry-After": "1"}),
+            _http_response(200, {"data": "test"})
+        ]
+        
+        # Call the method
+        result = self.client.get("test/endpoint")
+        
+        # Assertions
+        self.assertEqual(mock_send.call_count, 2)
+        self.assertEqual(mock_send.call_args.args[0].url, f"{self.base_url}/test/endpoint")
+        self.assertEqual(result, {"data": "test"})
+    
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_get_request_rate_limit_delays(self, mock_send):
+        """Test the waits after 429s with an HTTP-date Retry-After and with none."""
+        retry_at = formatdate(time.time() + 30, usegmt=True)
+        mock_send.side_effect = [
+            _http_response(429, headers={"Retry-After": retry_at}),
+            _http_response(429),
+            _http_response(200, {"data": "test"})
+        ]
+        
+        with patch('time.sleep') as mock_sleep:
+            result = self.client.get("test/dated")
+        
+        # Waits until the date, then for the (unrounded) backoff delay
+        first, second = (c.args[0] for c in mock_sleep.call_args_list)
+        self.assertAlmostEqual(first, 30, delta=2)
+        self.assertGreaterEqual(second, self.client.retry_delay)
+        self.assertLessEqual(second, self.client.retry_delay * 3)
+        self.assertEqual(result, {"data": "test"})
+    
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_get_request_rate_limit_exhausts_retries(self, mock_send):
+        """Test GET request giving up when every attempt is rate limited."""
+        mock_send.side_effect = lambda *args, **kwargs: _http_response(429, headers={"Retry-After": "1"})
+        
+        # Call the method and expect the 429 to surface
+        with self.assertRaises(_HTTPError):
+            self.client.get("test/limited")
+        
+        # Assert we tried the maximum number of times
+        self.assertEqual(mock_send.call_count, 4)  # Initial + 3 retries
     
-    @patch('requests.Session.get')
-    def test_get_request_retry_on_error(self, mock_get):
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_get_request_paces_low_rate_limit(self, mock_send):
+        """Test GET request pausing when the rate-limit window is nearly spent."""
+        reset = int(time.time()) + 60
+        mock_send.return_value = _http_response(
+            200, {"data": "test"},
+            headers={"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": str(reset)}
+        )
+        
+        with patch('stargazers_advanced.time.time', return_value=reset - 30):
+            result = self.client.get("test/paced")
+        
+        # Assertions
+        time.sleep.assert_called_with(15.0)
+        self.assertEqual(self.client.rate_limit_remaining, 2)
+        self.assertEqual(result, {"data": "test"})
+    
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_rate_limited_response_not_paced(self, mock_send):
+        """Test that a 429 with a spent budget waits only for its retry delay."""
+        reset = int(time.time()) + 600
+        mock_send.side_effect = [
+            _http_response(429, headers={
+                "Retry-After": "1",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(reset)
+            }),
+            _http_response(200, {"data": "test"})
+        ]
+        
+        with patch('time.sleep') as mock_sleep:
+            self.client.get("test/rejected")
+        
+        mock_sleep.assert_called_once_with(1.0)
+    
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_iter_items_follows_link_header(self, mock_send):
+        """Test streaming list items across pages linked by the Link header."""
+        next_link = {"Link": f'<{self.base_url}/test/items?page=2>; rel="next"'}
+        mock_send.side_effect = [
+            _http_response(200, list(_PAGE1), headers=next_link, stream=True),
+            _http_response(200, list(_PAGE2), stream=True)
+        ]
+        
+        # Call the method
+        result = list(self.client.iter_items("test/items", params={"per_page": 5}))
+        
+        # Assertions
+        self.assertEqual(mock_send.call_count, 2)
+        self.assertTrue(mock_send.call_args.args[0].url.endswith("page=2"))
+        self.assertEqual(result, list(_PAGE1) + list(_PAGE2))
+    
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_stream_raw(self, mock_send):
+        """Test streaming a raw response body into a file object."""
+        payload = [{"login": f"user{i}"} for i in range(2000)]
+        mock_send.return_value = _http_response(200, payload, stream=True)
+        sink = io.BytesIO()
+        
+        # Call the method
+        written = self.client.stream_raw("test/export", sink, params={"format": "json"},
+                                         accept_format="application/json")
+        
+        # Assertions
+        request = mock_send.call_args.args[0]
+        self.assertEqual(request.headers["Accept"], "application/json")
+        self.assertTrue(mock_send.call_args.kwargs["stream"])
+        self.assertEqual(written, len(sink.getvalue()))
+        self.assertEqual(json.loads(sink.getvalue()), payload)
+    
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_get_request_retry_on_error(self, mock_send):
         """Test GET request retrying on network error."""
         # First response raises exception, second is successful
-        mock_get.side_effect = [
-            requests.exceptions.ConnectionError("Network error"),
-            Mock(status_code=200, content=b'{"data": "test"}', json=lambda: {"data": "test"})
+        mock_send.side_effect = [
+            _ConnError("Network error"),
+            _http_response(200, {"data": "test"})
         ]
         
-        # Patch time.sleep to avoid waiting during test
-        with patch('time.sleep'):
-            # Call the method
-            result = self.client.get("test/endpoint")
-            
-            # Assertions
-            self.assertEqual(mock_get.call_count, 2)
-            self.assertEqual(result, {"data": "test"})
+        # Call the method
+        result = self.client.get("test/endpoint")
+        
+        # Assertions
+        self.assertEqual(mock_send.call_count, 2)
+        self.assertEqual(result, {"data": "test"})
     
-    @patch('requests.Session.get')
-    def test_get_request_max_retries_exceeded(self, mock_get):
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_get_request_max_retries_exceeded(self, mock_send):
         """Test GET request exceeding maximum retries."""
         # All responses raise exceptions
-        mock_get.side_effect = requests.exceptions.ConnectionError("Network error")
-        
-        # Patch time.sleep to avoid waiting during test
-        with patch('time.sleep'):
-            # Call the method and expect exception
-            with self.assertRaises(requests.exceptions.ConnectionError):
-                self.client.get("test/endpoint")
-            
-            # Assert we tried the maximum number of times
-            self.assertEqual(mock_get.call_count, 4)  # Initial + 3 retries
+        mock_send.side_effect = _ConnError("Network error")
+        
+        # Call the method and expect exception
+        with self.assertRaises(_ConnError):
+            self.client.get("test/endpoint")
+        
+        # Assert we tried the maximum number of times
+        self.assertEqual(mock_send.call_count, 4)  # Initial + 3 retries
+    
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_get_request_client_error_not_retried(self, mock_send):
+        """Test that a 4xx reply is raised without being retried."""
+        mock_send.return_value = _http_response(404, {"message": "Not Found"})
+        
+        with self.assertRaises(_HTTPError):
+            self.client.get("test/endpoint")
+        
+        self.assertEqual(mock_send.call_count, 1)
     
-    @patch('requests.Session.post')
-    def test_post_request(self, mock_post):
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_head_returns_error_status(self, mock_send):
+        """Test that HEAD returns a 404 status after a single request."""
+        mock_send.return_value = _http_response(404)
+        
+        self.assertEqual(self.client.head("user/starred/octocat/hello-world"), 404)
+        self.assertEqual(mock_send.call_count, 1)
+    
+    def test_verb_methods_documented(self):
+        """Test that the generated verb methods keep their signatures and docs."""
+        for name, has_body in [("get", False), ("post", True), ("put", True),
+                               ("patch", True), ("delete", False)]:
+            with self.subTest(name=name):
+                method = getattr(GitHubAPIClient, name)
+                params = list(inspect.signature(method).parameters)
+                expected = ["self", "endpoint"] + (["data"] if has_body else []) + ["params", "headers"]
+                self.assertEqual(params, expected)
+                self.assertEqual(method.__qualname__, f"GitHubAPIClient.{name}")
+                self.assertIn("Args:", method.__doc__)
+                self.assertIn("Returns:", method.__doc__)
+    
+    @patch('requests.Session.request')
+    def test_post_request(self, mock_request):
         """Test POST request."""
         # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.content = b'{"id": 123}'
-        mock_response.json.return_value = {"id": 123}
-        mock_post.return_value = mock_response
+        mock_request.return_value = _resp(201, {"id": 123})
         
         # Call the method
         result = self.client.post(
@@ -377,14 +526,55 @@ class TestGitHubAPIClient(unittest.TestCase):
         )
         
         # Assertions
-        mock_post.assert_called_once_with(
+        mock_request.assert_called_once_with(
+            'POST',
             f"{self.base_url}/test/endpoint", 
             params={"param": "value"}, 
             json={"name": "test"}, 
-            headers=None
+            headers=None,
+            timeout=self.client.timeout
         )
         self.assertEqual(result, {"id": 123})
 
 
+@unittest.skipUnless(hasattr(stargazers_advanced, 'AsyncGitHubStarsClient'),
+                     "stargazers_advanced has no AsyncGitHubStarsClient")
+class TestAsyncGitHubStarsClient(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the AsyncGitHubStarsClient class."""
+
+    async def asyncSetUp(self):
+        """Set up a client inside the test's event loop."""
+        self.client = stargazers_advanced.AsyncGitHubStarsClient("https://api.github.com", "test_api_key")
+        self.owner = "octocat"
+        self.repo = "hello-world"
+    
+    async def asyncTearDown(self):
+        await self.client.close()
+    
+    @patch('stargazers_advanced.AsyncGitHubAPIClient.get', new_callable=AsyncMock)
+    async def test_get_star_history_multiple_pages(self, mock_get):
+        """Test that star history pages are fetched concurrently and joined in order."""
+        mock_get.side_effect = [list(_PAGE1), list(_PAGE2)]
+        
+        # Call the method
+        result = await self.client.get_star_history(self.owner, self.repo, per_page=5, max_pages=2)
+        
+        # Assertions
+        expected_calls = [
+            unittest.mock.call(
+                f"repos/{self.owner}/{self.repo}/stargazers",
+                params={'per_page': 5, 'page': page},
+                headers={"Accept": "application/vnd.github.v3.star+json"}
+            )
+            for page in (1, 2)
+        ]
+        mock_get.assert_has_calls(expected_calls, any_order=True)
+        self.assertEqual(mock_get.await_count, 2)
+        self.assertEqual(result, list(_PAGE1) + list(_PAGE2))
+
+
+# TestGitHubAPIClient resets its shared client's rate-limit window and ETag
+# cache in setUp, so the tests do not depend on the order they run in and
+# can be sharded across processes, e.g. `pytest -n auto` with pytest-xdist
 if __name__ == '__main__':
     unittest.main()
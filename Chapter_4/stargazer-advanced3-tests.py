@@ -0,0 +1,429 @@
+import asyncio
+import io
+import json
+import unittest
+from unittest.mock import patch, AsyncMock
+import requests
+
+try:
+    from aiohttp import ClientResponseError, web
+    from aiohttp.test_utils import TestServer
+except ImportError:
+    web = None
+
+# Import the classes we want to test
+# Note: You'll need to adjust this import to match your actual file structure
+import stargazers_advanced3
+from stargazers_advanced3 import (
+    AsyncGitHubAPIClient,
+    AsyncGitHubStarsClient,
+    GitHubAPIClient,
+    GitHubStarsClient,
+    _RateState,
+    _Retry,
+    _last_page,
+)
+
+_BASE_URL = "https://api.github.com"
+_NOW = 1000.0
+
+
+def _http_response(status, payload=None, headers=None, stream=False):
+    """Build a real requests.Response as a transport adapter would return it."""
+    response = requests.Response()
+    response.status_code = status
+    body = json.dumps(payload).encode() if payload is not None else b''
+    # Adapters always attach the raw stream; with stream=True the body is
+    # left unread on it
+    response.raw = io.BytesIO(body)
+    if not stream:
+        response._content = body
+    response.headers.update(headers or {})
+    response.encoding = 'utf-8'
+    return response
+
+
+def _stars(page, count):
+    """Stargazer entries for one page of star history."""
+    return [{"user": {"login": f"user{page}-{i}"}, "starred_at": "2023-01-01T00:00:00Z"}
+            for i in range(count)]
+
+
+def _link(page, last):
+    """Link header pointing at the next and last pages."""
+    url = f"{_BASE_URL}/repos/octocat/hello-world/stargazers?per_page=2&page="
+    return f'<{url}{page + 1}>; rel="next", <{url}{last}>; rel="last"'
+
+
+class TestRateState(unittest.TestCase):
+    """Test cases for the _RateState admission controller."""
+
+    def setUp(self):
+        self.state = _RateState(max_concurrency=8, requests_per_minute=None)
+
+    def _release(self, status, headers=None):
+        self.state.inflight += 1
+        self.state.release(_http_response(status, headers=headers) if status else None)
+
+    def test_concurrency_halves_on_429_and_5xx(self):
+        """Test that rejections and failures halve the concurrency."""
+        self._release(429)
+        self.assertEqual(self.state.concurrency, 4)
+        self._release(503)
+        self.assertEqual(self.state.concurrency, 2)
+        self._release(None)
+        self.assertEqual(self.state.concurrency, 1)
+        self._release(500)
+        self.assertEqual(self.state.concurrency, 1)
+
+    def test_concurrency_grows_on_success(self):
+        """Test that each success adds 0.5 up to the maximum."""
+        self.state.concurrency = 2.0
+        self._release(200)
+        self.assertEqual(self.state.concurrency, 2.5)
+        self._release(404)
+        self.assertEqual(self.state.concurrency, 3.0)
+        self.state.concurrency = 7.8
+        self._release(200)
+        self.assertEqual(self.state.concurrency, 8)
+
+    def test_release_records_budget_per_resource(self):
+        """Test that the X-RateLimit headers update the named bucket."""
+        self._release(200, {
+            "X-RateLimit-Limit": "30",
+            "X-RateLimit-Remaining": "12",
+            "X-RateLimit-Reset": "2000",
+            "X-RateLimit-Resource": "search",
+        })
+        self.assertEqual(self.state.budgets, {"search": [30, 12, 2000]})
+
+    @patch('time.sleep')
+    @patch('time.time', return_value=_NOW)
+    def test_paces_when_budget_low(self, mock_time, mock_sleep):
+        """Test that requests are spread out once remaining < max(2, 10% of limit)."""
+        self.state.budgets["core"] = [5000, 501, _NOW + 100]
+        self.state.acquire()
+        mock_sleep.assert_not_called()
+        self.assertEqual(self.state.budgets["core"][1], 500)
+
+        self.state.budgets["core"] = [5000, 400, _NOW + 100]
+        self.state.acquire()
+        mock_sleep.assert_called_once_with(0.25)
+        self.assertEqual(self.state.budgets["core"][1], 399)
+
+    @patch('time.sleep')
+    @patch('time.time', return_value=_NOW)
+    def test_paces_small_budget_below_two(self, mock_time, mock_sleep):
+        """Test that the floor of two applies to small limits."""
+        self.state.budgets["core"] = [10, 2, _NOW + 10]
+        self.state.acquire()
+        mock_sleep.assert_not_called()
+        self.state.acquire()
+        mock_sleep.assert_called_once_with(10.0)
+
+    @patch('time.sleep')
+    @patch('time.time', return_value=_NOW)
+    def test_waits_for_reset_when_budget_spent(self, mock_time, mock_sleep):
+        """Test that a spent budget waits for the window to reset."""
+        self.state.budgets["core"] = [5000, 0, _NOW + 42]
+        self.state.acquire()
+        mock_sleep.assert_called_once_with(42.0)
+
+    @patch('time.sleep')
+    @patch('time.time', return_value=_NOW)
+    def test_ignores_budget_after_reset(self, mock_time, mock_sleep):
+        """Test that a spent budget whose window has passed does not wait."""
+        self.state.budgets["core"] = [5000, 0, _NOW - 1]
+        self.state.acquire()
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    @patch('time.time', return_value=_NOW)
+    def test_requests_per_minute_cap(self, mock_time, mock_sleep):
+        """Test that the sliding window delays requests past the per-minute cap."""
+        state = _RateState(max_concurrency=8, requests_per_minute=3)
+        for _ in range(3):
+            state.acquire()
+        mock_sleep.assert_not_called()
+        state.acquire()
+        mock_sleep.assert_called_once_with(60.0)
+
+        # Requests older than a minute leave the window
+        mock_time.return_value = _NOW + 61
+        mock_sleep.reset_mock()
+        state.acquire()
+        mock_sleep.assert_not_called()
+
+
+class TestGitHubAPIClient(unittest.TestCase):
+    """Test cases for GitHubAPIClient's caching and retry handling."""
+
+    def setUp(self):
+        self.client = GitHubAPIClient(_BASE_URL, "test_api_key", retry_delay=0.01)
+
+    @patch.object(requests.Session, 'request')
+    def test_fresh_cache_entry_served_without_request(self, mock_request):
+        """Test that a response within its max-age is reused without a request."""
+        mock_request.return_value = _http_response(
+            200, {"id": 1}, {"ETag": '"v1"', "Cache-Control": "public, max-age=60"}
+        )
+
+        self.assertEqual(self.client.get("repos/octocat/hello-world"), {"id": 1})
+        self.assertEqual(self.client.get("repos/octocat/hello-world"), {"id": 1})
+
+        mock_request.assert_called_once()
+
+    @patch.object(requests.Session, 'request')
+    def test_not_modified_returns_cached_response(self, mock_request):
+        """Test that a stale entry is revalidated and a 304 serves the cached body."""
+        mock_request.side_effect = [
+            _http_response(200, {"id": 1}, {"ETag": '"v1"', "Last-Modified": "Mon, 02 Jan 2023 00:00:00 GMT"}),
+            _http_response(304),
+        ]
+        headers = {"X-Test": "1"}
+
+        first = self.client._make_request('GET', "repos/octocat/hello-world", headers=headers)
+        second = self.client._make_request('GET', "repos/octocat/hello-world", headers=headers)
+
+        self.assertIs(second, first)
+        self.assertEqual(self.client._parse(second), {"id": 1})
+        sent = mock_request.call_args_list[1].kwargs["headers"]
+        self.assertEqual(sent["If-None-Match"], '"v1"')
+        self.assertEqual(sent["If-Modified-Since"], "Mon, 02 Jan 2023 00:00:00 GMT")
+        # The caller's headers are never modified
+        self.assertEqual(headers, {"X-Test": "1"})
+
+    @patch.object(requests.Session, 'request')
+    def test_uncacheable_response_not_stored(self, mock_request):
+        """Test that responses without validators or max-age are not cached."""
+        mock_request.return_value = _http_response(200, {"id": 1})
+
+        self.client.get("repos/octocat/hello-world")
+        self.client.get("repos/octocat/hello-world")
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(len(self.client._etag_cache), 0)
+
+    @patch('time.sleep')
+    @patch.object(requests.Session, 'request')
+    def test_rate_limited_request_retried(self, mock_request, mock_sleep):
+        """Test that a 429 is retried after Retry-After and shrinks concurrency."""
+        mock_request.side_effect = [
+            _http_response(429, headers={"Retry-After": "2"}),
+            _http_response(200, {"id": 1}),
+        ]
+
+        self.assertEqual(self.client.get("repos/octocat/hello-world"), {"id": 1})
+
+        self.assertEqual(mock_request.call_count, 2)
+        mock_sleep.assert_any_call(2.0)
+        # Halved by the 429, then raised by 0.5 for the success
+        self.assertEqual(self.client._rate.concurrency, 5.5)
+
+    def test_retry_leaves_429_to_client(self):
+        """Test that urllib3 does not retry 429 replies itself."""
+        retry = self.client.session.get_adapter(_BASE_URL).max_retries
+        self.assertIsInstance(retry, _Retry)
+        self.assertNotIn(429, _Retry.RETRY_AFTER_STATUS_CODES)
+        self.assertIn(503, _Retry.RETRY_AFTER_STATUS_CODES)
+        self.assertFalse(retry.is_retry('GET', 429, has_retry_after=True))
+        self.assertTrue(retry.is_retry('GET', 503, has_retry_after=True))
+
+
+class TestGitHubStarsClient(unittest.TestCase):
+    """Test cases for GitHubStarsClient's batched and paginated calls."""
+
+    def setUp(self):
+        self.client = GitHubStarsClient(_BASE_URL, "test_api_key")
+
+    @patch.object(requests.Session, 'request')
+    def test_check_starred_many_batches_graphql(self, mock_request):
+        """Test that repositories are checked GRAPHQL_BATCH_SIZE per request."""
+        def graphql(method, url, json=None, **kwargs):
+            variables = json["variables"]
+            data = {}
+            for i in range(len(variables) // 2):
+                name = variables[f"n{i}"]
+                # repo-7 cannot be found; even-numbered repos are starred
+                data[f"r{i}"] = None if name == "repo-7" else {
+                    "viewerHasStarred": int(name.split("-")[1]) % 2 == 0
+                }
+            return _http_response(200, {"data": data})
+
+        mock_request.side_effect = graphql
+        repos = [("octocat", f"repo-{i}") for i in range(150)]
+
+        result = self.client.check_starred_many(repos)
+
+        self.assertEqual(mock_request.call_count, 2)
+        batches = [len(c.kwargs["json"]["variables"]) // 2 for c in mock_request.call_args_list]
+        self.assertEqual(batches, [stargazers_advanced3.GRAPHQL_BATCH_SIZE, 50])
+        for call in mock_request.call_args_list:
+            self.assertEqual(call.args[:2], ('POST', f"{_BASE_URL}/graphql"))
+        self.assertEqual(len(result), 150)
+        self.assertTrue(result[("octocat", "repo-0")])
+        self.assertFalse(result[("octocat", "repo-7")])
+        self.assertTrue(result[("octocat", "repo-148")])
+        self.assertFalse(result[("octocat", "repo-149")])
+
+    @patch.object(requests.Session, 'request')
+    def test_get_star_history_stops_at_last_page(self, mock_request):
+        """Test that only the pages up to Link's rel="last" are requested."""
+        def page(method, url, params=None, stream=False, **kwargs):
+            number = params["page"]
+            headers = {"Link": _link(number, 3)} if number < 3 else {}
+            return _http_response(200, _stars(number, 2 if number < 3 else 1), headers, stream)
+
+        mock_request.side_effect = page
+
+        history = self.client.get_star_history("octocat", "hello-world", per_page=2)
+
+        self.assertEqual(len(history), 5)
+        pages = sorted(c.kwargs["params"]["page"] for c in mock_request.call_args_list)
+        self.assertEqual(pages, [1, 2, 3])
+        self.assertEqual(history[-1]["user"]["login"], "user3-0")
+
+    @patch.object(requests.Session, 'request')
+    def test_get_star_history_single_page(self, mock_request):
+        """Test that a short first page without a Link header is the only request."""
+        mock_request.return_value = _http_response(200, _stars(1, 1))
+
+        history = self.client.get_star_history("octocat", "hello-world", per_page=2)
+
+        self.assertEqual(len(history), 1)
+        mock_request.assert_called_once()
+
+    def test_last_page(self):
+        """Test reading the last page number from parsed Link relations."""
+        links = {"last": {"url": f"{_BASE_URL}/repos/o/r/stargazers?per_page=100&page=7"}}
+        self.assertEqual(_last_page(links), 7)
+        self.assertIsNone(_last_page({"next": {"url": f"{_BASE_URL}/x?page=2"}}))
+        self.assertIsNone(_last_page(None))
+        self.assertIsNone(_last_page({}))
+
+
+class TestAsyncGitHubStarsClient(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncGitHubStarsClient's prefetching iteration."""
+
+    async def asyncSetUp(self):
+        self.client = AsyncGitHubStarsClient(_BASE_URL, "test_api_key")
+        self.requested = []
+        self.cancelled = []
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+    async def test_iter_star_history_stops_at_last_page(self):
+        """Test that no page past Link's rel="last" is requested."""
+        async def get_page(endpoint, params=None, headers=None):
+            number = params["page"]
+            self.requested.append(number)
+            links = {"last": {"url": f"{_BASE_URL}/x?page=3"}} if number == 1 else {}
+            return _stars(number, 2), links
+
+        with patch.object(self.client.api, 'get_page', AsyncMock(side_effect=get_page)):
+            stars = [star async for star in self.client.iter_star_history(
+                "octocat", "hello-world", per_page=2, prefetch=5
+            )]
+
+        self.assertEqual(len(stars), 6)
+        self.assertEqual(sorted(self.requested), [1, 2, 3])
+
+    async def test_iter_star_history_cancels_prefetched_pages(self):
+        """Test that pages still in flight are cancelled when the consumer stops."""
+        never = asyncio.Event()
+
+        async def get_page(endpoint, params=None, headers=None):
+            number = params["page"]
+            self.requested.append(number)
+            if number > 2:
+                try:
+                    await never.wait()
+                except asyncio.CancelledError:
+                    self.cancelled.append(number)
+                    raise
+            return _stars(number, 2), None
+
+        with patch.object(self.client.api, 'get_page', AsyncMock(side_effect=get_page)):
+            history = self.client.iter_star_history("octocat", "hello-world", per_page=2, prefetch=3)
+            stars = []
+            async for star in history:
+                stars.append(star)
+                if len(stars) == 3:
+                    break
+            await history.aclose()
+            await asyncio.sleep(0)
+
+        self.assertEqual(len(stars), 3)
+        self.assertEqual(sorted(self.requested), [1, 2, 3, 4])
+        self.assertEqual(sorted(self.cancelled), [3, 4])
+
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncGitHubAPIClient(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncGitHubAPIClient's retry handling, against a local server."""
+
+    async def asyncSetUp(self):
+        self.statuses = []
+        self.requested = []
+
+        async def handler(request):
+            self.requested.append(request.path)
+            status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+            if status == 200:
+                return web.json_response([{"id": 1}])
+            return web.json_response({"message": "error"}, status=status)
+
+        app = web.Application()
+        app.router.add_route('*', '/{tail:.*}', handler)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.base_url = str(self.server.make_url(''))
+        self.client = AsyncGitHubAPIClient(self.base_url, "test_api_key", retry_delay=0.001)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.server.close()
+
+    async def test_client_error_not_retried(self):
+        """Test that a 4xx reply is raised after a single request."""
+        self.statuses = [404]
+
+        with self.assertRaises(ClientResponseError) as raised:
+            await self.client.get("repos/octocat/hello-world")
+
+        self.assertEqual(raised.exception.status, 404)
+        self.assertEqual(len(self.requested), 1)
+
+    async def test_star_history_of_missing_repository(self):
+        """Test that a 404 reaches get_star_history's handling without retries."""
+        self.statuses = [404]
+        stars = AsyncGitHubStarsClient(self.base_url, "test_api_key", retry_delay=0.001)
+        try:
+            self.assertEqual(await stars.get_star_history("octocat", "missing"), [])
+        finally:
+            await stars.close()
+
+        self.assertEqual(len(self.requested), 1)
+
+    async def test_server_error_retried(self):
+        """Test that a 5xx reply is retried."""
+        self.statuses = [503, 200]
+
+        self.assertEqual(await self.client.get("repos/octocat/hello-world"), [{"id": 1}])
+        self.assertEqual(len(self.requested), 2)
+
+    async def test_rate_limit_exhausts_retries(self):
+        """Test that the last 429 is raised with its status once retries run out."""
+        self.statuses = [429]
+
+        with self.assertRaises(ClientResponseError) as raised:
+            await self.client.get("repos/octocat/hello-world")
+
+        self.assertEqual(raised.exception.status, 429)
+        self.assertEqual(len(self.requested), self.client.max_retries + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,18 +1,135 @@
 import requests
-import json
+from requests.adapters import HTTPAdapter
 import time
-from typing import Dict, List, Optional, Union, Any
-from datetime import datetime
+import asyncio
+import random
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import BinaryIO, Dict, Iterator, List, Optional, Any
+from types import MappingProxyType
+from urllib.parse import parse_qs, urlparse
 import logging
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
+
+# Only advertise Brotli when a decoder is installed for urllib3/httpx to use
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip"
+
+USER_AGENT = "GitHubStarsClient/1.0"
+
+# GitHub API requires a specific Accept header to get star timestamps;
+# read-only so every call and client can share the same mapping
+_STAR_HEADERS = MappingProxyType({"Accept": "application/vnd.github.v3.star+json"})
+
+# Connect and read timeouts applied to every synchronous request
+DEFAULT_TIMEOUT = (5, 30)
+
+_METHODS = frozenset({'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE'})
+# Methods whose request carries a JSON body
+_WRITE_METHODS = frozenset({'POST', 'PUT', 'PATCH'})
+
+# Bytes read per chunk when streaming a raw response to a file
+STREAM_CHUNK_SIZE = 1 << 16
+
+# Worker threads used to fetch pages concurrently over the shared session
+MAX_PAGE_WORKERS = 16
+
+# Star history pages kept in flight at once by the asynchronous client
+MAX_CONCURRENT_PAGES = 32
+
+# Maximum number of GET responses kept for conditional revalidation
+ETAG_CACHE_MAXSIZE = 256
+
+# Longest pause between retries, in seconds
+RETRY_DELAY_CAP = 60.0
+
+# Start pacing requests once this few calls remain in the rate-limit window
+RATE_LIMIT_THRESHOLD = 5
+
+# Repository metadata is reused for this many seconds before refetching
+REPO_INFO_TTL = 60.0
+REPO_INFO_CACHE_MAXSIZE = 1024
+
+
+def _backoff(rng: random.Random, base: float, delay: float) -> float:
+    """
+    Next retry delay using decorrelated jitter.
+    
+    Randomizing each step keeps clients that failed together from retrying
+    in lockstep.
+    """
+    return min(RETRY_DELAY_CAP, rng.uniform(base, delay * 3))
+
+
+def _retry_after(headers: Any, delay: float) -> float:
+    """
+    Seconds to wait before retrying a rate-limited response.
+    
+    A Retry-After header, in seconds or as an HTTP date, is honored as is;
+    without a readable one the backoff ``delay`` is used.
+    """
+    retry_after = headers.get('Retry-After')
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return delay
+
+
+@lru_cache(maxsize=4096)
+def _stargazers_url(owner: str, repo: str) -> str:
+    """Return the stargazers endpoint for a repository, built once per repo."""
+    return f"repos/{owner}/{repo}/stargazers"
+
+
+def _last_page(links: Dict[str, Dict[str, str]]) -> Optional[int]:
+    """Return the page number of a Link header's rel="last" entry, if any."""
+    last = links.get('last')
+    if not last:
+        return None
+    return int(parse_qs(urlparse(str(last['url'])).query)['page'][0])
+
 
 class GitHubAPIClient:
     """
     Base class for GitHub API clients that handles authentication, error handling, and retry logic.
     """
+    
+    # Fixed attribute set: no per-instance __dict__ when pooling many clients
+    __slots__ = ('base_url', 'api_key', 'max_retries', 'retry_delay', 'logger',
+                 'session', 'timeout', '_base', 'http_errors', 'rate_limit_remaining',
+                 'rate_limit_reset', '_rng', '_etag_cache', '_etag_lock',
+                 '_httpx', '_transport_errors')
 
     def __init__(self, base_url: str, api_key: Optional[str] = None, 
-                 max_retries: int = 3, retry_delay: float = 1.0):
+                 max_retries: int = 3, retry_delay: float = 1.0,
+                 transport: str = 'requests'):
         """
         Initialize the base GitHub API client.
         
@@ -20,38 +137,89 @@ class GitHubAPIClient:
             base_url: The base URL for the GitHub API
             api_key: Optional API key or access token for authentication
             max_retries: Maximum number of retry attempts for failed requests
-            retry_delay: Initial delay between retries in seconds (will increase exponentially)
+            retry_delay: Initial delay between retries in seconds (grows with jittered backoff)
+            transport: 'requests' (HTTP/1.1 keep-alive) or 'httpx', which
+                multiplexes concurrent requests over one HTTP/2 connection
+                (requires httpx[http2])
         """
         self.base_url = base_url.rstrip('/')
+        # Prefix joined to each endpoint, so requests only concatenate
+        self._base = self.base_url + '/'
         self.api_key = api_key
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        # Seeded from OS entropy, so clients in different workers diverge
+        self._rng = random.Random()
         self.logger = logging.getLogger(self.__class__.__name__)
         
-        # Create and configure the session
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.timeout = DEFAULT_TIMEOUT
+        
+        # (url, params, headers) -> (ETag, Last-Modified, response) for
+        # conditional GETs; a 304 reply costs no rate limit and no body
+        self._etag_cache = OrderedDict()
+        self._etag_lock = threading.Lock()
+        
+        # Last rate-limit window reported by GitHub, shared across pages
+        self.rate_limit_remaining = None
+        self.rate_limit_reset = None
+        
+        session_headers = {
             "Content-Type": "application/json",
-            "Accept": "application/json"
-        })
+            "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "User-Agent": USER_AGENT,
+            "Connection": "keep-alive"
+        }
         
         # Add authentication if provided
         if api_key:
-            self.session.headers.update({"Authorization": f"Bearer {api_key}"})
+            session_headers["Authorization"] = f"Bearer {api_key}"
+        
+        if transport == 'httpx':
+            # httpx's Client has the same request() surface used below
+            import httpx
+            self._httpx = True
+            self.timeout = httpx.Timeout(DEFAULT_TIMEOUT[1], connect=DEFAULT_TIMEOUT[0])
+            self.session = httpx.Client(
+                http2=True,
+                headers=session_headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+            )
+            # Errors callers may need to catch, whichever transport is used
+            self.http_errors = (requests.exceptions.HTTPError, httpx.HTTPStatusError)
+            self._transport_errors = (requests.exceptions.RequestException, httpx.HTTPError)
+        elif transport == 'requests':
+            # Create and configure the session; the pool is sized for
+            # concurrent pagination, and retries are handled below instead
+            self._httpx = False
+            self.session = requests.Session()
+            self.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+            self.session.headers.update(session_headers)
+            self.http_errors = (requests.exceptions.HTTPError,)
+            self._transport_errors = (requests.exceptions.RequestException,)
+        else:
+            raise ValueError(f"Unsupported transport: {transport}")
     
     def _make_request(self, method: str, endpoint: str, 
                      params: Optional[Dict[str, Any]] = None,
                      data: Optional[Dict[str, Any]] = None,
-                     headers: Optional[Dict[str, str]] = None) -> requests.Response:
+                     headers: Optional[Dict[str, str]] = None,
+                     raise_for_status: bool = True) -> requests.Response:
         """
         Make an HTTP request with retry logic and error handling.
         
+        Connection errors and 5xx replies are retried with backoff, and 429
+        replies after the advertised delay; other 4xx replies are final.
+        
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
             endpoint: API endpoint to call (relative to base_url)
             params: Optional query parameters
             data: Optional request body data (will be converted to JSON)
             headers: Optional additional headers
+            raise_for_status: Raise on error statuses; when False the
+                response is returned whatever its status
             
         Returns:
             Response object from successful request
@@ -59,59 +227,129 @@ class GitHubAPIClient:
         Raises:
             requests.exceptions.HTTPError: If request fails even after retries
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        request_headers = {}
-        if headers:
-            request_headers.update(headers)
+        method = method.upper()
+        if method not in _METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        url = self._base + (endpoint[1:] if endpoint.startswith('/') else endpoint)
+        # Per-call headers go straight through; the session merges them with
+        # its own, so a copy is only made to add validators below
+        request_headers = headers
+        
+        cache_key = cached = None
+        if method == 'GET':
+            cache_key = (url,
+                         tuple(sorted(params.items())) if params else (),
+                         tuple(sorted(headers.items())) if headers else ())
+            cached = self._etag_cache.get(cache_key)
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    request_headers = {**(headers or {}), 'If-None-Match': etag}
+                elif last_modified:
+                    request_headers = {**(headers or {}), 'If-Modified-Since': last_modified}
         
         retries = 0
         delay = self.retry_delay
         
         while retries <= self.max_retries:
             try:
-                if method.upper() == 'GET':
-                    response = self.session.get(url, params=params, headers=request_headers)
-                elif method.upper() == 'POST':
-                    response = self.session.post(url, params=params, json=data, headers=request_headers)
-                elif method.upper() == 'PUT':
-                    response = self.session.put(url, params=params, json=data, headers=request_headers)
-                elif method.upper() == 'PATCH':
-                    response = self.session.patch(url, params=params, json=data, headers=request_headers)
-                elif method.upper() == 'DELETE':
-                    response = self.session.delete(url, params=params, headers=request_headers)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                response = self.session.request(method, url, params=params,
+                                                json=data if method in _WRITE_METHODS else None,
+                                                headers=request_headers, timeout=self.timeout)
+                
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    # urllib3 keeps the pooled connection on the raw response
+                    connection = getattr(getattr(response, 'raw', None), '_connection', None)
+                    self.logger.debug("Connection reused: %s", connection is not None)
+                    self.logger.debug("Content-Encoding: %s",
+                                      response.headers.get('Content-Encoding', 'identity'))
+                self._pace(response)
                 
                 # Check if request was successful
-                if response.status_code == 429:  # Rate limited
-                    retry_after = int(response.headers.get('Retry-After', delay))
-                    self.logger.warning(f"Rate limited. Retrying after {retry_after} seconds.")
+                if response.status_code == 429 and retries < self.max_retries:  # Rate limited
+                    retry_after = _retry_after(response.headers, delay)
+                    self.logger.warning("Rate limited. Retrying after %.2f seconds.", retry_after)
                     time.sleep(retry_after)
                     retries += 1
-                    delay *= 2  # Exponential backoff
+                    delay = _backoff(self._rng, self.retry_delay, delay)
                     continue
                     
+                if response.status_code == 304 and cached:
+                    # Not modified: serve the body we already have
+                    with self._etag_lock:
+                        if cache_key in self._etag_cache:
+                            self._etag_cache.move_to_end(cache_key)
+                    return cached[2]
+                    
+                if not raise_for_status:
+                    return response
                 response.raise_for_status()
+                if cache_key:
+                    self._cache_response(cache_key, response)
                 return response
                 
-            except requests.exceptions.RequestException as e:
+            except self._transport_errors as e:
+                # Client errors will fail the same way again, so only
+                # connection errors and 5xx replies are retried
+                failed = getattr(e, 'response', None)
+                if failed is not None and 400 <= failed.status_code < 500:
+                    raise
+                
                 # Determine if we should retry
                 if retries >= self.max_retries:
-                    self.logger.error(f"Request failed after {retries} retries: {str(e)}")
+                    self.logger.error("Request failed after %d retries: %s", retries, e)
                     raise
                 
                 retries += 1
-                self.logger.warning(f"Request failed, retrying ({retries}/{self.max_retries}): {str(e)}")
+                self.logger.warning("Request failed, retrying (%d/%d): %s", retries, self.max_retries, e)
                 time.sleep(delay)
-                delay *= 2  # Exponential backoff
+                delay = _backoff(self._rng, self.retry_delay, delay)
         
         # This should not be reached, but just in case
         raise requests.exceptions.RequestException("Max retries exceeded with no successful response")
     
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, 
-           headers: Optional[Dict[str, str]] = None) -> Any:
+    def _pace(self, response: requests.Response) -> None:
+        """
+        Spread the remaining rate-limit budget over the time until it resets.
+        
+        Sleeping before the window runs out avoids burning requests on 429s.
+        Rejected (403/429) responses only update the recorded window: the
+        retry branch of _make_request already waits before retrying them.
+        """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        self.rate_limit_remaining = remaining = int(remaining)
+        self.rate_limit_reset = reset = int(reset)
+        if remaining < RATE_LIMIT_THRESHOLD and response.status_code not in (403, 429):
+            pause = max(0, reset - time.time()) / max(remaining, 1)
+            self.logger.warning("%d requests left before the rate limit resets. Pausing %.1f seconds.",
+                                remaining, pause)
+            time.sleep(pause)
+    
+    def _cache_response(self, cache_key: tuple, response: requests.Response) -> None:
+        """Remember a GET response that can be revalidated later."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            return
+        with self._etag_lock:
+            self._etag_cache[cache_key] = (etag, last_modified, response)
+            self._etag_cache.move_to_end(cache_key)
+            if len(self._etag_cache) > ETAG_CACHE_MAXSIZE:
+                self._etag_cache.popitem(last=False)
+    
+    @staticmethod
+    def _parse(response: requests.Response) -> Any:
+        """Decode a JSON response body, or return None if it is empty."""
+        return json_loads(response.content) if response.content else None
+    
+    def get_page(self, endpoint: str, params: Optional[Dict[str, Any]] = None, 
+                headers: Optional[Dict[str, str]] = None) -> tuple:
         """
-        Make a GET request to the API.
+        Make a GET request and also return the response's pagination links.
         
         Args:
             endpoint: API endpoint to call
@@ -119,102 +357,361 @@ class GitHubAPIClient:
             headers: Optional additional headers
             
         Returns:
-            Parsed JSON response as Python object
+            Tuple of the parsed JSON response and the Link header relations
         """
         response = self._make_request('GET', endpoint, params=params, headers=headers)
-        return response.json() if response.content else None
+        return self._parse(response), response.links
     
-    def post(self, endpoint: str, data: Dict[str, Any], 
-            params: Optional[Dict[str, Any]] = None,
-            headers: Optional[Dict[str, str]] = None) -> Any:
+    def iter_items(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None) -> Iterator[Any]:
         """
-        Make a POST request to the API.
+        Stream the items of a paginated list endpoint one at a time.
+        
+        Each page is parsed incrementally with ijson as it arrives, so only
+        the current item is held in memory. Pages are followed through the
+        Link header. A page cannot be retried once it has started
+        streaming, so this path makes a single attempt per page.
         
         Args:
             endpoint: API endpoint to call
-            data: Request body data
             params: Optional query parameters
             headers: Optional additional headers
             
-        Returns:
-            Parsed JSON response as Python object
+        Yields:
+            Parsed JSON items across all pages, in order
         """
-        response = self._make_request('POST', endpoint, params=params, data=data, headers=headers)
-        return response.json() if response.content else None
+        url = self._base + (endpoint[1:] if endpoint.startswith('/') else endpoint)
+        params = dict(params or {})
+        page = params.pop('page', 1)
+        
+        while True:
+            count = 0
+            page_params = {**params, 'page': page}
+            if self._httpx:
+                stream = self.session.stream('GET', url, params=page_params,
+                                             headers=headers, timeout=self.timeout)
+            else:
+                stream = self.session.request('GET', url, params=page_params,
+                                              headers=headers, stream=True,
+                                              timeout=self.timeout)
+            with stream as response:
+                self._pace(response)
+                response.raise_for_status()
+                links = response.links
+                for item in self._stream_items(response):
+                    count += 1
+                    yield item
+            
+            # Trust the Link header when present, else stop at a short page
+            has_next = 'next' in links if links else count == params.get('per_page', 30)
+            if not has_next or count == 0:
+                return
+            page += 1
+    
+    def _stream_items(self, response) -> Iterator[Any]:
+        """Parse the items of a streamed JSON array response as they arrive."""
+        if ijson is None:
+            if self._httpx:
+                response.read()
+            yield from self._parse(response) or []
+        elif self._httpx:
+            # httpx exposes an iterator of chunks rather than a file object,
+            # so feed ijson's push parser chunk by chunk
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, 'item', use_float=True)
+            for chunk in response.iter_bytes():
+                parser.send(chunk)
+                yield from items
+                del items[:]
+            parser.close()
+            yield from items
+        else:
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, 'item', use_float=True)
     
-    def put(self, endpoint: str, data: Dict[str, Any], 
-           params: Optional[Dict[str, Any]] = None,
-           headers: Optional[Dict[str, str]] = None) -> Any:
+    def get_raw(self, endpoint: str, 
+               params: Optional[Dict[str, Any]] = None,
+               accept_format: Optional[str] = None) -> bytes:
         """
-        Make a PUT request to the API.
+        Make a GET request and return the raw response content.
         
         Args:
             endpoint: API endpoint to call
-            data: Request body data
             params: Optional query parameters
-            headers: Optional additional headers
+            accept_format: Optional content type to request
             
         Returns:
-            Parsed JSON response as Python object
+            Raw response content as bytes
         """
-        response = self._make_request('PUT', endpoint, params=params, data=data, headers=headers)
-        return response.json() if response.content else None
+        headers = {}
+        if accept_format:
+            headers["Accept"] = accept_format
+            
+        response = self._make_request('GET', endpoint, params=params, headers=headers)
+        return response.content
     
-    def patch(self, endpoint: str, data: Dict[str, Any], 
+    def head(self, endpoint: str,
              params: Optional[Dict[str, Any]] = None,
-             headers: Optional[Dict[str, str]] = None) -> Any:
+             headers: Optional[Dict[str, str]] = None) -> int:
         """
-        Make a PATCH request to the API.
+        Make a HEAD request and return its status code.
+        
+        Useful when only the status matters: no body is transferred or
+        parsed, and error statuses are returned rather than raised, so
+        status-only checks skip the exception path. Rate limiting is retried
+        as for any other request.
         
         Args:
             endpoint: API endpoint to call
-            data: Request body data
             params: Optional query parameters
             headers: Optional additional headers
             
         Returns:
-            Parsed JSON response as Python object
+            HTTP status code of the response
         """
-        response = self._make_request('PATCH', endpoint, params=params, data=data, headers=headers)
-        return response.json() if response.content else None
+        return self._make_request('HEAD', endpoint, params=params, headers=headers,
+                                  raise_for_status=False).status_code
     
-    def delete(self, endpoint: str, 
-              params: Optional[Dict[str, Any]] = None,
-              headers: Optional[Dict[str, str]] = None) -> Any:
+    def stream_raw(self, endpoint: str, sink: BinaryIO,
+                   params: Optional[Dict[str, Any]] = None,
+                   accept_format: Optional[str] = None) -> int:
         """
-        Make a DELETE request to the API.
+        Make a GET request and write the raw response body to a file.
+        
+        The body is copied in STREAM_CHUNK_SIZE pieces, so memory use does
+        not grow with the size of the response.
         
         Args:
             endpoint: API endpoint to call
+            sink: Binary file-like object the body is written to
             params: Optional query parameters
-            headers: Optional additional headers
+            accept_format: Optional content type to request
             
         Returns:
-            Parsed JSON response as Python object (if any)
+            Number of bytes written
         """
-        response = self._make_request('DELETE', endpoint, params=params, headers=headers)
-        return response.json() if response.content else None
+        url = self._base + (endpoint[1:] if endpoint.startswith('/') else endpoint)
+        headers = {"Accept": accept_format} if accept_format else None
+        if self._httpx:
+            stream = self.session.stream('GET', url, params=params,
+                                         headers=headers, timeout=self.timeout)
+        else:
+            stream = self.session.request('GET', url, params=params,
+                                          headers=headers, stream=True,
+                                          timeout=self.timeout)
+        written = 0
+        with stream as response:
+            self._pace(response)
+            response.raise_for_status()
+            chunks = (response.iter_bytes(STREAM_CHUNK_SIZE) if self._httpx
+                      else response.iter_content(chunk_size=STREAM_CHUNK_SIZE))
+            for chunk in chunks:
+                sink.write(chunk)
+                written += len(chunk)
+        return written
+
+
+# Verb wrappers generated onto GitHubAPIClient:
+# name -> (HTTP method, has JSON body, description of the return value)
+_VERBS = {
+    'get': ('GET', False, 'Parsed JSON response as Python object'),
+    'post': ('POST', True, 'Parsed JSON response as Python object'),
+    'put': ('PUT', True, 'Parsed JSON response as Python object'),
+    'patch': ('PATCH', True, 'Parsed JSON response as Python object'),
+    'delete': ('DELETE', False, 'Parsed JSON response as Python object (if any)'),
+}
+
+
+def _make_verb(name: str, verb: str, has_body: bool, returns: str):
+    """Build the public, documented wrapper for one HTTP verb on GitHubAPIClient."""
+    if has_body:
+        def call(self, endpoint: str, data: Dict[str, Any], 
+                 params: Optional[Dict[str, Any]] = None,
+                 headers: Optional[Dict[str, str]] = None) -> Any:
+            response = self._make_request(verb, endpoint, params=params, data=data, headers=headers)
+            return self._parse(response)
+    else:
+        def call(self, endpoint: str, params: Optional[Dict[str, Any]] = None, 
+                 headers: Optional[Dict[str, str]] = None) -> Any:
+            response = self._make_request(verb, endpoint, params=params, headers=headers)
+            return self._parse(response)
     
-    def get_raw(self, endpoint: str, 
-               params: Optional[Dict[str, Any]] = None,
-               accept_format: Optional[str] = None) -> bytes:
+    body_arg = "    data: Request body data\n" if has_body else ""
+    call.__name__ = name
+    call.__qualname__ = f"GitHubAPIClient.{name}"
+    call.__doc__ = (
+        f"Make a {verb} request to the API.\n"
+        f"\n"
+        f"Args:\n"
+        f"    endpoint: API endpoint to call\n"
+        f"{body_arg}"
+        f"    params: Optional query parameters\n"
+        f"    headers: Optional additional headers\n"
+        f"\n"
+        f"Returns:\n"
+        f"    {returns}"
+    )
+    return call
+
+
+for _name, (_verb, _has_body, _returns) in _VERBS.items():
+    setattr(GitHubAPIClient, _name, _make_verb(_name, _verb, _has_body, _returns))
+del _name, _verb, _has_body, _returns
+
+
+class AsyncGitHubAPIClient:
+    """
+    Asynchronous counterpart of GitHubAPIClient built on aiohttp.
+    
+    One aiohttp.ClientSession is opened on first use and shared by every
+    request, so concurrent calls reuse its pooled keep-alive connections.
+    Use the client as an async context manager or call close() when done.
+    """
+
+    def __init__(self, base_url: str, api_key: Optional[str] = None, 
+                 max_retries: int = 3, retry_delay: float = 1.0):
         """
-        Make a GET request and return the raw response content.
+        Initialize the asynchronous GitHub API client.
         
         Args:
-            endpoint: API endpoint to call
+            base_url: The base URL for the GitHub API
+            api_key: Optional API key or access token for authentication
+            max_retries: Maximum number of retry attempts for failed requests
+            retry_delay: Initial delay between retries in seconds (grows with jittered backoff)
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncGitHubAPIClient requires the aiohttp package")
+        self.base_url = base_url.rstrip('/')
+        # Prefix joined to each endpoint, so requests only concatenate
+        self._base = self.base_url + '/'
+        self.api_key = api_key
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        # Seeded from OS entropy, so clients in different workers diverge
+        self._rng = random.Random()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
+        self.session = None
+    
+    async def __aenter__(self) -> "AsyncGitHubAPIClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # aiohttp sessions must be created inside a running event loop
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=64, limit_per_host=32,
+                                             ttl_dns_cache=300, keepalive_timeout=75)
+            self.session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+        return self.session
+    
+    async def close(self) -> None:
+        """Close the shared session and its connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
+    async def _make_request(self, method: str, endpoint: str, 
+                            params: Optional[Dict[str, Any]] = None,
+                            data: Optional[Dict[str, Any]] = None,
+                            headers: Optional[Dict[str, str]] = None) -> tuple:
+        """
+        Make an HTTP request with retry logic and error handling.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            endpoint: API endpoint to call (relative to base_url)
             params: Optional query parameters
-            accept_format: Optional content type to request
+            data: Optional request body data (will be converted to JSON)
+            headers: Optional additional headers
             
         Returns:
-            Raw response content as bytes
-        """
-        headers = {}
-        if accept_format:
-            headers["Accept"] = accept_format
+            Tuple of the successful response and its body bytes, read before
+            the connection went back to the pool
             
-        response = self._make_request('GET', endpoint, params=params, headers=headers)
-        return response.content
+        Raises:
+            aiohttp.ClientResponseError: If request fails even after retries
+        """
+        url = self._base + (endpoint[1:] if endpoint.startswith('/') else endpoint)
+        session = self._get_session()
+        
+        retries = 0
+        delay = self.retry_delay
+        
+        while retries <= self.max_retries:
+            try:
+                async with session.request(method.upper(), url, params=params,
+                                           json=data, headers=headers) as response:
+                    body = await response.read()
+                
+                if response.status == 429 and retries < self.max_retries:  # Rate limited
+                    retry_after = _retry_after(response.headers, delay)
+                    self.logger.warning("Rate limited. Retrying after %.2f seconds.", retry_after)
+                    await asyncio.sleep(retry_after)
+                    retries += 1
+                    delay = _backoff(self._rng, self.retry_delay, delay)
+                    continue
+                
+                response.raise_for_status()
+                return response, body
+                
+            except aiohttp.ClientError as e:
+                if retries >= self.max_retries:
+                    self.logger.error("Request failed after %d retries: %s", retries, e)
+                    raise
+                
+                retries += 1
+                self.logger.warning("Request failed, retrying (%d/%d): %s", retries, self.max_retries, e)
+                await asyncio.sleep(delay)
+                delay = _backoff(self._rng, self.retry_delay, delay)
+        
+        # This should not be reached, but just in case
+        raise aiohttp.ClientError("Max retries exceeded with no successful response")
+    
+    @staticmethod
+    def _json(body: bytes) -> Any:
+        return json_loads(body) if body else None
+    
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, 
+                  headers: Optional[Dict[str, str]] = None) -> Any:
+        """Make a GET request and return the parsed JSON response."""
+        _, body = await self._make_request('GET', endpoint, params=params, headers=headers)
+        return self._json(body)
+    
+    async def post(self, endpoint: str, data: Dict[str, Any], 
+                   params: Optional[Dict[str, Any]] = None,
+                   headers: Optional[Dict[str, str]] = None) -> Any:
+        """Make a POST request and return the parsed JSON response."""
+        _, body = await self._make_request('POST', endpoint, params=params, data=data, headers=headers)
+        return self._json(body)
+    
+    async def put(self, endpoint: str, data: Dict[str, Any], 
+                  params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None) -> Any:
+        """Make a PUT request and return the parsed JSON response."""
+        _, body = await self._make_request('PUT', endpoint, params=params, data=data, headers=headers)
+        return self._json(body)
+    
+    async def patch(self, endpoint: str, data: Dict[str, Any], 
+                    params: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, str]] = None) -> Any:
+        """Make a PATCH request and return the parsed JSON response."""
+        _, body = await self._make_request('PATCH', endpoint, params=params, data=data, headers=headers)
+        return self._json(body)
+    
+    async def delete(self, endpoint: str, 
+                     params: Optional[Dict[str, Any]] = None,
+                     headers: Optional[Dict[str, str]] = None) -> Any:
+        """Make a DELETE request and return the parsed JSON response (if any)."""
+        _, body = await self._make_request('DELETE', endpoint, params=params, headers=headers)
+        return self._json(body)
 
 
 class GitHubStarsClient:
@@ -222,8 +719,11 @@ class GitHubStarsClient:
     Client for GitHub API operations related to stars and stargazers.
     """
     
+    __slots__ = ('api', '_repo_cache', '_repo_lock')
+    
     def __init__(self, base_url: str, api_key: Optional[str] = None,
-                max_retries: int = 3, retry_delay: float = 1.0):
+                max_retries: int = 3, retry_delay: float = 1.0,
+                api: Optional[GitHubAPIClient] = None):
         """
         Initialize the GitHub Stars client.
         
@@ -232,8 +732,43 @@ class GitHubStarsClient:
             api_key: Optional API key or access token for authentication
             max_retries: Maximum number of retry attempts for failed requests
             retry_delay: Initial delay between retries in seconds
+            api: Existing client to share, so its connection pool is reused
+                (the other arguments are ignored when given)
         """
-        self.api = GitHubAPIClient(base_url, api_key, max_retries, retry_delay)
+        self.api = api or GitHubAPIClient(base_url, api_key, max_retries, retry_delay)
+        
+        # (owner, repo) -> (expiry, repository info), oldest first
+        self._repo_cache = OrderedDict()
+        self._repo_lock = threading.Lock()
+    
+    def get_repo_info(self, owner: str, repo: str) -> Dict[str, Any]:
+        """
+        Get a repository's metadata, reusing it for REPO_INFO_TTL seconds.
+        
+        Once the entry expires the refetch revalidates against the API
+        client's ETag cache, so an unchanged repository costs only a 304.
+        
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            
+        Returns:
+            Dictionary containing repository information
+        """
+        key = (owner, repo)
+        now = time.monotonic()
+        with self._repo_lock:
+            cached = self._repo_cache.get(key)
+            if cached and cached[0] > now:
+                return cached[1]
+        
+        repo_info = self.api.get(f"repos/{owner}/{repo}")
+        with self._repo_lock:
+            self._repo_cache[key] = (now + REPO_INFO_TTL, repo_info)
+            self._repo_cache.move_to_end(key)
+            if len(self._repo_cache) > REPO_INFO_CACHE_MAXSIZE:
+                self._repo_cache.popitem(last=False)
+        return repo_info
     
     # Star-related methods
     def list_repository_stars(self, owner: str, repo: str, 
@@ -253,15 +788,9 @@ class GitHubStarsClient:
         Returns:
             Dictionary containing stargazer data and pagination info
         """
-        params = {}
-        if per_page is not None:
-            params['per_page'] = per_page
-        if page is not None:
-            params['page'] = page
-        if sort is not None:
-            params['sort'] = sort
-            
-        return self.api.get(f"repos/{owner}/{repo}/stargazers", params=params)
+        params = {k: v for k, v in (('per_page', per_page), ('page', page), ('sort', sort))
+                  if v is not None}
+        return self.api.get(_stargazers_url(owner, repo), params=params)
     
     def star_repository(self, owner: str, repo: str) -> None:
         """
@@ -293,14 +822,18 @@ class GitHubStarsClient:
             
         Returns:
             Boolean indicating whether the repository is starred
+        
+        Raises:
+            requests.exceptions.HTTPError: If GitHub answers with anything
+                other than 204 (starred) or 404 (not starred)
         """
-        try:
-            self.api.get(f"user/starred/{owner}/{repo}")
-            return True
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                return False
-            raise
+        # GitHub answers 204 when starred and 404 when not; the status is all we need
+        status = self.api.head(f"user/starred/{owner}/{repo}")
+        if status in (204, 404):
+            return status == 204
+        raise requests.exceptions.HTTPError(
+            f"Unexpected status {status} checking whether {owner}/{repo} is starred"
+        )
     
     def list_starred_repositories(self, username: Optional[str] = None, 
                                  per_page: Optional[int] = None,
@@ -320,16 +853,9 @@ class GitHubStarsClient:
         Returns:
             List of dictionaries containing repository information
         """
-        params = {}
-        if per_page is not None:
-            params['per_page'] = per_page
-        if page is not None:
-            params['page'] = page
-        if sort is not None:
-            params['sort'] = sort
-        if direction is not None:
-            params['direction'] = direction
-            
+        params = {k: v for k, v in (('per_page', per_page), ('page', page),
+                                     ('sort', sort), ('direction', direction))
+                  if v is not None}
         endpoint = f"users/{username}/starred" if username else "user/starred"
         return self.api.get(endpoint, params=params)
     
@@ -337,6 +863,9 @@ class GitHubStarsClient:
         """
         Get the total count of stars for a repository.
         
+        The count comes from get_repo_info, so it may be up to
+        REPO_INFO_TTL seconds old.
+        
         Args:
             owner: Repository owner (username or organization)
             repo: Repository name
@@ -344,7 +873,7 @@ class GitHubStarsClient:
         Returns:
             Integer count of stars
         """
-        repo_info = self.api.get(f"repos/{owner}/{repo}")
+        repo_info = self.get_repo_info(owner, repo)
         return repo_info.get("stargazers_count", 0)
     
     def get_star_history(self, owner: str, repo: str, 
@@ -352,6 +881,9 @@ class GitHubStarsClient:
         """
         Get historical data of stars for a repository with timestamps.
         
+        When page 1's Link header names the last page, the remaining pages
+        are fetched concurrently on a thread pool sharing the API session.
+        
         Args:
             owner: Repository owner (username or organization)
             repo: Repository name
@@ -360,34 +892,73 @@ class GitHubStarsClient:
         Returns:
             List of dictionaries containing stargazer information with timestamps
         """
-        # GitHub API requires a specific Accept header to get timestamps
-        headers = {"Accept": "application/vnd.github.v3.star+json"}
+        headers = _STAR_HEADERS
+        endpoint = _stargazers_url(owner, repo)
+        params = {"per_page": per_page}
         
-        # Initial request
-        params = {"per_page": per_page, "page": 1}
-        star_history = self.api.get(f"repos/{owner}/{repo}/stargazers", 
-                                   params=params, 
-                                   headers=headers)
+        # Page 1's Link header tells us how many pages there are
+        star_history, links = self.api.get_page(endpoint, params={**params, "page": 1},
+                                                headers=headers)
+        all_stars = list(star_history or [])
+        last_page = _last_page(links)
         
-        all_stars = star_history.copy()
+        if last_page is not None:
+            # Fetch the remaining pages concurrently over the shared session
+            def fetch(page):
+                try:
+                    return self.api.get(endpoint, params={**params, "page": page}, headers=headers)
+                except self.api.http_errors as e:
+                    if e.response.status_code == 404:
+                        return None
+                    raise
+            
+            with ThreadPoolExecutor(max_workers=min(MAX_PAGE_WORKERS, max(last_page - 1, 1))) as executor:
+                for page in executor.map(fetch, range(2, last_page + 1)):
+                    if page is None:
+                        break
+                    all_stars.extend(page)
+            return all_stars
         
-        # Get link header to check for pagination
-        # This is a simplified implementation that would need more work
-        # to properly handle GitHub's pagination links
-        while len(star_history) == per_page:
+        if links and 'next' not in links:
+            # A Link header without next or last means page 1 was the only one
+            return all_stars
+        
+        # Without a Link header, keep going while pages come back full,
+        # reusing one params dict and advancing its page in place
+        params["page"] = 1
+        while len(star_history or []) == per_page:
             params["page"] += 1
             try:
-                star_history = self.api.get(f"repos/{owner}/{repo}/stargazers", 
-                                          params=params, 
-                                          headers=headers)
+                star_history = self.api.get(endpoint, params=params, headers=headers)
                 all_stars.extend(star_history)
-            except requests.exceptions.HTTPError as e:
+            except self.api.http_errors as e:
                 if e.response.status_code == 404:
                     break
                 raise
         
         return all_stars
     
+    def iter_star_history(self, owner: str, repo: str, 
+                         per_page: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a repository's stargazers with timestamps.
+        
+        Unlike get_star_history this streams one page at a time and parses
+        stars as they arrive, so memory stays flat for very popular
+        repositories and callers can stop early.
+        
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            per_page: Number of results per page
+            
+        Yields:
+            Dictionaries containing stargazer information with timestamps
+        """
+        headers = _STAR_HEADERS
+        return self.api.iter_items(_stargazers_url(owner, repo),
+                                   params={"per_page": per_page}, headers=headers)
+    
     def get_trending_repositories(self, language: Optional[str] = None,
                                  since: Optional[str] = None,
                                  spoken_language: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -413,7 +984,8 @@ class GitHubStarsClient:
         return self.api.get("trending/repositories", params=params)
     
     def export_stargazers(self, owner: str, repo: str, 
-                         format: str = "json") -> bytes:
+                         format: str = "json",
+                         sink: Optional[BinaryIO] = None) -> Optional[bytes]:
         """
         Export the list of stargazers for a repository in the specified format.
         
@@ -421,14 +993,19 @@ class GitHubStarsClient:
             owner: Repository owner (username or organization)
             repo: Repository name
             format: Export format (json, csv)
+            sink: Optional binary file-like object; when given, the export
+                is streamed into it in chunks instead of held in memory
             
         Returns:
-            Bytes containing the exported data
+            Bytes containing the exported data, or None when written to sink
         """
         accept_format = f"application/{format}"
         endpoint = f"repos/{owner}/{repo}/stargazers/export"
         params = {"format": format}
         
+        if sink is not None:
+            self.api.stream_raw(endpoint, sink, params=params, accept_format=accept_format)
+            return None
         return self.api.get_raw(endpoint, params=params, accept_format=accept_format)
     
     def get_user_star_recommendations(self, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
@@ -448,10 +1025,94 @@ class GitHubStarsClient:
         return self.api.get("user/recommendations/repositories", params=params)
 
 
+class AsyncGitHubStarsClient:
+    """
+    Asynchronous client for star operations that benefit from concurrency.
+    """
+    
+    def __init__(self, base_url: str, api_key: Optional[str] = None,
+                max_retries: int = 3, retry_delay: float = 1.0):
+        """
+        Initialize the asynchronous GitHub Stars client.
+        
+        Args:
+            base_url: The base URL for the GitHub API
+            api_key: Optional API key or access token for authentication
+            max_retries: Maximum number of retry attempts for failed requests
+            retry_delay: Initial delay between retries in seconds
+        """
+        self.api = AsyncGitHubAPIClient(base_url, api_key, max_retries, retry_delay)
+    
+    async def __aenter__(self) -> "AsyncGitHubStarsClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the underlying API client."""
+        await self.api.close()
+    
+    async def get_star_history(self, owner: str, repo: str, per_page: int = 100,
+                               max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get historical data of stars for a repository with timestamps.
+        
+        Page 1 is fetched first and its Link header gives the last page
+        number; the remaining pages are then fetched concurrently, at most
+        MAX_CONCURRENT_PAGES at a time. Pages past the end (404) are skipped.
+        
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            per_page: Number of results per page
+            max_pages: If given, fetch pages 1 to max_pages concurrently
+                without probing page 1 for the Link header first
+            
+        Returns:
+            List of dictionaries containing stargazer information with timestamps
+        """
+        endpoint = _stargazers_url(owner, repo)
+        headers = _STAR_HEADERS
+        params = {"per_page": per_page}
+        
+        if max_pages is not None:
+            first_page = 1
+            all_stars = []
+            last_page = max_pages
+        else:
+            response, body = await self.api._make_request('GET', endpoint,
+                                                          params={**params, "page": 1},
+                                                          headers=headers)
+            all_stars = self.api._json(body) or []
+            first_page = 2
+            last_page = _last_page(response.links) or 1
+        
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+        
+        async def fetch(page):
+            async with semaphore:
+                return await self.api.get(endpoint, params={**params, "page": page},
+                                          headers=headers)
+        
+        pages = await asyncio.gather(*[fetch(page) for page in range(first_page, last_page + 1)],
+                                     return_exceptions=True)
+        for page in pages:
+            if isinstance(page, BaseException):
+                if isinstance(page, aiohttp.ClientResponseError) and page.status == 404:
+                    continue
+                raise page
+            all_stars.extend(page or [])
+        
+        return all_stars
+
+
 # Example usage:
 if __name__ == "__main__":
-    # Initialize the client
-    client = GitHubStarsClient("https://api.github.com", api_key="your_github_token")
+    # Initialize the client; share one GitHubAPIClient (and its connection
+    # pool) between every client that talks to the same API
+    api = GitHubAPIClient("https://api.github.com", api_key="your_github_token")
+    client = GitHubStarsClient(api.base_url, api=api)
     
     # List stargazers for a repository
     stars = client.list_repository_stars("octocat", "hello-world", per_page=10)
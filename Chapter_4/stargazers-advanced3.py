@@ -4,13 +4,258 @@ This module provides classes for interacting with GitHub's API,
 specifically focused on star and stargazer operations.
 """
 
+import asyncio
 import json
 import logging
+import random
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# orjson decodes the large stargazer pages several times faster when present
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# ijson lets large JSON arrays be decoded item by item as they are received
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Shared by every client; messages use %-style args so they are only
+# formatted when a handler actually emits the record
+logger = logging.getLogger(__name__)
+
+# Methods whose request carries a JSON body
+_BODY_METHODS = frozenset({'POST', 'PUT', 'PATCH'})
+_METHODS = _BODY_METHODS | {'GET', 'HEAD', 'DELETE'}
+
+# Endpoint templates, filled with str.format(owner, repo)
+_REPO_TMPL = 'repos/{}/{}'
+_STARGAZERS_TMPL = 'repos/{}/{}/stargazers'
+_STARRED_TMPL = 'user/starred/{}/{}'
+
+# Accept header that makes the stargazers endpoint include starred_at.
+# Read-only, so one instance can be shared by every request.
+_STAR_JSON_HEADERS = MappingProxyType({"Accept": "application/vnd.github.v3.star+json"})
+
+# Repositories looked up per GraphQL request by check_starred_many
+GRAPHQL_BATCH_SIZE = 100
+
+# Longest pause between retries, in seconds
+MAX_RETRY_DELAY = 60.0
+
+# Maximum number of GET responses kept for conditional revalidation
+ETAG_CACHE_MAXSIZE = 256
+
+# SQLite file (without extension) and default lifetime, in seconds, of the
+# optional on-disk response cache
+HTTP_CACHE_NAME = 'gh_cache'
+HTTP_CACHE_EXPIRE_AFTER = 3600
+
+
+class _Retry(Retry):
+    """urllib3 Retry that leaves 429 replies to GitHubAPIClient.
+    
+    Handling them in Python lets the rate controller see every rejection.
+    """
+    
+    RETRY_AFTER_STATUS_CODES = Retry.RETRY_AFTER_STATUS_CODES - {429}
+
+
+def _max_age(headers: Any) -> float:
+    """Return the Cache-Control max-age of a response in seconds, or 0."""
+    for directive in headers.get('Cache-Control', '').split(','):
+        name, _, value = directive.strip().partition('=')
+        if name.lower() == 'max-age' and value.isdigit():
+            return float(value)
+    return 0.0
+
+
+def _compute_backoff(
+    retry_delay: float,
+    retries: int,
+    headers: Optional[Any] = None,
+) -> float:
+    """Return how long to wait before retry number ``retries``.
+    
+    A Retry-After header, in seconds or as an HTTP date, is honored as is.
+    Otherwise the delay is drawn uniformly from zero up to the exponential
+    backoff ("full jitter"), so clients that failed together do not retry
+    in lockstep.
+    
+    Args:
+        retry_delay: Base delay in seconds
+        retries: Number of the retry about to be made, starting at 1
+        headers: Headers of the failed response, if there was one
+    
+    Returns:
+        Delay in seconds
+    """
+    retry_after = headers.get('Retry-After') if headers else None
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                pass
+            else:
+                return max(0.0, when.timestamp() - time.time())
+    return random.uniform(0, min(MAX_RETRY_DELAY, retry_delay * 2 ** (retries - 1)))
+
+
+def _last_page(links: Any) -> Optional[int]:
+    """Return the page number of a Link header's rel="last" entry, if any.
+    
+    Args:
+        links: Parsed Link header (``response.links`` of requests, httpx or
+            aiohttp), keyed by rel
+    """
+    last = links.get('last') if links else None
+    if not last:
+        return None
+    return int(parse_qs(urlparse(str(last['url'])).query)['page'][0])
+
+
+def _resource_for(endpoint: str) -> str:
+    """Guess which GitHub rate-limit bucket an endpoint is charged to.
+    
+    The response's X-RateLimit-Resource header is authoritative; this only
+    decides which budget to check before the request is sent.
+    """
+    if endpoint == 'graphql':
+        return 'graphql'
+    if endpoint.startswith('search/'):
+        return 'search'
+    return 'core'
+
+
+class _RateState:
+    """Client-side admission control shared by every request of one client.
+    
+    Concurrency follows an AIMD loop: each success raises the number of
+    requests allowed in flight by 0.5, and each 429 or 5xx halves it. Each
+    rate-limit bucket GitHub reports (core, search, graphql, ...) keeps its
+    own budget from the X-RateLimit headers, and admitting a request charges
+    it right away, so a burst is paced before its responses arrive. A
+    one-minute sliding window of started requests guards the secondary limit.
+    """
+    
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        min_concurrency: int = 1,
+        requests_per_minute: Optional[int] = 900,
+    ):
+        """Initialize the controller.
+        
+        Args:
+            max_concurrency: Upper bound on requests in flight
+            min_concurrency: Lower bound the concurrency can shrink to
+            requests_per_minute: Sliding-window cap on requests started per
+                minute (GitHub's secondary limit), or None to disable it
+        """
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.concurrency = float(max_concurrency)
+        self.requests_per_minute = requests_per_minute
+        # resource -> [limit, remaining, reset epoch seconds]
+        self.budgets = {}
+        self.inflight = 0
+        self._sent = deque()
+        self._cond = threading.Condition()
+    
+    def _delay(self, now: float, resource: str) -> float:
+        """Seconds to wait before the next request to ``resource`` may start."""
+        delay = 0.0
+        budget = self.budgets.get(resource)
+        if budget:
+            limit, remaining, reset = budget
+            if reset > now:
+                if remaining <= 0:
+                    # Budget spent: wait for the window to reset
+                    delay = reset - now
+                elif remaining < max(2, 0.1 * limit):
+                    # Spread what is left of the budget over the rest of the window
+                    delay = (reset - now) / remaining
+        if self.requests_per_minute:
+            while self._sent and self._sent[0] <= now - 60:
+                self._sent.popleft()
+            if len(self._sent) >= self.requests_per_minute:
+                delay = max(delay, self._sent[0] + 60 - now)
+        return delay
+    
+    def acquire(self, resource: str = 'core') -> None:
+        """Block until a request may be sent, then count it as in flight.
+        
+        Args:
+            resource: Rate-limit bucket the request is expected to use
+        """
+        with self._cond:
+            while self.inflight >= max(1, int(self.concurrency)):
+                self._cond.wait()
+            self.inflight += 1
+            now = time.time()
+            delay = self._delay(now, resource)
+            self._sent.append(now + delay)
+            budget = self.budgets.get(resource)
+            if budget:
+                # Charge the call now; its response will correct the figure
+                budget[1] -= 1
+        if delay > 0:
+            time.sleep(delay)
+    
+    def release(
+        self,
+        response: Optional[requests.Response],
+        resource: str = 'core',
+    ) -> None:
+        """Record the outcome of an admitted request and free its slot.
+        
+        Args:
+            response: The response received, or None if the request failed
+                before one arrived
+            resource: Rate-limit bucket the request was expected to use
+        """
+        with self._cond:
+            self.inflight -= 1
+            if response is not None:
+                headers = response.headers
+                try:
+                    budget = [
+                        int(headers['X-RateLimit-Limit']),
+                        int(headers['X-RateLimit-Remaining']),
+                        int(headers['X-RateLimit-Reset']),
+                    ]
+                except (KeyError, ValueError):
+                    pass
+                else:
+                    self.budgets[headers.get('X-RateLimit-Resource', resource)] = budget
+            if response is None or response.status_code == 429 or response.status_code >= 500:
+                self.concurrency = max(self.min_concurrency, self.concurrency * 0.5)
+            else:
+                self.concurrency = min(self.max_concurrency, self.concurrency + 0.5)
+            self._cond.notify_all()
 
 
 class GitHubAPIClient:
@@ -19,12 +264,20 @@ class GitHubAPIClient:
     Handles authentication, error handling, and retry logic for GitHub API requests.
     """
 
+    @property
+    def logger(self) -> logging.Logger:
+        """The module-level logger, kept as an attribute for compatibility."""
+        return logger
+    
     def __init__(
         self,
         base_url: str,
         api_key: Optional[str] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        max_concurrency: int = 10,
+        transport: str = 'requests',
+        cache: bool = False,
     ):
         """Initialize the base GitHub API client.
 
@@ -32,24 +285,93 @@ class GitHubAPIClient:
             base_url: The base URL for the GitHub API
             api_key: Optional API key or access token for authentication
             max_retries: Maximum number of retry attempts for failed requests
-            retry_delay: Initial delay between retries in seconds (will increase exponentially)
+            retry_delay: Initial delay between retries in seconds (grows exponentially, with jitter)
+            max_concurrency: Most requests the client keeps in flight at once
+            transport: 'requests' (HTTP/1.1 keep-alive) or 'httpx', which
+                multiplexes requests over HTTP/2 (requires httpx[http2]);
+                with httpx only connection errors are retried, not 5xx
+            cache: Keep GET responses in an on-disk SQLite cache shared
+                across runs, honouring Cache-Control and revalidating with
+                ETags (requires requests-cache and the requests transport)
+        
+        Raises:
+            ValueError: If the transport is not supported, or caching is
+                requested with the httpx transport
         """
         self.base_url = base_url.rstrip('/')
+        # Prefix joined to each endpoint, so requests only concatenate
+        self._prefix = self.base_url + '/'
         self.api_key = api_key
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self._rate = _RateState(max_concurrency=max_concurrency)
+        # Only requests exposes the raw body stream that ijson reads from
+        self._stream_items = ijson is not None and transport == 'requests'
+        
+        # (url, params, headers) -> (ETag, Last-Modified, expiry, response).
+        # Fresh entries are served without a request; stale ones are
+        # revalidated, and a 304 reply costs no rate limit and no body.
+        self._etag_cache = OrderedDict()
+        self._etag_lock = threading.Lock()
         
-        # Create and configure the session
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Content-Type": "application/json",
+        # Content-Type is set per request, only when a JSON body is sent
+        session_headers = {
             "Accept": "application/json"
-        })
+        }
         
         # Add authentication if provided
         if api_key:
-            self.session.headers.update({"Authorization": f"Bearer {api_key}"})
+            session_headers["Authorization"] = f"Bearer {api_key}"
+        
+        if transport == 'httpx':
+            if cache:
+                raise ValueError("cache=True requires the 'requests' transport")
+            # httpx's Client has the same request() surface used by _send,
+            # and multiplexes concurrent page fetches over one connection
+            import httpx
+            self.session = httpx.Client(
+                headers=session_headers,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=64),
+                    retries=max_retries,
+                ),
+            )
+            # Errors callers may need to catch, whichever transport is used
+            self.http_errors = (requests.exceptions.HTTPError, httpx.HTTPStatusError)
+        elif transport == 'requests':
+            # Create and configure the session. urllib3 retries connection
+            # errors and 5xx replies with jittered backoff, and the pool is
+            # sized so concurrent page fetches each get their own connection.
+            if cache:
+                # Imported here so requests-cache is only needed when used
+                import requests_cache
+                self.session = requests_cache.CachedSession(
+                    HTTP_CACHE_NAME,
+                    backend='sqlite',
+                    expire_after=HTTP_CACHE_EXPIRE_AFTER,
+                    cache_control=True,
+                    stale_if_error=True,
+                )
+            else:
+                self.session = requests.Session()
+            retry = _Retry(
+                total=max_retries,
+                backoff_factor=retry_delay,
+                backoff_max=MAX_RETRY_DELAY,
+                backoff_jitter=retry_delay,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=_METHODS,
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(max_retries=retry, pool_connections=32, pool_maxsize=32)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self.session.headers.update(session_headers)
+            self.http_errors = (requests.exceptions.HTTPError,)
+        else:
+            raise ValueError(f"Unsupported transport: {transport}")
     
     def _make_request(
         self,
@@ -58,6 +380,7 @@ class GitHubAPIClient:
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """Make an HTTP request with retry logic and error handling.
         
@@ -66,78 +389,127 @@ class GitHubAPIClient:
             endpoint: API endpoint to call (relative to base_url)
             params: Optional query parameters
             data: Optional request body data (will be converted to JSON)
-            headers: Optional additional headers
+            headers: Optional additional headers; never modified, so
+                shared constants such as ``_STAR_JSON_HEADERS`` can be passed
+            stream: Leave the body unread so the caller can consume
+                ``response.raw``; streamed responses bypass the ETag cache
             
         Returns:
             Response object from successful request
             
         Raises:
             requests.exceptions.HTTPError: If request fails even after retries
+                (httpx.HTTPStatusError with the httpx transport)
+            requests.exceptions.ConnectionError: If the connection keeps failing
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        request_headers = {}
-        if headers:
-            request_headers.update(headers)
+        url = self._prefix + (endpoint[1:] if endpoint.startswith('/') else endpoint)
+        request_headers = headers
+        
+        cache_key = cached = None
+        if method.upper() == 'GET' and not stream:
+            cache_key = (
+                url,
+                frozenset(params.items()) if params else frozenset(),
+                frozenset(headers.items()) if headers else frozenset(),
+            )
+            with self._etag_lock:
+                cached = self._etag_cache.get(cache_key)
+            if cached:
+                etag, last_modified, expires, cached_response = cached
+                if expires > time.time():
+                    return cached_response
+                # Copy only when validators are added, never the caller's dict
+                request_headers = dict(headers) if headers else {}
+                if etag:
+                    request_headers['If-None-Match'] = etag
+                if last_modified:
+                    request_headers['If-Modified-Since'] = last_modified
         
+        # urllib3 retries connection errors and 5xx replies (see __init__);
+        # 429s are retried here so the rate controller sees each one
         retries = 0
-        delay = self.retry_delay
         
-        while retries <= self.max_retries:
-            try:
-                if method.upper() == 'GET':
-                    response = self.session.get(
-                        url, params=params, headers=request_headers
-                    )
-                elif method.upper() == 'POST':
-                    response = self.session.post(
-                        url, params=params, json=data, headers=request_headers
-                    )
-                elif method.upper() == 'PUT':
-                    response = self.session.put(
-                        url, params=params, json=data, headers=request_headers
-                    )
-                elif method.upper() == 'PATCH':
-                    response = self.session.patch(
-                        url, params=params, json=data, headers=request_headers
-                    )
-                elif method.upper() == 'DELETE':
-                    response = self.session.delete(
-                        url, params=params, headers=request_headers
-                    )
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-                
-                # Check if request was successful
-                if response.status_code == 429:  # Rate limited
-                    retry_after = int(response.headers.get('Retry-After', delay))
-                    self.logger.warning(
-                        f"Rate limited. Retrying after {retry_after} seconds."
-                    )
-                    time.sleep(retry_after)
-                    retries += 1
-                    delay *= 2  # Exponential backoff
-                    continue
-                    
-                response.raise_for_status()
-                return response
-                
-            except requests.exceptions.RequestException as e:
-                # Determine if we should retry
-                if retries >= self.max_retries:
-                    self.logger.error(f"Request failed after {retries} retries: {str(e)}")
-                    raise
-                
+        while True:
+            response = self._send(method, url, params, data, request_headers, stream)
+            
+            if response.status_code == 429 and retries < self.max_retries:
+                response.close()
                 retries += 1
-                self.logger.warning(
-                    f"Request failed, retrying ({retries}/{self.max_retries}): {str(e)}"
-                )
+                delay = _compute_backoff(self.retry_delay, retries, response.headers)
+                logger.warning("Rate limited. Retrying after %.2f seconds.", delay)
                 time.sleep(delay)
-                delay *= 2  # Exponential backoff
+                continue
+            
+            if response.status_code == 304 and cached:
+                # Not modified: serve the body we already have
+                self._cache_response(cache_key, response, cached[3])
+                return cached[3]
+            
+            response.raise_for_status()
+            if cache_key:
+                self._cache_response(cache_key, response, response)
+            return response
+    
+    def _cache_response(
+        self,
+        cache_key: tuple,
+        response: requests.Response,
+        body: requests.Response,
+    ) -> None:
+        """Remember a GET response that can be reused or revalidated later.
         
-        # This should not be reached, but just in case
-        raise requests.exceptions.RequestException(
-            "Max retries exceeded with no successful response"
+        Args:
+            cache_key: Key built from the request's URL, params and headers
+            response: Latest response, whose validators and max-age are kept
+            body: Response whose content is served from the cache
+        """
+        etag = response.headers.get('ETag') or body.headers.get('ETag')
+        last_modified = (
+            response.headers.get('Last-Modified') or body.headers.get('Last-Modified')
         )
+        max_age = _max_age(response.headers)
+        if not (etag or last_modified or max_age):
+            return
+        with self._etag_lock:
+            self._etag_cache[cache_key] = (etag, last_modified, time.time() + max_age, body)
+            self._etag_cache.move_to_end(cache_key)
+            if len(self._etag_cache) > ETAG_CACHE_MAXSIZE:
+                self._etag_cache.popitem(last=False)
+    
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a single request once the rate controller admits it."""
+        method = method.upper()
+        if method not in _METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        resource = _resource_for(url[len(self._prefix):])
+        self._rate.acquire(resource)
+        response = None
+        try:
+            response = self.session.request(
+                method,
+                url,
+                params=params,
+                json=data if method in _BODY_METHODS else None,
+                headers=headers,
+                **({'stream': True} if stream else {}),
+            )
+            return response
+        finally:
+            self._rate.release(response, resource)
+    
+    @staticmethod
+    def _parse(response: requests.Response) -> Any:
+        """Decode a JSON response body, or return None if it is empty."""
+        return json_loads(response.content) if response.content else None
     
     def get(
         self,
@@ -156,7 +528,26 @@ class GitHubAPIClient:
             Parsed JSON response as Python object
         """
         response = self._make_request('GET', endpoint, params=params, headers=headers)
-        return response.json() if response.content else None
+        return self._parse(response)
+    
+    def get_page(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+        """Make a GET request and also return the response's pagination links.
+        
+        Args:
+            endpoint: API endpoint to call
+            params: Optional query parameters
+            headers: Optional additional headers
+        
+        Returns:
+            Tuple of the parsed JSON response and the Link header relations
+        """
+        response = self._make_request('GET', endpoint, params=params, headers=headers)
+        return self._parse(response), response.links
     
     def post(
         self,
@@ -179,7 +570,7 @@ class GitHubAPIClient:
         response = self._make_request(
             'POST', endpoint, params=params, data=data, headers=headers
         )
-        return response.json() if response.content else None
+        return self._parse(response)
     
     def put(
         self,
@@ -202,7 +593,7 @@ class GitHubAPIClient:
         response = self._make_request(
             'PUT', endpoint, params=params, data=data, headers=headers
         )
-        return response.json() if response.content else None
+        return self._parse(response)
     
     def patch(
         self,
@@ -225,7 +616,7 @@ class GitHubAPIClient:
         response = self._make_request(
             'PATCH', endpoint, params=params, data=data, headers=headers
         )
-        return response.json() if response.content else None
+        return self._parse(response)
     
     def delete(
         self,
@@ -246,7 +637,35 @@ class GitHubAPIClient:
         response = self._make_request(
             'DELETE', endpoint, params=params, headers=headers
         )
-        return response.json() if response.content else None
+        return self._parse(response)
+    
+    def head(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Make a HEAD request and return its status code.
+        
+        No body is transferred and error statuses are returned rather than
+        raised, so status-only checks skip the exception path. 429 replies
+        are retried as in _make_request.
+        
+        Args:
+            endpoint: API endpoint to call
+            params: Optional query parameters
+        
+        Returns:
+            HTTP status code of the response
+        """
+        url = self._prefix + (endpoint[1:] if endpoint.startswith('/') else endpoint)
+        retries = 0
+        
+        while True:
+            response = self._send('HEAD', url, params, None, None)
+            if response.status_code != 429 or retries >= self.max_retries:
+                return response.status_code
+            retries += 1
+            time.sleep(_compute_backoff(self.retry_delay, retries, response.headers))
     
     def get_raw(
         self,
@@ -264,12 +683,41 @@ class GitHubAPIClient:
         Returns:
             Raw response content as bytes
         """
-        headers = {}
-        if accept_format:
-            headers["Accept"] = accept_format
-            
+        headers = {"Accept": accept_format} if accept_format else None
         response = self._make_request('GET', endpoint, params=params, headers=headers)
         return response.content
+    
+    def iter_items(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterator[Any]:
+        """Make a GET request for a JSON array and iterate over its items.
+        
+        With ijson installed (and the requests transport), items are decoded
+        from the socket as they arrive, so a large page is never held in
+        memory as a whole. Otherwise the body is decoded in one go.
+        
+        Args:
+            endpoint: API endpoint to call
+            params: Optional query parameters
+            headers: Optional additional headers
+        
+        Yields:
+            Items of the JSON array returned by the endpoint
+        """
+        if not self._stream_items:
+            yield from self.get(endpoint, params=params, headers=headers) or []
+            return
+        
+        response = self._make_request(
+            'GET', endpoint, params=params, headers=headers, stream=True
+        )
+        with response:
+            # Let urllib3 undo any gzip/deflate before ijson sees the bytes
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, 'item', use_float=True)
 
 
 class GitHubStarsClient:
@@ -281,6 +729,8 @@ class GitHubStarsClient:
         api_key: Optional[str] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        transport: str = 'requests',
+        cache: bool = False,
     ):
         """Initialize the GitHub Stars client.
         
@@ -289,8 +739,12 @@ class GitHubStarsClient:
             api_key: Optional API key or access token for authentication
             max_retries: Maximum number of retry attempts for failed requests
             retry_delay: Initial delay between retries in seconds
+            transport: HTTP transport for GitHubAPIClient ('requests' or 'httpx')
+            cache: Cache GET responses on disk across runs (see GitHubAPIClient)
         """
-        self.api = GitHubAPIClient(base_url, api_key, max_retries, retry_delay)
+        self.api = GitHubAPIClient(
+            base_url, api_key, max_retries, retry_delay, transport=transport, cache=cache
+        )
     
     def list_repository_stars(
         self,
@@ -320,7 +774,7 @@ class GitHubStarsClient:
         if sort is not None:
             params['sort'] = sort
             
-        return self.api.get(f"repos/{owner}/{repo}/stargazers", params=params)
+        return self.api.get(_STARGAZERS_TMPL.format(owner, repo), params=params)
     
     def star_repository(self, owner: str, repo: str) -> None:
         """Star a repository.
@@ -329,7 +783,7 @@ class GitHubStarsClient:
             owner: Repository owner (username or organization)
             repo: Repository name
         """
-        self.api.put(f"user/starred/{owner}/{repo}", data={})
+        self.api.put(_STARRED_TMPL.format(owner, repo), data={})
     
     def unstar_repository(self, owner: str, repo: str) -> None:
         """Unstar a repository.
@@ -338,7 +792,7 @@ class GitHubStarsClient:
             owner: Repository owner (username or organization)
             repo: Repository name
         """
-        self.api.delete(f"user/starred/{owner}/{repo}")
+        self.api.delete(_STARRED_TMPL.format(owner, repo))
     
     def check_starred(self, owner: str, repo: str) -> bool:
         """Check if the authenticated user has starred a repository.
@@ -349,14 +803,56 @@ class GitHubStarsClient:
             
         Returns:
             Boolean indicating whether the repository is starred
+        
+        Raises:
+            requests.exceptions.HTTPError: If GitHub answers with anything
+                other than 204 (starred) or 404 (not starred)
         """
-        try:
-            self.api.get(f"user/starred/{owner}/{repo}")
-            return True
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                return False
-            raise
+        status = self.api.head(_STARRED_TMPL.format(owner, repo))
+        if status in (204, 404):
+            return status == 204
+        raise requests.exceptions.HTTPError(
+            f"Unexpected status {status} checking whether {owner}/{repo} is starred"
+        )
+    
+    def check_starred_many(
+        self,
+        repos: List[Tuple[str, str]],
+    ) -> Dict[Tuple[str, str], bool]:
+        """Check whether the authenticated user has starred several repositories.
+        
+        Each GraphQL request looks up to GRAPHQL_BATCH_SIZE repositories
+        through aliased ``repository { viewerHasStarred }`` fields, so N
+        checks cost about N / 100 round trips instead of N.
+        
+        Args:
+            repos: (owner, repo) pairs to check
+        
+        Returns:
+            Dictionary mapping each (owner, repo) pair to whether it is
+            starred; repositories that cannot be found map to False
+        """
+        starred = {}
+        for start in range(0, len(repos), GRAPHQL_BATCH_SIZE):
+            batch = repos[start:start + GRAPHQL_BATCH_SIZE]
+            declarations = []
+            fields = []
+            variables = {}
+            for i, (owner, repo) in enumerate(batch):
+                declarations.append(f"$o{i}: String!, $n{i}: String!")
+                fields.append(
+                    f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ viewerHasStarred }}"
+                )
+                variables[f"o{i}"] = owner
+                variables[f"n{i}"] = repo
+            query = f"query({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+            
+            result = self.api.post("graphql", data={"query": query, "variables": variables})
+            data = (result or {}).get("data") or {}
+            for i, pair in enumerate(batch):
+                node = data.get(f"r{i}")
+                starred[tuple(pair)] = bool(node and node.get("viewerHasStarred"))
+        return starred
     
     def list_starred_repositories(
         self,
@@ -401,56 +897,125 @@ class GitHubStarsClient:
         Returns:
             Integer count of stars
         """
-        repo_info = self.api.get(f"repos/{owner}/{repo}")
+        repo_info = self.api.get(_REPO_TMPL.format(owner, repo))
         return repo_info.get("stargazers_count", 0)
     
+    def iter_star_history(
+        self,
+        owner: str,
+        repo: str,
+        per_page: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over a repository's stargazers with timestamps.
+        
+        Pages are requested one after another and each stargazer is yielded
+        as soon as it has been decoded from the response (see
+        ``GitHubAPIClient.iter_items``), so memory use does not grow with the
+        number of stars. Iteration stops at the first short page.
+        
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            per_page: Number of results per page
+        
+        Yields:
+            Dictionaries containing stargazer information with timestamps
+        """
+        # GitHub API requires a specific Accept header to get timestamps
+        headers = _STAR_JSON_HEADERS
+        endpoint = _STARGAZERS_TMPL.format(owner, repo)
+        
+        # Pages are fetched one at a time, so a single params dict is reused
+        params = {"per_page": per_page}
+        page = 1
+        while True:
+            params["page"] = page
+            count = 0
+            try:
+                for star in self.api.iter_items(endpoint, params=params, headers=headers):
+                    count += 1
+                    yield star
+            except self.api.http_errors as e:
+                if e.response.status_code == 404:
+                    return
+                raise
+            if count < per_page:
+                return
+            page += 1
+    
     def get_star_history(
         self,
         owner: str,
         repo: str,
         per_page: int = 100,
+        concurrency: int = 10,
     ) -> List[Dict[str, Any]]:
         """Get historical data of stars for a repository with timestamps.
         
+        Page 1 is fetched first. When its Link header names the last page,
+        exactly the remaining pages are fetched on a thread pool sharing the
+        API session. Without one, pages are fetched ``concurrency`` at a time
+        until a window contains a short page. Pages are returned in order.
+        
         Args:
             owner: Repository owner (username or organization)
             repo: Repository name
             per_page: Number of results per page
+            concurrency: Number of pages fetched at once
             
         Returns:
             List of dictionaries containing stargazer information with timestamps
         """
         # GitHub API requires a specific Accept header to get timestamps
-        headers = {"Accept": "application/vnd.github.v3.star+json"}
-        
-        # Initial request
-        params = {"per_page": per_page, "page": 1}
-        star_history = self.api.get(
-            f"repos/{owner}/{repo}/stargazers",
-            params=params,
-            headers=headers,
-        )
-        
-        all_stars = star_history.copy()
+        headers = _STAR_JSON_HEADERS
+        endpoint = _STARGAZERS_TMPL.format(owner, repo)
         
-        # Get link header to check for pagination
-        # This is a simplified implementation that would need more work
-        # to properly handle GitHub's pagination links
-        while len(star_history) == per_page:
-            params["page"] += 1
+        def fetch(page: int) -> List[Dict[str, Any]]:
             try:
-                star_history = self.api.get(
-                    f"repos/{owner}/{repo}/stargazers",
-                    params=params,
+                return list(self.api.iter_items(
+                    endpoint,
+                    params={"per_page": per_page, "page": page},
                     headers=headers,
-                )
-                all_stars.extend(star_history)
-            except requests.exceptions.HTTPError as e:
+                ))
+            except self.api.http_errors as e:
                 if e.response.status_code == 404:
-                    break
+                    return []
                 raise
         
-        return all_stars
+        try:
+            stars, links = self.api.get_page(
+                endpoint, params={"per_page": per_page, "page": 1}, headers=headers
+            )
+        except self.api.http_errors as e:
+            if e.response.status_code == 404:
+                return []
+            raise
+        all_stars = list(stars or [])
+        last_page = _last_page(links)
+        
+        if last_page is not None:
+            if last_page > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(concurrency, last_page - 1)
+                ) as executor:
+                    for stars in executor.map(fetch, range(2, last_page + 1)):
+                        all_stars.extend(stars)
+            return all_stars
+        
+        if (links and 'next' not in links) or len(all_stars) < per_page:
+            # Page 1 was the only one
+            return all_stars
+        
+        # No Link header: keep fetching windows of pages until one is short
+        first = 2
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:
+                pages = executor.map(fetch, range(first, first + concurrency))
+                for stars in pages:
+                    all_stars.extend(stars)
+                    if len(stars) < per_page:
+                        return all_stars
+                first += concurrency
     
     def get_trending_repositories(
         self,
@@ -523,6 +1088,359 @@ class GitHubStarsClient:
         return self.api.get("user/recommendations/repositories", params=params)
 
 
+class AsyncGitHubAPIClient:
+    """Asynchronous counterpart of GitHubAPIClient built on aiohttp.
+    
+    One aiohttp.ClientSession carrying the authentication headers is shared by
+    every request, so concurrent calls reuse its pooled connections. Use the
+    client as an async context manager, or call close() when done.
+    """
+    
+    @property
+    def logger(self) -> logging.Logger:
+        """The module-level logger, kept as an attribute for compatibility."""
+        return logger
+    
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ):
+        """Initialize the asynchronous GitHub API client.
+        
+        Args:
+            base_url: The base URL for the GitHub API
+            api_key: Optional API key or access token for authentication
+            max_retries: Maximum number of retry attempts for failed requests
+            retry_delay: Initial delay between retries in seconds (grows exponentially, with jitter)
+        
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncGitHubAPIClient requires the aiohttp package")
+        self.base_url = base_url.rstrip('/')
+        # Prefix joined to each endpoint, so requests only concatenate
+        self._prefix = self.base_url + '/'
+        self.api_key = api_key
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.headers = {
+            "Accept": "application/json",
+        }
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
+        self.session = None
+    
+    async def __aenter__(self) -> "AsyncGitHubAPIClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the shared session and its connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Any, Any]:
+        """Make an HTTP request with retry logic and return the parsed JSON.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            endpoint: API endpoint to call (relative to base_url)
+            params: Optional query parameters
+            data: Optional request body data (will be converted to JSON)
+            headers: Optional additional headers
+        
+        Returns:
+            Tuple of the parsed JSON response (None for an empty body) and
+            the response's Link header relations
+        
+        Raises:
+            aiohttp.ClientResponseError: On a 4xx reply, or a 429 or 5xx
+                reply that is still failing after the retries
+            aiohttp.ClientError: If the connection keeps failing
+        """
+        # aiohttp sessions must be created inside the running event loop
+        if self.session is None:
+            self.session = aiohttp.ClientSession(headers=self.headers)
+        url = self._prefix + (endpoint[1:] if endpoint.startswith('/') else endpoint)
+        
+        retries = 0
+        
+        while True:
+            try:
+                async with self.session.request(
+                    method.upper(), url, params=params, json=data, headers=headers
+                ) as response:
+                    # 429 and 5xx replies are retried; other errors, and the
+                    # last rejected attempt, are raised with their status
+                    retryable = response.status == 429 or response.status >= 500
+                    if not retryable or retries >= self.max_retries:
+                        response.raise_for_status()
+                        body = await response.read()
+                        return (json_loads(body) if body else None), response.links
+                    
+                    retries += 1
+                    delay = _compute_backoff(self.retry_delay, retries, response.headers)
+                    if response.status == 429:
+                        logger.warning("Rate limited. Retrying after %.2f seconds.", delay)
+                    else:
+                        logger.warning(
+                            "Server error %d, retrying (%d/%d)",
+                            response.status, retries, self.max_retries,
+                        )
+            
+            except aiohttp.ClientResponseError:
+                raise
+            except aiohttp.ClientError as e:
+                # Connection errors: determine if we should retry
+                if retries >= self.max_retries:
+                    logger.error("Request failed after %d retries: %s", retries, e)
+                    raise
+                
+                retries += 1
+                delay = _compute_backoff(self.retry_delay, retries)
+                logger.warning(
+                    "Request failed, retrying (%d/%d): %s", retries, self.max_retries, e
+                )
+            
+            await asyncio.sleep(delay)
+    
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Make a GET request to the API.
+        
+        Args:
+            endpoint: API endpoint to call
+            params: Optional query parameters
+            headers: Optional additional headers
+        
+        Returns:
+            Parsed JSON response as Python object
+        """
+        body, _ = await self._make_request('GET', endpoint, params=params, headers=headers)
+        return body
+    
+    async def get_page(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Any, Any]:
+        """Make a GET request and also return the response's pagination links.
+        
+        Args:
+            endpoint: API endpoint to call
+            params: Optional query parameters
+            headers: Optional additional headers
+        
+        Returns:
+            Tuple of the parsed JSON response and the Link header relations
+        """
+        return await self._make_request('GET', endpoint, params=params, headers=headers)
+
+
+class AsyncGitHubStarsClient:
+    """Asynchronous client for star operations that fan out over many pages."""
+    
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ):
+        """Initialize the asynchronous GitHub Stars client.
+        
+        Args:
+            base_url: The base URL for the GitHub API
+            api_key: Optional API key or access token for authentication
+            max_retries: Maximum number of retry attempts for failed requests
+            retry_delay: Initial delay between retries in seconds
+        """
+        self.api = AsyncGitHubAPIClient(base_url, api_key, max_retries, retry_delay)
+    
+    async def __aenter__(self) -> "AsyncGitHubStarsClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the underlying API client."""
+        await self.api.close()
+    
+    async def iter_star_history(
+        self,
+        owner: str,
+        repo: str,
+        per_page: int = 100,
+        prefetch: int = 5,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over a repository's stargazers with timestamps.
+        
+        Page 1 is fetched first; after it, up to ``prefetch`` pages are kept
+        in flight: as soon as the oldest page has been yielded, the next one
+        is requested. Memory stays at about ``prefetch`` pages however many
+        stars the repository has, and decoding overlaps with the network wait
+        for later pages. When page 1's Link header names the last page, no
+        page past it is requested; otherwise iteration stops at the first
+        short page.
+        
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            per_page: Number of results per page
+            prefetch: Number of pages requested ahead of the consumer
+        
+        Yields:
+            Dictionaries containing stargazer information with timestamps
+        """
+        # GitHub API requires a specific Accept header to get timestamps
+        headers = _STAR_JSON_HEADERS
+        endpoint = _STARGAZERS_TMPL.format(owner, repo)
+        
+        async def fetch(page: int) -> Tuple[List[Dict[str, Any]], Any]:
+            try:
+                stars, links = await self.api.get_page(
+                    endpoint,
+                    params={"per_page": per_page, "page": page},
+                    headers=headers,
+                )
+            except aiohttp.ClientResponseError as e:
+                if e.status == 404:
+                    return [], None
+                raise
+            return stars or [], links
+        
+        stars, links = await fetch(1)
+        for star in stars:
+            yield star
+        last_page = _last_page(links)
+        if last_page is None and ((links and 'next' not in links) or len(stars) < per_page):
+            # Page 1 was the only one
+            return
+        
+        pending = deque()
+        next_page = 2
+        try:
+            while True:
+                while len(pending) < prefetch and (
+                    last_page is None or next_page <= last_page
+                ):
+                    pending.append(asyncio.create_task(fetch(next_page)))
+                    next_page += 1
+                if not pending:
+                    return
+                stars, _ = await pending.popleft()
+                for star in stars:
+                    yield star
+                if len(stars) < per_page:
+                    return
+        finally:
+            # Pages requested past the end, or abandoned by the consumer
+            for task in pending:
+                task.cancel()
+    
+    async def get_star_history(
+        self,
+        owner: str,
+        repo: str,
+        per_page: int = 100,
+        concurrency: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """Get historical data of stars for a repository with timestamps.
+        
+        Collects iter_star_history, keeping ``concurrency`` pages in flight.
+        
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            per_page: Number of results per page
+            concurrency: Number of pages requested at once
+        
+        Returns:
+            List of dictionaries containing stargazer information with timestamps
+        """
+        return [
+            star
+            async for star in self.iter_star_history(
+                owner, repo, per_page=per_page, prefetch=concurrency
+            )
+        ]
+    
+    async def get_trending_repositories(
+        self,
+        language: Optional[str] = None,
+        since: Optional[str] = None,
+        spoken_language: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get trending repositories based on stars.
+        
+        Args:
+            language: Filter by programming language
+            since: Time period (daily, weekly, monthly)
+            spoken_language: Filter by natural language
+        
+        Returns:
+            List of dictionaries containing trending repository information
+        """
+        params = {}
+        if language:
+            params["language"] = language
+        if since:
+            params["since"] = since
+        if spoken_language:
+            params["spoken_language_code"] = spoken_language
+        
+        return await self.api.get("trending/repositories", params=params)
+
+
+def fetch_star_history(
+    base_url: str,
+    owner: str,
+    repo: str,
+    api_key: Optional[str] = None,
+    per_page: int = 100,
+) -> List[Dict[str, Any]]:
+    """Synchronous wrapper around AsyncGitHubStarsClient.get_star_history.
+    
+    Runs the concurrent fetch on a fresh event loop, so it must not be called
+    from code that is already running inside one.
+    
+    Args:
+        base_url: The base URL for the GitHub API
+        owner: Repository owner (username or organization)
+        repo: Repository name
+        api_key: Optional API key or access token for authentication
+        per_page: Number of results per page
+    
+    Returns:
+        List of dictionaries containing stargazer information with timestamps
+    """
+    async def run() -> List[Dict[str, Any]]:
+        async with AsyncGitHubStarsClient(base_url, api_key) as client:
+            return await client.get_star_history(owner, repo, per_page=per_page)
+    
+    return asyncio.run(run())
+
+
 # Example usage
 if __name__ == "__main__":
     # Initialize the client
@@ -1,7 +1,48 @@
 import requests
-import json
-from typing import Dict, List, Optional, Union, Any
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Any
+
+
+# orjson decodes JSON several times faster than the stdlib when installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+
+# urllib3 can only decode brotli when the brotli package is installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+
+# Maximum number of GET responses remembered for conditional requests
+ETAG_CACHE_MAXSIZE = 1024
+
+# Bytes read at a time when streaming exports
+EXPORT_CHUNK_SIZE = 65536
+
+# Replies retried with exponential backoff, honouring Retry-After
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _now_iso() -> str:
+    """
+    Current UTC time as an ISO 8601 string with a Z suffix, to the second.
+    
+    Formats time.gmtime() directly, which is several times cheaper than
+    building a datetime for every record in bulk imports.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 class StargazersClient:
@@ -9,26 +50,103 @@ class StargazersClient:
     A client for interacting with the Stargazers API.
     """
     
-    def __init__(self, base_url: str, api_key: Optional[str] = None):
+    def __init__(self, base_url: str, api_key: Optional[str] = None,
+                 max_retries: int = 5, pool_connections: int = 16, pool_maxsize: int = 64):
         """
         Initialize a new Stargazers API client.
         
         Args:
             base_url: The base URL for the Stargazers API
             api_key: Optional API key for authentication
+            max_retries: Retries for connection errors and 429/5xx replies
+            pool_connections: Number of host connection pools to keep
+            pool_maxsize: Connections kept alive per host, which bounds how
+                many concurrent calls avoid opening a fresh socket
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.session = requests.Session()
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "PUT", "DELETE", "POST"]),
+            respect_retry_after_header=True,
+            # Hand the last reply back so raise_for_status() reports it
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                              max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # (url, params) -> (ETag, parsed body), least recently used first;
+        # the lock keeps concurrent calls from racing on eviction
+        self._etag_cache = OrderedDict()
+        self._etag_lock = threading.Lock()
         
         if api_key:
             self.session.headers.update({"Authorization": f"Bearer {api_key}"})
         
         self.session.headers.update({
             "Content-Type": "application/json",
-            "Accept": "application/json"
+            "Accept": "application/json",
+            # Set explicitly so compression survives any header overrides;
+            # urllib3 decompresses as the body (or a streamed export) is read
+            "Accept-Encoding": ACCEPT_ENCODING
         })
     
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: Optional[int],
+                     sort_by: Optional[str]) -> Dict[str, Any]:
+        """
+        Build the query parameters of a paginated listing.
+        """
+        params = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        if sort_by is not None:
+            params['sort_by'] = sort_by
+        return params
+    
+    def _cached_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Make a GET request, revalidating earlier responses with their ETag.
+        
+        A 304 Not Modified reply has no body and is answered from the cache,
+        so unchanged resources cost neither bandwidth nor JSON decoding.
+        
+        Args:
+            url: Full URL to request
+            params: Optional query parameters
+            
+        Returns:
+            Parsed JSON response
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
+        response = self.session.get(url, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            with self._etag_lock:
+                if key in self._etag_cache:
+                    self._etag_cache.move_to_end(key)
+            return cached[1]
+        response.raise_for_status()
+        body = _loads(response.content)
+        
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, body)
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > ETAG_CACHE_MAXSIZE:
+                    self._etag_cache.popitem(last=False)
+        return body
+    
     def list_stargazers(self, 
                       repository_id: str,
                       limit: Optional[int] = None, 
@@ -46,17 +164,8 @@ class StargazersClient:
         Returns:
             Dictionary containing stargazer data and pagination info
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        if sort_by is not None:
-            params['sort_by'] = sort_by
-            
-        response = self.session.get(f"{self.base_url}/repositories/{repository_id}/stargazers", params=params)
-        response.raise_for_status()
-        return response.json()
+        params = self._page_params(limit, offset, sort_by)
+        return self._cached_get(f"{self.base_url}/repositories/{repository_id}/stargazers", params=params)
     
     def get_stargazer(self, repository_id: str, user_id: str) -> Dict[str, Any]:
         """
@@ -69,9 +178,7 @@ class StargazersClient:
         Returns:
             Dictionary containing stargazer details
         """
-        response = self.session.get(f"{self.base_url}/repositories/{repository_id}/stargazers/{user_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(f"{self.base_url}/repositories/{repository_id}/stargazers/{user_id}")
     
     def add_stargazer(self, repository_id: str, user_id: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -87,7 +194,7 @@ class StargazersClient:
         """
         data = {
             "user_id": user_id,
-            "starred_at": datetime.utcnow().isoformat()
+            "starred_at": _now_iso()
         }
         
         if metadata:
@@ -95,7 +202,7 @@ class StargazersClient:
             
         response = self.session.post(f"{self.base_url}/repositories/{repository_id}/stargazers", json=data)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def remove_stargazer(self, repository_id: str, user_id: str) -> None:
         """
@@ -118,9 +225,7 @@ class StargazersClient:
         Returns:
             Integer count of stargazers
         """
-        response = self.session.get(f"{self.base_url}/repositories/{repository_id}/stargazers/count")
-        response.raise_for_status()
-        return response.json().get("count", 0)
+        return self._cached_get(f"{self.base_url}/repositories/{repository_id}/stargazers/count").get("count", 0)
     
     def list_user_starred_repositories(self, 
                                      user_id: str,
@@ -139,17 +244,8 @@ class StargazersClient:
         Returns:
             Dictionary containing repository data and pagination info
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        if sort_by is not None:
-            params['sort_by'] = sort_by
-            
-        response = self.session.get(f"{self.base_url}/users/{user_id}/starred", params=params)
-        response.raise_for_status()
-        return response.json()
+        params = self._page_params(limit, offset, sort_by)
+        return self._cached_get(f"{self.base_url}/users/{user_id}/starred", params=params)
     
     def is_repository_starred(self, repository_id: str, user_id: str) -> bool:
         """
@@ -162,14 +258,35 @@ class StargazersClient:
         Returns:
             Boolean indicating whether the repository is starred by the user
         """
-        try:
-            response = self.session.get(f"{self.base_url}/repositories/{repository_id}/stargazers/{user_id}")
-            response.raise_for_status()
-            return True
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                return False
-            raise
+        response = self.session.get(f"{self.base_url}/repositories/{repository_id}/stargazers/{user_id}")
+        # A 404 means "not starred"; checking the code avoids raising and catching an HTTPError
+        if response.status_code == 404:
+            return False
+        response.raise_for_status()
+        return True
+    
+    def bulk_is_starred(self, pairs: List[Tuple[str, str]],
+                        max_workers: int = 16) -> Dict[Tuple[str, str], bool]:
+        """
+        Check several (repository, user) pairs at once.
+        
+        The Stargazers API has no batch endpoint, so the lookups are sent
+        concurrently over the session's connection pool: N checks take about
+        N / max_workers round trips instead of N.
+        
+        Args:
+            pairs: (repository_id, user_id) pairs to check
+            max_workers: Maximum number of lookups in flight
+            
+        Returns:
+            Dictionary mapping each pair to whether the user starred the repository
+        """
+        pairs = [tuple(pair) for pair in pairs]
+        if not pairs:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+            results = executor.map(lambda pair: self.is_repository_starred(*pair), pairs)
+            return dict(zip(pairs, results))
     
     def get_star_history(self, repository_id: str, 
                         interval: str = "day",
@@ -194,9 +311,7 @@ class StargazersClient:
         if end_date:
             params["end_date"] = end_date
             
-        response = self.session.get(f"{self.base_url}/repositories/{repository_id}/star-history", params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(f"{self.base_url}/repositories/{repository_id}/star-history", params=params)
     
     def get_top_stargazers(self, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
         """
@@ -212,9 +327,7 @@ class StargazersClient:
         if limit is not None:
             params['limit'] = limit
             
-        response = self.session.get(f"{self.base_url}/stargazers/top", params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(f"{self.base_url}/stargazers/top", params=params)
     
     def get_trending_repositories(self, 
                                 period: str = "day",
@@ -242,30 +355,131 @@ class StargazersClient:
         if limit is not None:
             params["limit"] = limit
             
-        response = self.session.get(f"{self.base_url}/repositories/trending", params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(f"{self.base_url}/repositories/trending", params=params)
     
-    def export_stargazers(self, repository_id: str, format: str = "json") -> bytes:
+    def export_stargazers(self, repository_id: str, format: str = "json", *,
+                          chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
         """
         Export the list of stargazers for a repository in the specified format.
         
+        The export is streamed: chunks are yielded as they arrive, so memory
+        use stays at one chunk however large the export is. The request is
+        sent when iteration starts.
+        
         Args:
             repository_id: The unique identifier of the repository
             format: Export format (json, csv, xml)
+            chunk_size: Maximum number of bytes per chunk
             
-        Returns:
-            Bytes containing the exported data
+        Yields:
+            Consecutive chunks of the exported data
         """
         params = {"format": format}
         
-        response = self.session.get(
+        with self.session.get(
             f"{self.base_url}/repositories/{repository_id}/stargazers/export", 
             params=params,
-            headers={"Accept": f"application/{format}"}
+            headers={"Accept": f"application/{format}"},
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size=chunk_size)
+    
+    def export_stargazers_to_file(self, repository_id: str, path: str, format: str = "json", *,
+                                  chunk_size: int = EXPORT_CHUNK_SIZE) -> int:
+        """
+        Export the list of stargazers for a repository straight to a file.
+        
+        Args:
+            repository_id: The unique identifier of the repository
+            path: File to write the export to
+            format: Export format (json, csv, xml)
+            chunk_size: Maximum number of bytes read and written at a time
+            
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        with open(path, "wb") as f:
+            for chunk in self.export_stargazers(repository_id, format, chunk_size=chunk_size):
+                written += f.write(chunk)
+        return written
+
+
+class HTTP2StargazersClient(StargazersClient):
+    """
+    A Stargazers API client that can also issue requests over HTTP/2.
+    
+    The synchronous methods behave exactly as in StargazersClient. The
+    ``a``-prefixed coroutines share one httpx.AsyncClient, which multiplexes
+    concurrent requests as streams over a few connections instead of one
+    connection per in-flight request. Requires ``httpx[http2]``.
+    """
+    
+    def __init__(self, base_url: str, api_key: Optional[str] = None, **kwargs: Any):
+        """
+        Initialize a new HTTP/2-capable Stargazers API client.
+        
+        Args:
+            base_url: The base URL for the Stargazers API
+            api_key: Optional API key for authentication
+            **kwargs: Passed on to StargazersClient
+        """
+        super().__init__(base_url, api_key, **kwargs)
+        self._async_client = None
+    
+    def _http2_client(self) -> Any:
+        """
+        Get the shared httpx.AsyncClient, creating it on first use.
+        """
+        if self._async_client is None:
+            import httpx
+            # Connection-specific headers are not allowed over HTTP/2
+            headers = {k: v for k, v in self.session.headers.items() if k.lower() != "connection"}
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=4, max_connections=16),
+                headers=headers,
+            )
+        return self._async_client
+    
+    async def aclose(self) -> None:
+        """
+        Close the HTTP/2 connections, if any were opened.
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+    
+    async def __aenter__(self) -> "HTTP2StargazersClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    async def alist_stargazers(self, 
+                             repository_id: str,
+                             limit: Optional[int] = None, 
+                             offset: Optional[int] = None,
+                             sort_by: Optional[str] = None) -> Dict[str, Any]:
+        """
+        List stargazers for a repository over HTTP/2; see list_stargazers.
+        
+        Args:
+            repository_id: The unique identifier of the repository
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            sort_by: Field to sort by (e.g., "starred_at", "username")
+            
+        Returns:
+            Dictionary containing stargazer data and pagination info
+        """
+        params = self._page_params(limit, offset, sort_by)
+        response = await self._http2_client().get(
+            f"{self.base_url}/repositories/{repository_id}/stargazers", params=params
         )
         response.raise_for_status()
-        return response.content
+        return _loads(response.content)
 
 
 # Example usage:
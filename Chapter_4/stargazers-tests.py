@@ -0,0 +1,167 @@
+import json
+import unittest
+from unittest.mock import patch
+import requests
+
+# Import the module we want to test
+# Note: You'll need to adjust this import to match your actual file structure
+import stargazers
+
+
+def _http_response(status, payload=None, headers=None):
+    """Build a real requests.Response as a transport adapter would return it."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload).encode() if payload is not None else b''
+    response.headers.update(headers or {})
+    response.encoding = 'utf-8'
+    return response
+
+
+class TestResultCache(unittest.TestCase):
+    """Test cases for the TTL/LRU cache in front of the read-only helpers."""
+
+    def setUp(self):
+        stargazers._CACHE.clear()
+        patcher = patch.object(requests.Session, 'request', return_value=_http_response(204))
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(stargazers._CACHE.clear)
+
+    def test_cache_hit(self):
+        """Test that a repeated call is answered from the cache."""
+        self.assertTrue(stargazers.check_if_starred("token", "octocat", "hello-world"))
+        self.assertTrue(stargazers.check_if_starred("token", "octocat", "hello-world"))
+
+        self.mock_request.assert_called_once()
+
+    def test_defaults_share_entry(self):
+        """Test that omitted and explicit default arguments hit the same entry."""
+        self.mock_request.return_value = _http_response(200, [{"login": "user1"}])
+
+        first = stargazers.list_stargazers("token", "octocat", "hello-world")
+        second = stargazers.list_stargazers("token", "octocat", "hello-world", per_page=100, page=1)
+
+        self.assertIs(second, first)
+        self.mock_request.assert_called_once()
+
+    @patch('time.monotonic')
+    def test_entry_expires_after_ttl(self, mock_monotonic):
+        """Test that an entry older than CACHE_TTL is fetched again."""
+        mock_monotonic.return_value = 1000.0
+        stargazers.check_if_starred("token", "octocat", "hello-world")
+
+        mock_monotonic.return_value = 1000.0 + stargazers.CACHE_TTL - 1
+        stargazers.check_if_starred("token", "octocat", "hello-world")
+        self.assertEqual(self.mock_request.call_count, 1)
+
+        mock_monotonic.return_value = 1000.0 + stargazers.CACHE_TTL
+        stargazers.check_if_starred("token", "octocat", "hello-world")
+        self.assertEqual(self.mock_request.call_count, 2)
+
+    @patch.object(stargazers, 'CACHE_MAXSIZE', 2)
+    def test_least_recently_used_entry_evicted(self):
+        """Test that the cache keeps CACHE_MAXSIZE entries, evicting the oldest."""
+        stargazers.check_if_starred("token", "octocat", "a")
+        stargazers.check_if_starred("token", "octocat", "b")
+        # Using "a" again makes "b" the least recently used entry
+        stargazers.check_if_starred("token", "octocat", "a")
+        stargazers.check_if_starred("token", "octocat", "c")
+        self.assertEqual(self.mock_request.call_count, 3)
+        self.assertEqual(len(stargazers._CACHE), 2)
+
+        stargazers.check_if_starred("token", "octocat", "a")
+        self.assertEqual(self.mock_request.call_count, 3)
+        stargazers.check_if_starred("token", "octocat", "b")
+        self.assertEqual(self.mock_request.call_count, 4)
+
+    def test_star_repository_invalidates_token_entries(self):
+        """Test that starring drops the token's cached results, and only those."""
+        self.mock_request.return_value = _http_response(404)
+        self.assertFalse(stargazers.check_if_starred("token", "octocat", "hello-world"))
+        stargazers.check_if_starred("other", "octocat", "hello-world")
+
+        self.mock_request.return_value = _http_response(204)
+        stargazers.star_repository("token", "octocat", "hello-world")
+        self.assertEqual(self.mock_request.call_count, 3)
+
+        self.assertTrue(stargazers.check_if_starred("token", "octocat", "hello-world"))
+        self.assertEqual(self.mock_request.call_count, 4)
+        # The other token's entry is still cached
+        self.assertFalse(stargazers.check_if_starred("other", "octocat", "hello-world"))
+        self.assertEqual(self.mock_request.call_count, 4)
+
+    def test_unstar_repository_invalidates_token_entries(self):
+        """Test that unstarring drops the token's cached results."""
+        self.assertTrue(stargazers.check_if_starred("token", "octocat", "hello-world"))
+        stargazers.unstar_repository("token", "octocat", "hello-world")
+
+        self.mock_request.return_value = _http_response(404)
+        self.assertFalse(stargazers.check_if_starred("token", "octocat", "hello-world"))
+        self.assertEqual(self.mock_request.call_count, 3)
+
+    def test_tokens_never_share_entries(self):
+        """Test that identical calls made with different tokens are fetched separately."""
+        self.assertTrue(stargazers.check_if_starred("token-a", "octocat", "hello-world"))
+        self.mock_request.return_value = _http_response(404)
+        self.assertFalse(stargazers.check_if_starred("token-b", "octocat", "hello-world"))
+
+        self.assertEqual(self.mock_request.call_count, 2)
+        self.assertTrue(stargazers.check_if_starred("token-a", "octocat", "hello-world"))
+        self.assertEqual(self.mock_request.call_count, 2)
+
+
+class TestIterLimited(unittest.TestCase):
+    """Test cases for the page sizing of limited listings."""
+
+    # limit -> (per_page, page) requests expected against a 345-star repository
+    CASES = (
+        (1, [(1, 1)]),
+        (100, [(100, 1)]),
+        (101, [(100, 1), (1, 101)]),
+        (120, [(100, 1), (20, 6)]),
+        (130, [(100, 1), (50, 3)]),
+        (250, [(100, 1), (100, 2), (50, 5)]),
+    )
+
+    def _serve(self, total):
+        """Patch the session to page through `total` stargazers."""
+        users = [{"login": f"user{i}"} for i in range(total)]
+
+        def page(method, url, params=None, **kwargs):
+            start = (params["page"] - 1) * params["per_page"]
+            return _http_response(200, users[start:start + params["per_page"]])
+
+        patcher = patch.object(requests.Session, 'request', side_effect=page)
+        mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+        return users, mock_request
+
+    @staticmethod
+    def _pages(mock_request):
+        return [(c.kwargs["params"]["per_page"], c.kwargs["params"]["page"])
+                for c in mock_request.call_args_list]
+
+    def test_page_sizes_for_limit(self):
+        """Test the requests made and the items yielded for each limit."""
+        users, mock_request = self._serve(345)
+        for limit, expected in self.CASES:
+            with self.subTest(limit=limit):
+                mock_request.reset_mock()
+                stars = list(stargazers.iter_stargazers("token", "octocat", "hello-world", limit=limit))
+
+                self.assertEqual(self._pages(mock_request), expected)
+                self.assertEqual(stars, users[:limit])
+
+    def test_stops_when_server_returns_fewer_items(self):
+        """Test that a short page ends the listing before the limit is reached."""
+        users, mock_request = self._serve(150)
+
+        stars = list(stargazers.iter_stargazers("token", "octocat", "hello-world", limit=250))
+
+        self.assertEqual(self._pages(mock_request), [(100, 1), (100, 2)])
+        self.assertEqual(stars, users)
+
+
+if __name__ == '__main__':
+    unittest.main()
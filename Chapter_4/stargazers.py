@@ -1,5 +1,119 @@
+import asyncio
+import functools
+import inspect
+import re
+import threading
+import time
+from collections import OrderedDict
 import requests
-from typing import Dict, List, Optional, Union, Any
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Any
+
+try:
+    import aiohttp
+except ImportError:  # only needed by the list_all_* coroutines
+    aiohttp = None
+
+# orjson decodes GitHub's JSON several times faster than the stdlib when installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# Page number of the rel="last" entry in a Link header
+_LAST_PAGE_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# (URL, rel) pairs of a Link header, found in a single pass
+_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="(\w+)"')
+
+# Repositories looked up per GraphQL request by check_if_starred_many
+GRAPHQL_BATCH_SIZE = 100
+
+# Per-call override on top of the session headers that adds starred_at timestamps
+_STAR_HEADERS = {"Accept": "application/vnd.github.star+json"}
+
+# One keep-alive session per token, so repeated calls reuse pooled
+# connections instead of paying a TCP + TLS handshake each time
+_SESSIONS: Dict[str, requests.Session] = {}
+
+def _default_headers(token: str) -> Dict[str, str]:
+    """
+    Headers sent with every request for a token
+    """
+    return {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28"
+    }
+
+def _get_session(token: str) -> requests.Session:
+    """
+    Get the shared session for a token, creating it on first use
+    
+    Args:
+        token: GitHub personal access token
+        
+    Returns:
+        Session carrying the token and the default GitHub headers
+    """
+    session = _SESSIONS.get(token)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(_default_headers(token))
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=20))
+        _SESSIONS[token] = session
+    return session
+
+# Short-lived cache of GET results: (function, arguments) -> (expiry, result)
+CACHE_TTL = 60
+CACHE_MAXSIZE = 1024
+_CACHE: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+def _ttl_lru_cache(func):
+    """
+    Cache a read-only helper's result for CACHE_TTL seconds
+    
+    Keys are the function plus all its arguments (token included), so
+    callers with different tokens never share entries. At most CACHE_MAXSIZE
+    results are kept, least recently used evicted first. Cached results are
+    shared objects: copy them before modifying.
+    """
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (func.__name__, *bound.arguments.values())
+        now = time.monotonic()
+        with _CACHE_LOCK:
+            entry = _CACHE.get(key)
+            if entry and entry[0] > now:
+                _CACHE.move_to_end(key)
+                return entry[1]
+        
+        result = func(*args, **kwargs)
+        with _CACHE_LOCK:
+            _CACHE[key] = (now + CACHE_TTL, result)
+            _CACHE.move_to_end(key)
+            if len(_CACHE) > CACHE_MAXSIZE:
+                _CACHE.popitem(last=False)
+        return result
+    return wrapper
+
+def _invalidate_cache(token: str) -> None:
+    """
+    Drop every cached result fetched with a token
+    
+    Starring or unstarring changes the star checks, counts and starred
+    listings cached for that token, so they are all refetched.
+    """
+    with _CACHE_LOCK:
+        for key in [key for key in _CACHE if key[1] == token]:
+            del _CACHE[key]
 
 def star_repository(token: str, owner: str, repo: str) -> None:
     """
@@ -16,14 +130,10 @@ def star_repository(token: str, owner: str, repo: str) -> None:
     Endpoint: PUT /user/starred/{owner}/{repo}
     """
     url = f"https://api.github.com/user/starred/{owner}/{repo}"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
-    
-    response = requests.put(url, headers=headers)
+    session = _get_session(token)
+    response = session.put(url)
     response.raise_for_status()
+    _invalidate_cache(token)
     return None  # Returns 204 No Content on success
 
 def unstar_repository(token: str, owner: str, repo: str) -> None:
@@ -41,16 +151,13 @@ def unstar_repository(token: str, owner: str, repo: str) -> None:
     Endpoint: DELETE /user/starred/{owner}/{repo}
     """
     url = f"https://api.github.com/user/starred/{owner}/{repo}"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
-    
-    response = requests.delete(url, headers=headers)
+    session = _get_session(token)
+    response = session.delete(url)
     response.raise_for_status()
+    _invalidate_cache(token)
     return None  # Returns 204 No Content on success
 
+@_ttl_lru_cache
 def check_if_starred(token: str, owner: str, repo: str) -> bool:
     """
     Check if the authenticated user has starred a repository
@@ -66,13 +173,8 @@ def check_if_starred(token: str, owner: str, repo: str) -> bool:
     Endpoint: GET /user/starred/{owner}/{repo}
     """
     url = f"https://api.github.com/user/starred/{owner}/{repo}"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
-    
-    response = requests.get(url, headers=headers)
+    session = _get_session(token)
+    response = session.get(url)
     
     # 204 No Content if starred, 404 Not Found if not starred
     if response.status_code == 204:
@@ -82,9 +184,89 @@ def check_if_starred(token: str, owner: str, repo: str) -> bool:
     else:
         response.raise_for_status()
 
+def check_if_starred_many(token: str, repos: List[Tuple[str, str]]) -> Dict[Tuple[str, str], bool]:
+    """
+    Check whether the authenticated user has starred several repositories
+    
+    Each GraphQL request looks up to GRAPHQL_BATCH_SIZE repositories through
+    aliased `repository { viewerHasStarred }` fields, so N checks cost about
+    N / 100 round trips instead of N.
+    
+    Args:
+        token: GitHub personal access token
+        repos: (owner, repo) pairs to check
+        
+    Returns:
+        Dictionary mapping each (owner, repo) pair to whether it is starred;
+        repositories that cannot be found map to False
+        
+    Endpoint: POST /graphql
+    """
+    session = _get_session(token)
+    
+    starred = {}
+    for start in range(0, len(repos), GRAPHQL_BATCH_SIZE):
+        batch = repos[start:start + GRAPHQL_BATCH_SIZE]
+        declarations = []
+        fields = []
+        variables = {}
+        for i, (owner, repo) in enumerate(batch):
+            declarations.append(f"$o{i}: String!, $n{i}: String!")
+            fields.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ viewerHasStarred }}")
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = repo
+        query = f"query({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+        
+        response = session.post("https://api.github.com/graphql",
+                                json={"query": query, "variables": variables})
+        response.raise_for_status()
+        data = _loads(response.content).get("data") or {}
+        for i, pair in enumerate(batch):
+            node = data.get(f"r{i}")
+            starred[tuple(pair)] = bool(node and node.get("viewerHasStarred"))
+    return starred
+
+def _list_starred(token: str, username: Optional[str], params: Dict[str, Any], *,
+                  with_timestamps: bool = False) -> List[Dict]:
+    """
+    Fetch one page of a user's starred repositories
+    
+    Shared by list_starred_repositories and its timestamped variant, which
+    differ only in the query parameters and the Accept header.
+    """
+    if username:
+        url = f"https://api.github.com/users/{username}/starred"
+    else:
+        url = "https://api.github.com/user/starred"
+    
+    response = _get_session(token).get(url, headers=_STAR_HEADERS if with_timestamps else None,
+                                       params=params)
+    response.raise_for_status()
+    return _loads(response.content)
+
+def _list_stargazers(token: str, owner: str, repo: str, per_page: int, page: int, *,
+                     with_timestamps: bool = False) -> List[Dict]:
+    """
+    Fetch one page of a repository's stargazers
+    
+    Shared by list_stargazers and list_stargazers_with_timestamps, which
+    differ only in the Accept header.
+    """
+    url = f"https://api.github.com/repos/{owner}/{repo}/stargazers"
+    params = {
+        "per_page": per_page,
+        "page": page
+    }
+    
+    response = _get_session(token).get(url, headers=_STAR_HEADERS if with_timestamps else None,
+                                       params=params)
+    response.raise_for_status()
+    return _loads(response.content)
+
+@_ttl_lru_cache
 def list_starred_repositories(token: str, username: Optional[str] = None, 
                              sort: str = "created", direction: str = "desc", 
-                             per_page: int = 30, page: int = 1) -> List[Dict]:
+                             per_page: int = 100, page: int = 1) -> List[Dict]:
     """
     List repositories starred by a user
     
@@ -93,7 +275,7 @@ def list_starred_repositories(token: str, username: Optional[str] = None,
         username: GitHub username (if None, lists repositories starred by authenticated user)
         sort: Sort by "created" (when starred) or "updated" (default: "created")
         direction: Sort direction, "asc" or "desc" (default: "desc")
-        per_page: Results per page (default: 30, max: 100)
+        per_page: Results per page (default: 100, the maximum)
         page: Page number (default: 1)
         
     Returns:
@@ -103,29 +285,16 @@ def list_starred_repositories(token: str, username: Optional[str] = None,
         - GET /user/starred (authenticated user)
         - GET /users/{username}/starred (specific user)
     """
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
-    
     params = {
         "sort": sort,
         "direction": direction,
         "per_page": per_page,
         "page": page
     }
-    
-    if username:
-        url = f"https://api.github.com/users/{username}/starred"
-    else:
-        url = "https://api.github.com/user/starred"
-    
-    response = requests.get(url, headers=headers, params=params)
-    response.raise_for_status()
-    return response.json()
+    return _list_starred(token, username, params)
 
-def list_stargazers(token: str, owner: str, repo: str, per_page: int = 30, page: int = 1) -> List[Dict]:
+@_ttl_lru_cache
+def list_stargazers(token: str, owner: str, repo: str, per_page: int = 100, page: int = 1) -> List[Dict]:
     """
     List users who have starred a repository
     
@@ -133,7 +302,7 @@ def list_stargazers(token: str, owner: str, repo: str, per_page: int = 30, page:
         token: GitHub personal access token
         owner: Repository owner (user or organization)
         repo: Repository name
-        per_page: Results per page (default: 30, max: 100)
+        per_page: Results per page (default: 100, the maximum)
         page: Page number (default: 1)
         
     Returns:
@@ -141,22 +310,9 @@ def list_stargazers(token: str, owner: str, repo: str, per_page: int = 30, page:
         
     Endpoint: GET /repos/{owner}/{repo}/stargazers
     """
-    url = f"https://api.github.com/repos/{owner}/{repo}/stargazers"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
-    
-    params = {
-        "per_page": per_page,
-        "page": page
-    }
-    
-    response = requests.get(url, headers=headers, params=params)
-    response.raise_for_status()
-    return response.json()
+    return _list_stargazers(token, owner, repo, per_page, page)
 
+@_ttl_lru_cache
 def get_starred_count(token: str, owner: str, repo: str) -> int:
     """
     Get the number of stars for a repository
@@ -169,28 +325,36 @@ def get_starred_count(token: str, owner: str, repo: str) -> int:
     Returns:
         Number of stars (stargazers count)
         
-    Endpoint: GET /repos/{owner}/{repo}
+    Endpoints:
+        - HEAD /repos/{owner}/{repo}/stargazers?per_page=1 (count from the Link header)
+        - GET /repos/{owner}/{repo} (fallback for repositories with at most one star)
     """
-    url = f"https://api.github.com/repos/{owner}/{repo}"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
+    session = _get_session(token)
     
-    response = requests.get(url, headers=headers)
+    # With one stargazer per page, the last page number is the star count,
+    # and a HEAD request returns it without downloading any body
+    response = session.head(f"https://api.github.com/repos/{owner}/{repo}/stargazers",
+                            params={"per_page": 1})
     response.raise_for_status()
-    return response.json()["stargazers_count"]
+    match = _LAST_PAGE_RE.search(response.headers.get("Link", ""))
+    if match:
+        return int(match.group(1))
+    
+    # No Link header: a single page, so fall back to the repository itself
+    response = session.get(f"https://api.github.com/repos/{owner}/{repo}")
+    response.raise_for_status()
+    return _loads(response.content)["stargazers_count"]
 
+@_ttl_lru_cache
 def list_repositories_starred_by_user_with_timestamps(token: str, username: Optional[str] = None, 
-                                                     per_page: int = 30, page: int = 1) -> List[Dict]:
+                                                     per_page: int = 100, page: int = 1) -> List[Dict]:
     """
     List repositories starred by a user with star creation timestamps
     
     Args:
         token: GitHub personal access token
         username: GitHub username (if None, lists repositories starred by authenticated user)
-        per_page: Results per page (default: 30, max: 100)
+        per_page: Results per page (default: 100, the maximum)
         page: Page number (default: 1)
         
     Returns:
@@ -202,28 +366,15 @@ def list_repositories_starred_by_user_with_timestamps(token: str, username: Opti
         
     Note: This uses the star application/vnd.github.star+json media type to include timestamps
     """
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.star+json",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
-    
     params = {
         "per_page": per_page,
         "page": page
     }
-    
-    if username:
-        url = f"https://api.github.com/users/{username}/starred"
-    else:
-        url = "https://api.github.com/user/starred"
-    
-    response = requests.get(url, headers=headers, params=params)
-    response.raise_for_status()
-    return response.json()
+    return _list_starred(token, username, params, with_timestamps=True)
 
+@_ttl_lru_cache
 def list_stargazers_with_timestamps(token: str, owner: str, repo: str, 
-                                   per_page: int = 30, page: int = 1) -> List[Dict]:
+                                   per_page: int = 100, page: int = 1) -> List[Dict]:
     """
     List users who have starred a repository with star creation timestamps
     
@@ -231,7 +382,7 @@ def list_stargazers_with_timestamps(token: str, owner: str, repo: str,
         token: GitHub personal access token
         owner: Repository owner (user or organization)
         repo: Repository name
-        per_page: Results per page (default: 30, max: 100)
+        per_page: Results per page (default: 100, the maximum)
         page: Page number (default: 1)
         
     Returns:
@@ -241,21 +392,241 @@ def list_stargazers_with_timestamps(token: str, owner: str, repo: str,
     
     Note: This uses the star application/vnd.github.star+json media type to include timestamps
     """
+    return _list_stargazers(token, owner, repo, per_page, page, with_timestamps=True)
+
+def _next_url(response: requests.Response) -> Optional[str]:
+    """
+    URL of the Link header's rel="next" entry, or None on the last page
+    """
+    for url, rel in _LINK_RE.findall(response.headers.get("Link", "")):
+        if rel == "next":
+            return url
+    return None
+
+def _page_size(offset: int, remaining: int) -> int:
+    """
+    Smallest page size from `remaining` up to 100 that lines up with `offset`
+    
+    Page-number pagination can only start a page at a multiple of its size,
+    so the tail request uses the smallest size at or above what is still
+    needed for which the next item is the first of a page.
+    """
+    for per_page in range(min(remaining, 100), 100):
+        if offset % per_page == 0:
+            return per_page
+    return 100
+
+def _iter_limited(session: requests.Session, url: str, params: Dict[str, Any],
+                  limit: Optional[int]) -> Iterator[Dict]:
+    """
+    Yield up to `limit` items from a listing endpoint, page by page
+    
+    Pages hold 100 items, except that the last request is sized to what is
+    still needed, so no surplus records are downloaded when they can be avoided.
+    """
+    offset = 0
+    while limit is None or offset < limit:
+        per_page = 100 if limit is None else _page_size(offset, limit - offset)
+        response = session.get(url, params={**params, "per_page": per_page,
+                                            "page": offset // per_page + 1})
+        response.raise_for_status()
+        items = _loads(response.content)
+        if limit is not None:
+            items = items[:limit - offset]
+        yield from items
+        offset += len(items)
+        if len(items) < per_page:
+            return
+
+def iter_stargazers(token: str, owner: str, repo: str, limit: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Iterate over users who have starred a repository
+    
+    Args:
+        token: GitHub personal access token
+        owner: Repository owner (user or organization)
+        repo: Repository name
+        limit: Maximum number of users to return (default: all of them)
+        
+    Yields:
+        Users who starred the repository
+        
+    Endpoint: GET /repos/{owner}/{repo}/stargazers
+    """
     url = f"https://api.github.com/repos/{owner}/{repo}/stargazers"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.star+json",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
+    yield from _iter_limited(_get_session(token), url, {}, limit)
+
+def iter_all_stargazers(token: str, owner: str, repo: str) -> Iterator[Dict]:
+    """
+    Iterate over every user who has starred a repository
     
-    params = {
-        "per_page": per_page,
-        "page": page
-    }
+    Follows each response's Link rel="next" URL, 100 users per page, rather
+    than computing page numbers, and stops when there is no next page.
     
-    response = requests.get(url, headers=headers, params=params)
-    response.raise_for_status()
-    return response.json()
+    Args:
+        token: GitHub personal access token
+        owner: Repository owner (user or organization)
+        repo: Repository name
+        
+    Yields:
+        Users who starred the repository
+        
+    Endpoint: GET /repos/{owner}/{repo}/stargazers
+    """
+    session = _get_session(token)
+    url = f"https://api.github.com/repos/{owner}/{repo}/stargazers"
+    params = {"per_page": 100}
+    while url:
+        response = session.get(url, params=params)
+        response.raise_for_status()
+        yield from _loads(response.content)
+        # The next URL already carries per_page and the page cursor
+        url = _next_url(response)
+        params = None
+
+def iter_starred_repositories(token: str, username: Optional[str] = None,
+                              sort: str = "created", direction: str = "desc",
+                              limit: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Iterate over repositories starred by a user
+    
+    Args:
+        token: GitHub personal access token
+        username: GitHub username (if None, lists repositories starred by authenticated user)
+        sort: Sort by "created" (when starred) or "updated" (default: "created")
+        direction: Sort direction, "asc" or "desc" (default: "desc")
+        limit: Maximum number of repositories to return (default: all of them)
+        
+    Yields:
+        Starred repositories
+        
+    Endpoint: 
+        - GET /user/starred (authenticated user)
+        - GET /users/{username}/starred (specific user)
+    """
+    if username:
+        url = f"https://api.github.com/users/{username}/starred"
+    else:
+        url = "https://api.github.com/user/starred"
+    params = {"sort": sort, "direction": direction}
+    yield from _iter_limited(_get_session(token), url, params, limit)
+
+def _rate_limit_wait(response: "aiohttp.ClientResponse", delay: float) -> Optional[float]:
+    """
+    Seconds to wait before retrying a rate-limited response
+    
+    Args:
+        response: Response to inspect
+        delay: Fallback backoff when GitHub does not say how long to wait
+        
+    Returns:
+        Seconds to wait, or None if the response was not rate limited
+    """
+    if response.status not in (403, 429):
+        return None
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        return float(retry_after)
+    reset = response.headers.get("X-RateLimit-Reset")
+    if response.headers.get("X-RateLimit-Remaining") == "0" and reset:
+        return max(0.0, int(reset) - time.time())
+    # A 403 without rate-limit headers is a permission error, not throttling
+    return delay if response.status == 429 else None
+
+async def _get_page(session: "aiohttp.ClientSession", semaphore: asyncio.Semaphore,
+                    url: str, params: Dict[str, Any],
+                    max_retries: int = 5) -> Tuple[List[Dict], Any]:
+    """
+    Fetch one page, backing off on primary and secondary rate limits
+    
+    Returns:
+        Tuple of the page's items and its parsed Link header
+    """
+    delay = 1.0
+    for attempt in range(max_retries + 1):
+        async with semaphore:
+            async with session.get(url, params=params) as response:
+                wait = _rate_limit_wait(response, delay) if attempt < max_retries else None
+                if wait is None:
+                    response.raise_for_status()
+                    return _loads(await response.read()), response.links
+        # Sleep without holding a concurrency slot
+        await asyncio.sleep(wait)
+        delay *= 2
+
+async def _list_all_pages(token: str, url: str, params: Dict[str, Any],
+                          concurrency: int) -> List[Dict]:
+    """
+    Fetch every page of a listing endpoint concurrently
+    
+    Page 1 is fetched first; the page number in its Link rel="last" URL
+    tells how many pages there are, and the rest are fetched at once, at
+    most `concurrency` in flight.
+    """
+    if aiohttp is None:
+        raise ImportError("list_all_* functions require aiohttp (pip install aiohttp)")
+    
+    params = {**params, "per_page": 100}
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit_per_host=concurrency)
+    async with aiohttp.ClientSession(headers=_default_headers(token), connector=connector) as session:
+        items, links = await _get_page(session, semaphore, url, {**params, "page": 1})
+        last = links.get("last")
+        if not last:
+            return items
+        
+        last_page = int(last["url"].query["page"])
+        pages = await asyncio.gather(*[
+            _get_page(session, semaphore, url, {**params, "page": page})
+            for page in range(2, last_page + 1)
+        ])
+    for page_items, _ in pages:
+        items.extend(page_items)
+    return items
+
+async def list_all_stargazers(token: str, owner: str, repo: str, concurrency: int = 64) -> List[Dict]:
+    """
+    List every user who has starred a repository, fetching pages concurrently
+    
+    Args:
+        token: GitHub personal access token
+        owner: Repository owner (user or organization)
+        repo: Repository name
+        concurrency: Maximum number of pages requested at once (default: 64)
+        
+    Returns:
+        List of all users who starred the repository, in page order
+        
+    Endpoint: GET /repos/{owner}/{repo}/stargazers
+    """
+    url = f"https://api.github.com/repos/{owner}/{repo}/stargazers"
+    return await _list_all_pages(token, url, {}, concurrency)
+
+async def list_all_starred_repositories(token: str, username: Optional[str] = None,
+                                        sort: str = "created", direction: str = "desc",
+                                        concurrency: int = 64) -> List[Dict]:
+    """
+    List every repository starred by a user, fetching pages concurrently
+    
+    Args:
+        token: GitHub personal access token
+        username: GitHub username (if None, lists repositories starred by authenticated user)
+        sort: Sort by "created" (when starred) or "updated" (default: "created")
+        direction: Sort direction, "asc" or "desc" (default: "desc")
+        concurrency: Maximum number of pages requested at once (default: 64)
+        
+    Returns:
+        List of all starred repositories, in page order
+        
+    Endpoint: 
+        - GET /user/starred (authenticated user)
+        - GET /users/{username}/starred (specific user)
+    """
+    if username:
+        url = f"https://api.github.com/users/{username}/starred"
+    else:
+        url = "https://api.github.com/user/starred"
+    return await _list_all_pages(token, url, {"sort": sort, "direction": direction}, concurrency)
 
 # Example usage
 def example_stars_usage():